@@ -1,5 +1,5 @@
 from cacheManager import redis_connection
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Tuple, Union
 import os
 import multiprocessing
 import logging
@@ -156,13 +156,15 @@ def update_progress(r, extract_key: str, completion_pct: int = 0, increment_by:
         return completion_pct
 
 
-def unzip_package(filepath: str, output_path: str, filetype: str = None):
+def unzip_package(filepath: str, output_path: str,
+                  filetype: Union[str, Tuple[str, ...]] = None):
     """Unzip a data package from previous extraction.
 
     ARGS:
         filepath: Location of the data package on local disk.
         output_path: Location to put unzipped data from package.
-        filetype: If provided, only unzip files of the type provided.
+        filetype: If provided, only unzip files ending with this suffix,
+            or with any of the suffixes in a tuple.
     """
     with ZipFile(filepath, 'r') as package:
         # Extract all SQLite databases from the zipped package
@@ -172,6 +174,7 @@ def unzip_package(filepath: str, output_path: str, filetype: str = None):
             else:
                 package.extract(item, output_path)
 
+
 @redis_connection()
 def update_status(r, extract_key: str, status) -> int:
     """ updates the stored progress values"""
@@ -29,12 +29,17 @@ for dirname, dirs, dirnames in os.walk(fpath):
 ## END!!! Search for reusable Python libs and connect them via sys.path
 #######################################################################
 
+import abc
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import copy
 from datetime import datetime
 import importlib
 import logging
 import multiprocessing
 import os
 from pprint import pformat
+import re
 import shutil
 import sys
 import threading
@@ -54,10 +59,12 @@ import pyextract
 from pyextract import config
 from pyextract import version
 from pyextract.connect import ABCMessenger
-from pyextract.connect.abap import ABAPMessenger, ABAPInputGenerate
+from pyextract.connect.abap import (ABAPMessenger, ABAPInputGenerate,
+                                    NO_FIL_FILES_MESSAGE, has_fil_files)
 
 import pyextract.utils
-from pyextract.utils import DependencyError, NetworkDisconnectError
+from pyextract.utils import (DependencyError, NetworkDisconnectError,
+                             UploadConfigError)
 import common
 
 # Logging setup for normal and multiprocess loggers
@@ -70,13 +77,116 @@ LOGGER.setLevel(logging.INFO)
 # Global GUI Settings
 FONT_TITLES = wx.Font(12, 74, 90, 92, False, "Arial")
 FONT_BOLD = wx.Font(wx.FontInfo(9).Bold())
+FONT_BOLD_LABEL = wx.Font(wx.FontInfo().Bold())
+
+# Longest name a saved connection may be given
+MAX_CONNECTION_NAME_LENGTH = 200
+
+# Runs of whitespace, collapsed to show each query on a single line
+_WS_RE = re.compile(r'\s+')
+
+# Decoded bundled images, filled on first use (after the wx.App exists)
+_BITMAP_CACHE = {}  # type: Dict[str, wx.Bitmap]
+
+# ERP dialog and the (field, value) defaults it is reset to for each ECF
+# DataServer; integer values are selection indexes of wx.Choice controls
+_ERP_DEFAULTS = {
+    "SAP Application Server": ('sap', (
+        ('client', ''), ('user', ''), ('password', ''), ('language', 'EN'),
+        ('ashost', ''), ('sysnr', ''),
+    )),
+    "Oracle RDBMS": ('oracle', (
+        ('host', ''), ('port', ''), ('orcl_instance_type', 0),
+        ('orcl_instance_value', ''), ('user', ''), ('password', ''),
+    )),
+    "SQL RDBMS": ('mssql', (
+        ('host', ''), ('database', ''),
+    )),
+    "DB2 RDBMS": ('db2', (
+        ('host', ''), ('port', ''), ('database', ''), ('user', ''),
+        ('password', ''),
+    )),
+    "MYSQL RDBMS": ('mysql', (
+        ('host', ''), ('port', ''), ('database', ''), ('user', ''),
+        ('password', ''),
+    )),
+}
+
+# Shared worker pool for background jobs started from the GUI; sized so a
+# long-running extraction never starves ECF parsing or uploads
+_GUI_EXECUTOR = ThreadPoolExecutor(max_workers=max(4, os.cpu_count() or 1))
+
+# Data servers whose content preview reads through a SQL cursor
+_RDBMS_SERVERS = frozenset({
+    "Oracle RDBMS", "SQL RDBMS", "DB2 RDBMS", "MYSQL RDBMS",
+})
+
+# Guide text shared by the host / port / database connection dialogs
+_GUIDE_TEMPLATE = (
+    'Please select an existing connection or enter connection '
+    'details for the selected {erp} instance.\n\n'
+    'Host: Name of host/server\n\n'
+    'Port: Numeric value\n\n'
+    'Database: Database name on server\n\n'
+    'User: User name (optionally with domain prefix)\n\n'
+    'Password: Valid password for user\n\n'
+)
+
+# Guide text for the extraction progress dialog
+_EXTRACT_GUIDE_TEXT = (
+    "To pause the extraction and resume it at a later time, "
+    "click \"Pause\".\n\n"
+    "To resume the paused extraction now, click \"Resume\"  \n\n"
+    "To resume the paused extraction later, click \"Finish\"  \n\n"
+    "When the extraction is complete, you will have the "
+    "ability to transmit the data back to PwC by clicking on "
+    "the \"Upload\" button.  \n\n"
+    "If you wish to defer upload or need to manually transfer "
+    "data back to PwC, simply click on the \"Finish\" button."
+)
+
+# Footer and legal text of the main window
+_VERSION_TEXT = "Extract v{}".format(version.EXTRACT_VERSION)
+_HEADER_TEXT = '- Property of PricewaterhouseCoopers LLP -'
+_DISCLAIMER_TEXT = (
+    "Copyright \u00a9 2017 PricewaterhouseCoopers LLP. All rights reserved. "
+    "PricewaterhouseCoopers LLP refers to the US member firm or "
+    "one of its subsidiaries or affiliates, and may sometimes refer "
+    "to the PwC network. Each member firm is a separate legal "
+    "entity. Please see http://www.pwc.com/structure for details."
+)
+
+# Extract workflow return codes that pick the next dialog on their own:
+# 'Cancel' / 'Finish' (None and 5101 are the top-right 'X' button codes),
+# 'Home', 'Continue ABAP Workflow' and 'Continue Extraction'
+_WORKFLOW_JUMPS = {
+    None: None, 0: None, 2: None, 5101: None,
+    99: 'ecf',
+    9: 'abap',
+    3: 'continue_extract',
+}
+
+# Next dialog for the 'Next' (1) and 'Previous' (-1) return codes, keyed
+# on (return_code, current dialog)
+_WORKFLOW_STEPS = {
+    (1, 'ecf'): 'connection',
+    (1, 'connection'): 'content_preview',
+    (1, 'abap'): 'extraction',
+    (1, 'content_preview'): 'extraction',
+    (-1, 'connection'): 'ecf',
+    (-1, 'content_preview'): 'connection',
+    (-1, 'extraction'): 'content_preview',
+    (-1, 'abap'): 'continue_extract',
+    (-1, 'continue_extract'): None,
+}
 
 # User config settings for entire GUI
 USER_CONFIGS = (
     'working_directory', 'encryption', 'lfu_location', 'sftp_location', 'chunk_size',
     'sap_chunk_size', 'queue_size', 'worker_timeout', 'sap_sdk_folder',
     'oracle_client_folder', 'ibm_dll_folder', 'sftp_port', 'log_level',
-    'sap_batch_size', 'auto_upload', 'max_readers', 'rename_wait'
+    'sap_batch_size', 'auto_upload', 'max_readers', 'rename_wait',
+    'lfu_chunk_size'
 )
 USER_CONFIG_NAMES = {
     'encryption': 'Encryption Type',
@@ -95,7 +205,8 @@ USER_CONFIG_NAMES = {
     'ibm_dll_folder': 'IBM DB2 Driver',
     'auto_upload': 'Auto Upload Enabled',
     'max_readers': 'Max data read threads',
-    'rename_wait': 'Rename wait'
+    'rename_wait': 'Rename wait',
+    'lfu_chunk_size': 'LFU chunk size (MB)'
 }
 USER_CONFIG_CHOICES = {
     'encryption': config.ENCRYPTION_OPTIONS,
@@ -209,7 +320,10 @@ USER_CONFIG_TOOLTIPS = {
         'This option should not be altered from the default unless instructed by Support.  ',
         'Default Setting: 4. '
     ]),
-    'rename_wait': 'Determines how long PwC Extract will wait to rename uploaded files with _Complete suffix.'
+    'rename_wait': 'Determines how long PwC Extract will wait to rename uploaded files with _Complete suffix.',
+    'lfu_chunk_size': 'Size in megabytes of each piece of the data package sent to the Large File Upload (LFU) '
+                      'service.  Larger pieces need fewer requests and upload faster over slow networks.  '
+                      'Default Setting: 8.'
 }
 USER_CONFIG_DEFAULTS = {
     'working_directory': pyextract.utils.local_appdata_path('Data'),
@@ -225,7 +339,8 @@ USER_CONFIG_DEFAULTS = {
     'sap_batch_size': '200',
     'auto_upload': 'No',
     'max_readers': 4,
-    'rename_wait': 2
+    'rename_wait': 2,
+    'lfu_chunk_size': str(config.LFU_CHUNK_SIZE // (1024 * 1024))
 }
 
 
@@ -237,6 +352,9 @@ class ConfigDatabase(object):
                 'DATA_SERVER', 'DATA_CONNECTOR', 'FILE_PATH',
                 'EXTRACTION_PASSWORD')
 
+    # Saved credential names shared by all instances, keyed by (filepath, erp)
+    _credential_names_cache = {}  # type: Dict[tuple, List[str]]
+
     def __init__(self, filepath: str = None):
         """Return a new Config object from a SQLite filepath."""
         self._filepath = None
@@ -403,14 +521,26 @@ class ConfigDatabase(object):
         return bool(data)
 
     def saved_credential_names(self, erp='SAP') -> List[str]:
-        """Return names of saved credentials for an ERP."""
+        """Return names of saved credentials for an ERP.
+
+        Names are cached until credentials for the ERP are saved or
+        deleted, so reopening a dialog does not query the database again.
+        """
         erp = erp.upper()
         assert erp in config.ERPS_TO_CREDENTIALS
-        query = "SELECT NAME FROM {}_CREDENTIALS".format(erp)
-        with sqlite_connection(self.filepath) as cursor:
-            cursor.execute(query)
-            names = [row[0] for row in cursor.fetchall()]
-        return names
+
+        key = (self.filepath, erp)
+        if key not in self._credential_names_cache:
+            query = "SELECT NAME FROM {}_CREDENTIALS".format(erp)
+            with sqlite_connection(self.filepath) as cursor:
+                cursor.execute(query)
+                names = [row[0] for row in cursor.fetchall()]
+            self._credential_names_cache[key] = names
+        return list(self._credential_names_cache[key])
+
+    def _invalidate_credentials(self, erp: str):
+        """Drop cached credential names for an ERP after they change."""
+        self._credential_names_cache.pop((self.filepath, erp.upper()), None)
 
     def get_credentials(self, name: str, erp='SAP') -> Dict[str, str]:
         """Return dict of parameters to values to instantiate a Messenger."""
@@ -462,6 +592,7 @@ class ConfigDatabase(object):
 
         with sqlite_connection(self.filepath) as cursor:
             cursor.execute(statement, args)
+        self._invalidate_credentials(erp)
 
     def delete_credentials(self, name: str, erp='SAP'):
         """Delete saved credentials based on name and ERP."""
@@ -471,6 +602,7 @@ class ConfigDatabase(object):
         args = (name,)
         with sqlite_connection(self.filepath) as cursor:
             cursor.execute(query, args)
+        self._invalidate_credentials(erp)
 
     # Saved User Config Settings
     def does_config_exist(self, name: str) -> bool:
@@ -707,8 +839,7 @@ class GuidePanel(wx.Panel):
         self.sizer = wx.BoxSizer(wx.VERTICAL)
 
         title = wx.StaticText(self, wx.ID_ANY, 'Instructions')
-        title.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92,
-                              False, wx.EmptyString))
+        title.SetFont(FONT_BOLD_LABEL)
         self.sizer.Add(title, 0, wx.ALL|wx.ALIGN_CENTER_HORIZONTAL, 5)
 
         line = wx.StaticLine(self, wx.ID_ANY, wx.DefaultPosition,
@@ -723,6 +854,43 @@ class GuidePanel(wx.Panel):
         self.Layout()
 
 
+class BusyPanel(wx.Panel):
+    """Inline status message with a pulsing gauge, hidden until needed."""
+
+    def __init__(self, parent: wx.Panel):
+        """Return a new, hidden instance of a Busy panel."""
+        super().__init__(parent)
+        sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.gauge = wx.Gauge(self, size=wx.Size(100, 15))
+        sizer.Add(self.gauge, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
+
+        self.text = wx.StaticText(self, wx.ID_ANY, "")
+        sizer.Add(self.text, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
+
+        self.SetSizer(sizer)
+        self.timer = wx.Timer(self)
+        self.Bind(wx.EVT_TIMER, self.pulse, self.timer)
+        self.Hide()
+
+    def pulse(self, event: wx.TimerEvent):
+        """Advance the indeterminate gauge while the panel is shown."""
+        self.gauge.Pulse()
+
+    def show_message(self, text: str):
+        """Show the panel with the given message and start pulsing."""
+        self.text.SetLabel(text)
+        self.gauge.Pulse()
+        self.timer.Start(100)
+        self.Show()
+        self.GetParent().Layout()
+
+    def clear(self):
+        """Stop pulsing and hide the panel."""
+        self.timer.Stop()
+        self.Hide()
+
+
 class MainPanel(wx.Panel):
     """Raised panel with a consistent size that holds primary content."""
     def __init__(self, parent, size=wx.Size(865, 625)):
@@ -882,7 +1050,8 @@ class ConfigsDialog(wx.Dialog):
         controls = ('encryption', 'sftp_location', 'lfu_location', 'chunk_size',
                     'sap_chunk_size', 'queue_size', 'max_readers',
                     'worker_timeout', 'sftp_port',
-                    'log_level', 'sap_batch_size', 'auto_upload', 'rename_wait')
+                    'log_level', 'sap_batch_size', 'auto_upload', 'rename_wait',
+                    'lfu_chunk_size')
         for control in controls:
             label_text = USER_CONFIG_NAMES.get(control, control)
             choices = USER_CONFIG_CHOICES.get(control)
@@ -1371,7 +1540,7 @@ class ECFSelectionDialog(DefaultDialog):
                 label = wx.StaticText(key_value_panel, label=key,
                                       style=wx.ALIGN_RIGHT)
                 label.Wrap(-1)
-                label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
+                label.SetFont(FONT_BOLD_LABEL)
                 label.SetMinSize(wx.Size(150, -1))
 
                 key_value_panel_sizer.Add(label, 0, wx.ALL, 5)
@@ -1414,9 +1583,16 @@ class BaseConnectionDialog(DefaultDialog):
         # Primary attributes
         self.config_db = ConfigDatabase()
         self.controls = {}  # type: Dict[str, wx.Control]
-        self.busy_info = None  # type: wx.BusyInfo
         self.messenger = None  # type: pyextract.connect.ABCMessenger
         self.all_invalid = False # type bool
+        self._branch_panels = {}  # type: Dict[int, wx.Panel]
+        self._branch_controls = {}  # type: Dict[int, Dict[str, wx.Control]]
+        self._initialized = False  # type: bool
+        self._last_loaded_connection = None  # type: str
+        # Saved credentials loaded while this dialog is shown, by (name, erp)
+        self._saved_creds_bulk = {}  # type: Dict[tuple, Dict[str, str]]
+        self._loading = False  # type: bool
+        self._validate_timer = wx.Timer(self)
 
         # Various shared panels + sizers for content organization
         self.content_panel = wx.Panel(self)
@@ -1430,19 +1606,29 @@ class BaseConnectionDialog(DefaultDialog):
                                            label="Save Connection As:")
         self.connection_name = wx.TextCtrl(self.save_conn_panel,
                                            size=wx.Size(200, -1))
+        self.connection_name.SetToolTip(wx.ToolTip(
+            'Connection names must be {} characters or fewer.'
+            .format(MAX_CONNECTION_NAME_LENGTH)
+        ))
         self.save_password = wx.CheckBox(self.save_conn_panel,
                                          label="Save Password?")
 
         # Bind events for connection testing and query validation
         self.Bind(EVT_QUERY_VALIDATE, self.query_validation_done)
         self.Bind(EVT_GETCONNECTION_DONE, self.connection_established)
+        self.Bind(wx.EVT_SHOW, self._on_show)
+        self.Bind(wx.EVT_CLOSE, self.parent.confirm_close_extraction)
+        self.Bind(wx.EVT_TIMER, self.validate_connection_name,
+                  self._validate_timer)
 
     def save_connection_changed(self, event: wx.Event):
         """Action to take when user checks / unchecks 'Save Connection'."""
         if not self.save_connection.GetValue():
             # Not saving connection info, allowed to enter next page
+            # only if all required inputs have been provided
+            self._validate_timer.Stop()
             self.connection_name.Disable()
-            self.next_button.Enable()
+            self.validate_required_controls()
         else:
             # Saving connection info, allow user to choose name to save
             # as, and enable entry to next page if name is entered
@@ -1451,15 +1637,68 @@ class BaseConnectionDialog(DefaultDialog):
 
     def validate_connection_name(self, event: wx.Event):
         """Enable 'Next' button if user-provided connection name is valid."""
-        if self.connection_name.GetValue():
+        name = self.connection_name.GetValue()
+        if name and len(name) <= MAX_CONNECTION_NAME_LENGTH:
             self.next_button.Enable()
         else:
             self.next_button.Disable()
 
+    def connection_name_changed(self, event: wx.CommandEvent):
+        """Disable 'Next' at once for an invalid name; debounce re-enabling."""
+        if not self.save_connection.GetValue():
+            event.Skip()
+            return  # Name is unused, e.g. cleared while resetting the panel
+        name = self.connection_name.GetValue()
+        if name and len(name) <= MAX_CONNECTION_NAME_LENGTH:
+            self._validate_timer.StartOnce(150)
+        else:
+            self._validate_timer.Stop()
+            self.next_button.Disable()
+        event.Skip()
+
+    def ShowModal(self) -> int:
+        """Build any deferred panels, then show the dialog modally."""
+        self.initialize_panels()
+        return super().ShowModal()
+
+    def _build_ui(self):
+        """Build widgets deferred until first show; subclasses may override."""
+
+    def initialize_panels(self):
+        """Build the deferred widgets and panels if not already built."""
+        if self._initialized:
+            return
+        self._initialized = True
+        self.Freeze()
+        try:
+            self._build_ui()
+            self.build_bottom_panel()
+            self.init_middle_panel()
+        finally:
+            self.Thaw()
+        self.Layout()
+
+    def _on_show(self, event: wx.ShowEvent):
+        """Build the deferred panels the first time the dialog is shown."""
+        if event.IsShown():
+            self.initialize_panels()
+        else:
+            # Don't keep credentials (or stale copies) once closed
+            self._saved_creds_bulk = {}
+        event.Skip()
+
     def conn_type_changed(self, event: wx.Event):
         """Rebuild the connection panel whenever connection type is changed."""
+        self._last_loaded_connection = None
         self.init_middle_panel()
 
+    def forget_loaded_connection(self, event: wx.Event = None):
+        """Make the next 'Load Saved Connection' pick reload its values."""
+        if not self._loading:
+            self._last_loaded_connection = None
+        if event is not None:
+            event.Skip()
+
     def cancel_button_pressed(self, event: wx.Event):
         """Return to the Extract home page."""
         self.EndModal(0)
@@ -1468,6 +1707,19 @@ class BaseConnectionDialog(DefaultDialog):
         """Return to the ECF Selection page."""
         self.EndModal(-1)
 
+    def saved_credentials(self, name: str) -> Dict[str, str]:
+        """Return saved credentials by name, reading each from the DB once."""
+        key = (name, self.erp)
+        if key not in self._saved_creds_bulk:
+            self._saved_creds_bulk[key] = \
+                self.config_db.get_credentials(name, self.erp)
+        return dict(self._saved_creds_bulk[key])
+
+    def _populate_saved_connections(self):
+        """Append saved connection names to the 'Load Saved Connection' list."""
+        names = self.config_db.saved_credential_names(self.erp)
+        self.load_previous_choice.AppendItems(names)
+
     def refresh_load_previous(self):
         """Reload the panel with saved credentials available in dropdown."""
         self.load_previous_choice.Clear()
@@ -1476,18 +1728,37 @@ class BaseConnectionDialog(DefaultDialog):
         self.load_previous_choice.AppendItems(saved_connections)
         self.Layout()
 
+    def _set_busy(self, text: str):
+        """Show the inline busy panel with the given message."""
+        self.busy_panel.show_message(text)
+
+    def _clear_busy(self):
+        """Hide the inline busy panel if it is shown."""
+        self.busy_panel.clear()
+
+    def start_connection_test(self, data_server: str, connection_type: str,
+                              connection_args: Dict[str, str]):
+        """Test a connection in a worker thread while the busy panel is shown."""
+        self._set_busy("Testing connection...")
+        self.Disable()
+        thread = GetConnectionThread(self, data_server,
+                                     connection_type, connection_args)
+        # Start from the event loop so the busy panel is painted first
+        wx.CallAfter(thread.start)
+
     def connection_established(self, event: wx.Event):
         """Handle response from attempted connection and update GUI."""
-        self.busy_info = None
         self.Enable()
 
         # If connection failed, notify user and do not continue
         if event.response["status"] == "Error":
+            self._clear_busy()
             wx.MessageBox(event.response['message'],
                           event.response['status'], style=wx.ICON_ERROR)
             return
 
         elif event.response["status"] == "Warning":
+            self._clear_busy()
             wx.MessageBox(event.response['message'],
                           event.response['status'], style=wx.ICON_WARNING)
 
@@ -1499,15 +1770,19 @@ class BaseConnectionDialog(DefaultDialog):
         # Save credentials to local config database if requested
         if self.save_connection.GetValue():
             name = self.connection_name.GetValue()
-            if len(name) > 200:
-                message = 'Connection names must be shorter than 200 characters'
+            if len(name) > MAX_CONNECTION_NAME_LENGTH:
+                self._clear_busy()
+                message = ('Connection names must be {} characters or fewer.'
+                           .format(MAX_CONNECTION_NAME_LENGTH))
                 wx.MessageBox(message, 'Error', style=wx.ICON_ERROR)
                 return
+            # Saving may prompt the user to overwrite an existing connection
+            self._clear_busy()
             self._save_connection_values(name, kwargs)
             self.refresh_load_previous()
 
         # Validate queries in this ECF in a separate thread
-        self.busy_info = wx.BusyInfo("Validating queries in ECF...")
+        self._set_busy("Validating queries in ECF...")
         thread = ValidateQueriesThread(
             parent=self,
             ecf_meta_data=self.parent.ecf_meta_data,
@@ -1519,7 +1794,7 @@ class BaseConnectionDialog(DefaultDialog):
 
     def query_validation_done(self, event: wx.Event):
         """Handle response from query validation thread."""
-        self.busy_info = None
+        self._clear_busy()
 
         # If query validation failed, notify user and do not continue
         if event.response["status"] != "success":
@@ -1569,18 +1844,67 @@ class BaseConnectionDialog(DefaultDialog):
                 return  # Do not save credentials to database at all
             else:
                 self.config_db.delete_credentials(name, erp=self.erp)
+                self._saved_creds_bulk = {}
 
         self.config_db.save_credentials(name, kwargs, erp=self.erp,
                                         save_password=save_password)
+        self._saved_creds_bulk = {}
+        self._last_loaded_connection = None
 
-    def add_user_input(self, parent: wx.Panel, sizer: wx.Sizer,
-                       attr: str, label: str):
-        """Add a user input Panel to another panel on this connection dialog."""
+    def _make_user_input(self, parent: wx.Panel, attr: str,
+                         label: str) -> UserInputPanel:
+        """Return a new user input Panel, registering its Control by attr."""
         tooltip = USER_CONFIG_TOOLTIPS.get(attr)
         panel = UserInputPanel(parent, label_text=label, tooltip_text=tooltip)
         # Add an control to this object for direct access to panel's Control
         self.controls[attr] = panel.control
-        sizer.Add(panel, 0, wx.EXPAND|wx.ALL, 5)
+        return panel
+
+    def add_user_inputs_batch(self, parent: wx.Panel, sizer: wx.Sizer,
+                              attrs_labels: tuple):
+        """Add many (attr, label) user inputs to a panel in a single pass."""
+        parent.Freeze()
+        try:
+            items = []
+            for attr, label in attrs_labels:
+                panel = self._make_user_input(parent, attr, label)
+                items.append((panel, 0, wx.EXPAND|wx.ALL, 5))
+            sizer.AddMany(items)
+        finally:
+            parent.Thaw()
+
+    def show_branch_panel(self, index: int,
+                          builder: Callable[[wx.Panel], None]) -> bool:
+        """Show the middle panel for a connection type, hiding all others.
+
+        Each panel is built by `builder` the first time its connection
+        type is selected, then kept and re-shown on later selections.
+        Inputs shared with the previously shown panel carry their values
+        over, as if the same control had been kept on screen.
+        Return True if the panel was built by this call.
+        """
+        previous = self.controls
+        built = index not in self._branch_panels
+        if built:
+            if not self.middle_panel.GetSizer():
+                self.middle_panel.SetSizer(wx.BoxSizer(wx.VERTICAL))
+            self.controls = {}
+            panel = wx.Panel(self.middle_panel)
+            builder(panel)
+            self.middle_panel.GetSizer().Add(panel, 1, wx.EXPAND)
+            self._branch_panels[index] = panel
+            self._branch_controls[index] = self.controls
+
+        for key, panel in self._branch_panels.items():
+            panel.Show(key == index)
+        self.controls = self._branch_controls[index]
+
+        if previous is not self.controls:
+            for key in previous.keys() & self.controls.keys():
+                value = _get_wx_control_value(previous[key])
+                _set_wx_control_value(self.controls[key], value)
+
+        return built
 
     def reset_control_listeners(self):
         """Reset the event listeners for all wx.Controls on this panel."""
@@ -1590,13 +1914,31 @@ class BaseConnectionDialog(DefaultDialog):
                 continue  # control has been deleted
             control.Bind(wx.EVT_KEY_UP, self.validate_required_controls)
             control.Bind(wx.EVT_FILEPICKER_CHANGED, self.validate_required_controls)
+            # Any edit means the fields no longer match the loaded connection
+            control.Bind(wx.EVT_TEXT, self.forget_loaded_connection)
+            control.Bind(wx.EVT_CHOICE, self.forget_loaded_connection)
+            control.Bind(wx.EVT_FILEPICKER_CHANGED, self.forget_loaded_connection)
+
 
+    @contextmanager
+    def loading_saved_values(self):
+        """Load saved values with a single repaint and validation pass."""
+        self._loading = True
+        self.Freeze()
+        try:
+            yield
+        finally:
+            self._loading = False
+            self.Thaw()
+        self.validate_required_controls()
 
     def validate_required_controls(self, event: wx.Event=None):
         """Validate that all required user inputs on this panel have values.
         If all required controls have values, enable 'Next' button.
         If any required controls do not have values, disable 'Next' button.
         """
+        if self._loading:
+            return  # Validated once, after all saved values are loaded
 
         if isinstance(self.required_user_inputs, list):
             required = self.required_user_inputs
@@ -1632,68 +1974,23 @@ class BaseConnectionDialog(DefaultDialog):
             control_sizer.Add(control, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
 
         self.save_conn_panel.SetSizer(control_sizer)
-        self.save_conn_panel.Layout()
-
         control_sizer.Fit(self.save_conn_panel)
         panel_sizer.Add(self.save_conn_panel, 0, wx.ALL|wx.ALIGN_RIGHT, 5)
 
         self.bottom_panel.SetSizer(panel_sizer)
-        self.bottom_panel.Layout()
-
         panel_sizer.Fit(self.bottom_panel)
 
+    def _build_connection_dialog(self, title: str, choices: List[str],
+                                 guide_content: str):
+        """Build the widgets shared by every connection dialog.
 
-class SAPConnectionDialog(BaseConnectionDialog):
-    """Connection dialog window for connecting to SAP."""
-
-    erp = 'SAP'
-    required_submodules = ['connect.sap', 'streams.sapstream']
-    conntypes_to_controls = {
-        'Direct Connection': (
-            'client', 'language', 'user', 'password', 'ashost', 'sysnr'
-        ),
-        'Load Balanced Connection': (
-            'client', 'user', 'password', 'language', 'mshost', 'msserv', 'sysid', 'group'
-        ),
-        'Direct Connection w/SNC': (
-            'client', 'language', 'user', 'password', 'ashost', 'sysnr',
-            'snc_qop', 'snc_myname', 'snc_partnername', 'snc_lib'
-        ),
-        'Load Balanced w/SNC': (
-            'client', 'user', 'password', 'language', 'mshost', 'msserv', 'sysid', 'group',
-            'snc_qop', 'snc_myname', 'snc_partnername', 'snc_lib'
-        ),
-    }
-
-    required_user_inputs = {
-        'Direct Connection': (
-            'client', 'language', 'user', 'password', 'ashost', 'sysnr'
-        ),
-        'Load Balanced Connection': (
-            'client', 'user', 'password', 'language', 'mshost', 'sysid', 'group'
-        ),
-        'Direct Connection w/SNC': (
-            'client', 'language', 'user', 'password', 'ashost', 'sysnr',
-            'snc_qop', 'snc_myname', 'snc_partnername', 'snc_lib'
-        ),
-        'Load Balanced w/SNC': (
-            'client', 'user', 'password', 'language', 'mshost', 'sysid', 'group',
-            'snc_qop', 'snc_myname', 'snc_partnername', 'snc_lib'
-        ),
-    }
-    # required_user_inputs = ['client', 'user', 'password', 'language',
-    #                         'ashost', 'sysnr', 'mshost',
-    #                         'sysid', 'group', 'snc_qop', 'snc_myname',
-    #                         'snc_partnername', 'language', 'snc_lib',
-    #                         'abap_folder', 'abap_filename']
-
-    def __init__(self, *args, **kwargs):
-        """Return a new instance of the dialog window."""
-        super().__init__(*args, **kwargs)
-
-        title = wx.StaticText(self, label="SAP Connection")
-        title.SetFont(FONT_TITLES)
-        self.sizer.Add(title, 0, wx.EXPAND|wx.ALL, 10)
+        Creates the title, the 'Connection Type' and 'Load Saved Connection'
+        choices, an empty middle panel, the bottom panel, the guide panel,
+        and the nav buttons, then connects their events.
+        """
+        title_label = wx.StaticText(self, label=title)
+        title_label.SetFont(FONT_TITLES)
+        self.sizer.Add(title_label, 0, wx.EXPAND|wx.ALL, 10)
 
         line = wx.StaticLine(self)
         self.sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
@@ -1710,24 +2007,15 @@ class SAPConnectionDialog(BaseConnectionDialog):
 
         conntype_label = wx.StaticText(conntype_panel, label="Connection Type:")
         conntype_label.Wrap(-1)
-        conntype_label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
+        conntype_label.SetFont(FONT_BOLD_LABEL)
 
         conntype_sizer.Add(conntype_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
 
-        choices = [
-            'Direct Connection',
-            'Load Balanced Connection',
-            'Direct Connection w/SNC',
-            'Load Balanced w/SNC',
-            'PWC-XTRACT (ABAP)'
-        ]
-        self.connection_type_choice = wx.Choice(conntype_panel,
-                                                choices=choices)
+        self.connection_type_choice = wx.Choice(conntype_panel, choices=choices)
         self.connection_type_choice.SetSelection(0)
         conntype_sizer.Add(self.connection_type_choice, 0, wx.ALL, 5)
 
         conntype_panel.SetSizer(conntype_sizer)
-        conntype_panel.Layout()
         conntype_sizer.Fit(conntype_panel)
         top_panel_sizer.Add(conntype_panel, 1, wx.EXPAND|wx.ALL, 5)
 
@@ -1737,25 +2025,21 @@ class SAPConnectionDialog(BaseConnectionDialog):
         load_label = wx.StaticText(load_prev_panel,
                                    label='Load Saved Connection:')
         load_label.Wrap(-1)
-        load_label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
+        load_label.SetFont(FONT_BOLD_LABEL)
 
         load_prev_sizer.Add(load_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
 
-        # Load Previous
-        saved_connections = [""]
-        saved_connections += self.config_db.saved_credential_names(self.erp)
-        self.load_previous_choice = wx.Choice(load_prev_panel,
-                                              choices=saved_connections)
+        # Load Previous (saved names are filled in once the event loop is idle)
+        self.load_previous_choice = wx.Choice(load_prev_panel, choices=[""])
         self.load_previous_choice.SetSelection(0)
+        wx.CallAfter(self._populate_saved_connections)
         load_prev_sizer.Add(self.load_previous_choice, 1, wx.ALL, 5)
 
         load_prev_panel.SetSizer(load_prev_sizer)
-        load_prev_panel.Layout()
         load_prev_sizer.Fit(load_prev_panel)
         top_panel_sizer.Add(load_prev_panel, 1, wx.EXPAND|wx.ALL, 5)
 
         self.top_panel.SetSizer(top_panel_sizer)
-        self.top_panel.Layout()
         top_panel_sizer.Fit(self.top_panel)
         main_panel_sizer.Add(self.top_panel, 0, wx.EXPAND|wx.ALL, 5)
 
@@ -1768,35 +2052,43 @@ class SAPConnectionDialog(BaseConnectionDialog):
         line = wx.StaticLine(self.main_panel)
         main_panel_sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
 
-        self.build_bottom_panel()
+        # Bottom panel contents are built on first show
         main_panel_sizer.Add(self.bottom_panel, 0, wx.EXPAND|wx.ALL, 5)
 
         self.main_panel.SetSizer(main_panel_sizer)
-        self.main_panel.Layout()
         content_panel_sizer.Add(self.main_panel, 1, wx.EXPAND|wx.RIGHT, 5)
 
-        content = (
-            'Please select an existing connection or enter connection '
-            'details for the SAP instance to extract data from.\n\n'
-            'To connect with a Secure Network Connection (SNC), please '
-            'select the "Direct Connection w/SNC" option to display '
-            'additional required fields.\n\n'
-            'If using an SNC on a load balanced server, please select the '
-            '"Load Balanced Connection" option instead.\n\n'
-            'To perform a manual data extraction using the PwC ABAP tool, '
-            'select the "PWC-XTRACT (ABAP)" option, and follow the '
-            'instructions provided on that page.'
-        )
-        guidepanel = GuidePanel(parent=self.content_panel, content=content)
+        guidepanel = GuidePanel(parent=self.content_panel, content=guide_content)
         content_panel_sizer.Add(guidepanel, 1, wx.EXPAND|wx.LEFT, 5)
 
         self.content_panel.SetSizer(content_panel_sizer)
-        self.content_panel.Layout()
         content_panel_sizer.Fit(self.content_panel)
         self.sizer.Add(self.content_panel, 1, wx.EXPAND|wx.ALL, 5)
 
+        nav_panel = self._build_nav_panel()
+        self.sizer.Add(nav_panel, 0, wx.EXPAND|wx.ALL, 5)
+
+        self.SetSizer(self.sizer)
+        self.Layout()
+        self.Centre(wx.BOTH)
+
+        # Connect Events
+        self.connection_type_choice.Bind(wx.EVT_CHOICE, self.conn_type_changed)
+        self.load_previous_choice.Bind(wx.EVT_CHOICE, self.load_previous_selected)
+        self.cancel_button.Bind(wx.EVT_BUTTON, self.cancel_button_pressed)
+        self.previous_button.Bind(wx.EVT_BUTTON, self.previous_button_pressed)
+        self.next_button.Bind(wx.EVT_BUTTON, self.next_button_pressed)
+        self.save_connection.Bind(wx.EVT_CHECKBOX, self.save_connection_changed)
+        self.connection_name.Bind(wx.EVT_TEXT, self.connection_name_changed)
+
+    def _build_nav_panel(self) -> wx.Panel:
+        """Build the Cancel / Previous / Next button panel for this dialog."""
         nav_panel = wx.Panel(self)
-        nav_sizer = wx.BoxSizer(wx.VERTICAL)
+        nav_sizer = wx.BoxSizer(wx.HORIZONTAL)
+
+        self.busy_panel = BusyPanel(nav_panel)
+        nav_sizer.Add(self.busy_panel, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
+        nav_sizer.AddStretchSpacer()
 
         button_panel = wx.Panel(nav_panel)
         button_sizer = wx.BoxSizer(wx.HORIZONTAL)
@@ -1811,31 +2103,121 @@ class SAPConnectionDialog(BaseConnectionDialog):
         button_sizer.Add(self.next_button, 0, wx.ALL, 5)
 
         button_panel.SetSizer(button_sizer)
-        button_panel.Layout()
         button_sizer.Fit(button_panel)
-        nav_sizer.Add(button_panel, 0, wx.ALL|wx.ALIGN_RIGHT, 5)
+        nav_sizer.Add(button_panel, 0, wx.ALL, 5)
 
         nav_panel.SetSizer(nav_sizer)
-        nav_panel.Layout()
         nav_sizer.Fit(nav_panel)
-        self.sizer.Add(nav_panel, 0, wx.EXPAND|wx.ALL, 5)
 
-        self.SetSizer(self.sizer)
-        self.Layout()
-        self.Centre(wx.BOTH)
+        return nav_panel
 
-        # Initialize the middle panel for the first time
-        self.init_middle_panel()
 
-        # Connect Events
-        self.connection_type_choice.Bind(wx.EVT_CHOICE, self.conn_type_changed)
-        self.load_previous_choice.Bind(wx.EVT_CHOICE, self.load_previous_selected)
-        self.cancel_button.Bind(wx.EVT_BUTTON, self.cancel_button_pressed)
-        self.previous_button.Bind(wx.EVT_BUTTON, self.previous_button_pressed)
-        self.next_button.Bind(wx.EVT_BUTTON, self.next_button_pressed)
-        self.save_connection.Bind(wx.EVT_CHECKBOX, self.save_connection_changed)
-        self.connection_name.Bind(wx.EVT_KEY_UP, self.validate_connection_name)
-        self.Bind(wx.EVT_CLOSE, self.parent.confirm_close_extraction)
+class SAPConnectionDialog(BaseConnectionDialog):
+    """Connection dialog window for connecting to SAP."""
+
+    erp = 'SAP'
+    required_submodules = ['connect.sap', 'streams.sapstream']
+    conntypes_to_controls = {
+        'Direct Connection': (
+            'client', 'language', 'user', 'password', 'ashost', 'sysnr'
+        ),
+        'Load Balanced Connection': (
+            'client', 'user', 'password', 'language', 'mshost', 'msserv', 'sysid', 'group'
+        ),
+        'Direct Connection w/SNC': (
+            'client', 'language', 'user', 'password', 'ashost', 'sysnr',
+            'snc_qop', 'snc_myname', 'snc_partnername', 'snc_lib'
+        ),
+        'Load Balanced w/SNC': (
+            'client', 'user', 'password', 'language', 'mshost', 'msserv', 'sysid', 'group',
+            'snc_qop', 'snc_myname', 'snc_partnername', 'snc_lib'
+        ),
+    }
+
+    required_user_inputs = {
+        'Direct Connection': (
+            'client', 'language', 'user', 'password', 'ashost', 'sysnr'
+        ),
+        'Load Balanced Connection': (
+            'client', 'user', 'password', 'language', 'mshost', 'sysid', 'group'
+        ),
+        'Direct Connection w/SNC': (
+            'client', 'language', 'user', 'password', 'ashost', 'sysnr',
+            'snc_qop', 'snc_myname', 'snc_partnername', 'snc_lib'
+        ),
+        'Load Balanced w/SNC': (
+            'client', 'user', 'password', 'language', 'mshost', 'sysid', 'group',
+            'snc_qop', 'snc_myname', 'snc_partnername', 'snc_lib'
+        ),
+    }
+
+    # (attr, label) pairs of UserInputs shown for each connection type
+    logon_inputs = (
+        ('client', 'Client*'),
+        ('user', 'User*'),
+        ('password', 'Password*'),
+        ('language', 'Language*'),
+    )
+    snc_logon_inputs = (
+        ('client', 'Client*'),
+        ('language', 'Language*'),
+    )
+    direct_inputs = (
+        ('ashost', 'App Server*'),
+        ('sysnr', 'System Number*'),
+    )
+    load_balanced_inputs = (
+        ('mshost', 'Message Server*'),
+        ('msserv', 'MS Service'),
+        ('sysid', 'System ID*'),
+        ('group', 'Group/Server*'),
+    )
+    snc_inputs = (
+        ('snc_qop', 'SNC QoP*'),
+        ('snc_myname', 'SNC Name*'),
+        ('snc_partnername', 'SNC Partner Name*'),
+    )
+    # required_user_inputs = ['client', 'user', 'password', 'language',
+    #                         'ashost', 'sysnr', 'mshost',
+    #                         'sysid', 'group', 'snc_qop', 'snc_myname',
+    #                         'snc_partnername', 'language', 'snc_lib',
+    #                         'abap_folder', 'abap_filename']
+
+    def __init__(self, *args, **kwargs):
+        """Return a new instance of the dialog window."""
+        super().__init__(*args, **kwargs)
+
+        choices = [
+            'Direct Connection',
+            'Load Balanced Connection',
+            'Direct Connection w/SNC',
+            'Load Balanced w/SNC',
+            'PWC-XTRACT (ABAP)'
+        ]
+
+        content = (
+            'Please select an existing connection or enter connection '
+            'details for the SAP instance to extract data from.\n\n'
+            'To connect with a Secure Network Connection (SNC), please '
+            'select the "Direct Connection w/SNC" option to display '
+            'additional required fields.\n\n'
+            'If using an SNC on a load balanced server, please select the '
+            '"Load Balanced Connection" option instead.\n\n'
+            'To perform a manual data extraction using the PwC ABAP tool, '
+            'select the "PWC-XTRACT (ABAP)" option, and follow the '
+            'instructions provided on that page.'
+        )
+
+        self._build_connection_dialog("SAP Connection", choices, content)
+
+        # Middle panel builders, keyed by index of connection_type_choice
+        self._builders = {
+            0: self._build_direct,
+            1: self._build_load_balanced,
+            2: self._build_direct_snc,
+            3: self._build_load_balanced_snc,
+            4: self._build_abap,
+        }  # type: Dict[int, Callable[[wx.Panel], None]]
 
     def load_previous_selected(self, event: wx.Event):
         """Load saved connection data from user config DB into this panel."""
@@ -1843,38 +2225,40 @@ class SAPConnectionDialog(BaseConnectionDialog):
         if connection_name == "":
             return  # No connection selected to reload
 
-        saved_creds = self.config_db.get_credentials(connection_name, self.erp)
-
-        self.connection_type_choice.SetStringSelection(saved_creds['type'])
-        self.init_middle_panel()
+        saved_creds = self.saved_credentials(connection_name)
 
-        for key in self.conntypes_to_controls[saved_creds['type']]:
-            value = saved_creds.get(key) or ''
-            _set_wx_control_value(self.controls[key], value)
+        with self.loading_saved_values():
+            self.connection_type_choice.SetStringSelection(saved_creds['type'])
+            self.init_middle_panel()
 
-        self.Layout()
-        self.validate_required_controls()
+            for key in self.conntypes_to_controls[saved_creds['type']]:
+                if key not in self.controls:
+                    continue  # Input is not shown for this connection type
+                value = saved_creds.get(key) or ''
+                _set_wx_control_value(self.controls[key], value)
 
     def next_button_pressed(self, event: wx.Event):
-
         """Based on connection type selected by user, go to next dialog."""
         connection_type = self.connection_type_choice.GetStringSelection()
+        if connection_type == 'PWC-XTRACT (ABAP)':
+            # ABAP relabels this button 'Finish' (_enable_abap_fields)
+            self.finish_button_pressed(event)
+            return
         if connection_type == "SAP HANA":
             wx.MessageBox('SAP HANA connection is not currently supported',
                           'Error', style=wx.ICON_ERROR)
             return
 
         # Generate connection kwargs based on connection type
-        connection_args = {}
-        for key in self.conntypes_to_controls[connection_type]:
-            connection_args[key] = _get_wx_control_value(self.controls[key])
+        connection_args = {
+            key: _get_wx_control_value(self.controls[key])
+            for key in self.conntypes_to_controls[connection_type]
+            if key in self.controls
+        }
 
-        # Create SAPMessenger while a busy info box is shown
-        self.busy_info = wx.BusyInfo("Testing connection...")
-        self.Disable()
-        thread = GetConnectionThread(self, "SAP Application Server",
-                                     connection_type, connection_args)
-        thread.start()
+        # Create messenger while busy message is shown to user
+        self.start_connection_test("SAP Application Server", connection_type,
+                                   connection_args)
 
     def save_abap_input_file(self, event: wx.Event):
         """Action that occurs when user clicks the 'Save ECF' button."""
@@ -1934,526 +2318,242 @@ class SAPConnectionDialog(BaseConnectionDialog):
         self.EndModal(2)
 
     def init_middle_panel(self):
-        """Instantiate components of the middle panel for this window."""
-        # "PwC Xtract (ABAP)"
-        if self.connection_type_choice.GetCurrentSelection() == 4:
-
-            self.middle_panel.DestroyChildren()
-
-            middle_panel_sizer = wx.BoxSizer(wx.VERTICAL)
-
-            abap_info = (
-                "The PwC-XTRACT program is an Advanced Business Application "
-                "Programming (\"ABAP\") report, which extracts "
-                "SAP-System-Resident (not archived) SAP tables in output "
-                "files on the SAP application server.\n\n"
-                "In order to specify which data should be extracted, "
-                "an input file specifying the list of tables and fields "
-                "and conditions must be provided.  Select a folder and file "
-                "name, then click the \"Save\" button to create this input "
-                "file based on the selected ECF.\n\n"
-                "The PwC-XTRACT program must be executed manually using the "
-                "input file generated.  After completion, the output files "
-                "will need to be transferred using FTP from the SAP application server onto "
-                "the local system where PwC Extract is installed.\n\n"
-                "Note: The PwC-XTRACT ABAP report does not support internal "
-                "SAP tables, raw strings, references, or structures.'"
-            )
-            infotext = wx.StaticText(self.middle_panel, label=abap_info,
-                                     size=wx.Size(-1, 175))
-            infotext.Wrap(-1)
-            infotext.SetMinSize(wx.Size(-1, 175))
-            infotext.SetMaxSize(wx.Size(-1, 175))
-            middle_panel_sizer.Add(infotext, 0, wx.ALL|wx.EXPAND, 5)
-
-            folder_panel = wx.Panel(self.middle_panel)
-            folder_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-            folder_label = StaticLabel(folder_panel, text="Select Folder")
-            folder_sizer.Add(folder_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
-
-            self.controls['abap_folder'] = wx.DirPickerCtrl(folder_panel, message="Select a folder")
-            self.controls['abap_folder'].SetBackgroundColour(wx.Colour(255, 255, 255))
-            folder_sizer.Add(self.controls['abap_folder'], 1, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
-
-            folder_panel.SetSizer(folder_sizer)
-            folder_panel.Layout()
-            folder_sizer.Fit(folder_panel)
-            middle_panel_sizer.Add(folder_panel, 0, wx.EXPAND|wx.ALL, 5)
-
-            filename_panel = wx.Panel(self.middle_panel)
-            filename_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-            filename_label = StaticLabel(filename_panel, text="File Name")
-            filename_sizer.Add(filename_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
-
-            self.controls['abap_filename'] = wx.TextCtrl(filename_panel, size=wx.Size(275, -1))
-            self.controls['abap_filename'].SetMinSize(wx.Size(275, -1))
-            self.controls['abap_filename'].SetMaxSize(wx.Size(275, -1))
-            filename_sizer.Add(self.controls['abap_filename'], 0, wx.ALL, 5)
-
-            filetype_label = wx.StaticText(filename_panel, label=".csv")
-            filetype_label.Wrap(-1)
-            filename_sizer.Add(filetype_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
-
-            filename_panel.SetSizer(filename_sizer)
-            filename_panel.Layout()
-            filename_sizer.Fit(filename_panel)
-            middle_panel_sizer.Add(filename_panel, 0, wx.EXPAND|wx.ALL, 5)
-
-            save_panel = wx.Panel(self.middle_panel)
-            save_sizer = wx.BoxSizer(wx.VERTICAL)
-
-            self.save_abap_button = wx.Button(save_panel, label="Save")
-            save_sizer.Add(self.save_abap_button, 0, wx.ALL, 5)
-
-            save_panel.SetSizer(save_sizer)
-            save_panel.Layout()
-            save_sizer.Fit(save_panel)
-            middle_panel_sizer.Add(save_panel, 0, wx.ALL|wx.ALIGN_RIGHT, 5)
-
-            self.save_abap_button.Bind(wx.EVT_BUTTON, self.save_abap_input_file)
-            self.middle_panel.SetSizer(middle_panel_sizer)
-            self.middle_panel.Layout()
-
-            self.next_button.SetLabelText("Finish")
-            self.next_button.Bind(wx.EVT_BUTTON, self.finish_button_pressed)
-
-            # Disable connection saving and loading inputs for ABAP
-            self.load_previous_choice.Disable()
-            self.save_connection.SetValue(False)
-            self.save_connection.Disable()
-            self.connection_name.SetValue("")
-            self.connection_name.Disable()
-            self.save_password.Disable()
+        """Show the middle panel for the selected connection type."""
+        selection = self.connection_type_choice.GetCurrentSelection()
 
-        else:
-
-            self.middle_panel.DestroyChildren()
-
-            # Middle panel is made up of two columns of UserInputs
-            middle_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
-            self.left_panel = wx.Panel(self.middle_panel)
-            self.right_panel = wx.Panel(self.middle_panel)
-            left_sizer = wx.BoxSizer(wx.VERTICAL)
-            right_sizer = wx.BoxSizer(wx.VERTICAL)
-
-            # Direct Connection
-            if self.connection_type_choice.GetCurrentSelection() in [0]:
+        # Freeze so the switch of panels is painted once, not per control
+        self.Freeze()
+        try:
+            built = self.show_branch_panel(selection, self._builders[selection])
+            if selection == 4:
+                self._enable_abap_fields()
+            else:
+                self._enable_non_abap_connection_fields()
+        finally:
+            self.Thaw()
 
-                # Left Panel
-                attrs_labels = (
-                    ('client', 'Client*'),
-                    ('user', 'User*'),
-                    ('password', 'Password*'),
-                    ('language', 'Language*'),
-                )
-                for attr, label in attrs_labels:
-                    self.add_user_input(self.left_panel, left_sizer, attr, label)
-
-                self.left_panel.SetSizer(left_sizer)
-                self.left_panel.Layout()
-                left_sizer.Fit(self.left_panel)
-                middle_panel_sizer.Add(self.left_panel, 1, wx.EXPAND | wx.ALL, 5)
-
-                # Right Panel
-                attrs_labels = (
-                    ('ashost', 'App Server*'),
-                    ('sysnr', 'System Number*'),
-                )
-                for attr, label in attrs_labels:
-                    self.add_user_input(self.right_panel, right_sizer, attr, label)
-
-                # Common
-                self.right_panel.SetSizer(right_sizer)
-                self.right_panel.Layout()
-                right_sizer.Fit(self.right_panel)
-                middle_panel_sizer.Add(self.right_panel, 1, wx.EXPAND | wx.ALL, 5)
-
-                self.middle_panel.SetSizer(middle_panel_sizer)
-                self.middle_panel.Layout()
-                middle_panel_sizer.Fit(self.middle_panel)
-
-                self.next_button.SetLabelText("Next")
-                self.next_button.Bind(wx.EVT_BUTTON, self.next_button_pressed)
-
-                # Enable connection saving and loading inputs for non-ABAP
-                self.load_previous_choice.Enable()
-                self.save_connection.SetValue(False)
-                self.save_connection.Enable()
-                self.connection_name.SetValue("")
-                self.connection_name.Enable()
-                self.save_password.Enable()
-
-            # Load Balanced Connection
-            elif self.connection_type_choice.GetCurrentSelection() in [1]:
-
-                # Left Panel
-                attrs_labels = (
-                    ('client', 'Client*'),
-                    ('user', 'User*'),
-                    ('password', 'Password*'),
-                    ('language', 'Language*'),
-                )
-                for attr, label in attrs_labels:
-                    self.add_user_input(self.left_panel, left_sizer, attr, label)
-
-                self.left_panel.SetSizer(left_sizer)
-                self.left_panel.Layout()
-                left_sizer.Fit(self.left_panel)
-                middle_panel_sizer.Add(self.left_panel, 1, wx.EXPAND | wx.ALL, 5)
-
-                # Right Panel
-                attrs_labels = (
-                    ('mshost', 'Message Server*'),
-                    ('msserv', 'MS Service'),
-                    ('sysid', 'System ID*'),
-                    ('group', 'Group/Server*'),
-                )
-                for attr, label in attrs_labels:
-                    self.add_user_input(self.right_panel, right_sizer, attr, label)
-
-                # Common
-                self.right_panel.SetSizer(right_sizer)
-                self.right_panel.Layout()
-                right_sizer.Fit(self.right_panel)
-                middle_panel_sizer.Add(self.right_panel, 1, wx.EXPAND | wx.ALL, 5)
-
-                self.middle_panel.SetSizer(middle_panel_sizer)
-                self.middle_panel.Layout()
-                middle_panel_sizer.Fit(self.middle_panel)
-
-                self.next_button.SetLabelText("Next")
-                self.next_button.Bind(wx.EVT_BUTTON, self.next_button_pressed)
-
-                # Enable connection saving and loading inputs for non-ABAP
-                self.load_previous_choice.Enable()
-                self.save_connection.SetValue(False)
-                self.save_connection.Enable()
-                self.connection_name.SetValue("")
-                self.connection_name.Enable()
-                self.save_password.Enable()
-
-            # Direct Connection w/SNC
-            elif self.connection_type_choice.GetCurrentSelection() in [2]:
-
-                attrs_labels = (
-                    ('client', 'Client*'),
-                    ('language', 'Language*'),
-                    ('ashost', 'App Server*'),
-                    ('sysnr', 'System Number*'),
-                )
-                for attr, label in attrs_labels:
-                    self.add_user_input(self.left_panel, left_sizer, attr, label)
-
-                self.left_panel.SetSizer(left_sizer)
-                self.left_panel.Layout()
-                left_sizer.Fit(self.left_panel)
-                middle_panel_sizer.Add(self.left_panel, 1, wx.EXPAND | wx.ALL, 5)
-
-                # Right Panel
-                attrs_labels = (
-                    ('snc_qop', 'SNC QoP*'),
-                    ('snc_myname', 'SNC Name*'),
-                    ('snc_partnername', 'SNC Partner Name*'),
-                )
-                for attr, label in attrs_labels:
-                    self.add_user_input(self.right_panel, right_sizer, attr, label)
-
-                # SNC LIB
-                self.snc_lib_panel = wx.Panel(self.right_panel)
-                snc_lib_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-                snc_lib_label = wx.StaticText(self.snc_lib_panel,
-                                              label="SNC Lib*:",
-                                              size=wx.Size(100, -1))
-                snc_lib_label.Wrap(-1)
-                snc_lib_sizer.Add(snc_lib_label, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
-
-                self.controls['snc_lib'] = wx.FilePickerCtrl(self.snc_lib_panel,
-                                                             message="Select a file:",
-                                                             wildcard="*.*")
-                self.controls['snc_lib'].SetBackgroundColour(wx.Colour(255, 255, 255))
-                snc_lib_sizer.Add(self.controls['snc_lib'], 1, wx.ALL, 5)
-
-                self.snc_lib_panel.SetSizer(snc_lib_sizer)
-                self.snc_lib_panel.Layout()
-                snc_lib_sizer.Fit(self.snc_lib_panel)
-                right_sizer.Add(self.snc_lib_panel, 0, wx.EXPAND | wx.ALL, 5)
-
-                # Common
-                self.right_panel.SetSizer(right_sizer)
-                self.right_panel.Layout()
-                right_sizer.Fit(self.right_panel)
-                middle_panel_sizer.Add(self.right_panel, 1, wx.EXPAND | wx.ALL, 5)
-
-                self.middle_panel.SetSizer(middle_panel_sizer)
-                self.middle_panel.Layout()
-                middle_panel_sizer.Fit(self.middle_panel)
-
-                self.next_button.SetLabelText("Next")
-                self.next_button.Bind(wx.EVT_BUTTON, self.next_button_pressed)
-
-                # Enable connection saving and loading inputs for non-ABAP
-                self.load_previous_choice.Enable()
-                self.save_connection.SetValue(False)
-                self.save_connection.Enable()
-                self.connection_name.SetValue("")
-                self.connection_name.Enable()
-                self.save_password.Enable()
-
-            # Load Balanced w/SNC
-            elif self.connection_type_choice.GetCurrentSelection() in [3]:
-
-                attrs_labels = (
-                    ('client', 'Client*'),
-                    ('user', 'User*'),
-                    ('password', 'Password*'),
-                    ('language', 'Language*'),
-                    ('mshost', 'Message Server*'),
-                    ('msserv', 'MS Service'),
-                    ('sysid', 'System ID*'),
-                    ('group', 'Group/Server*'),
-                )
-                for attr, label in attrs_labels:
-                    self.add_user_input(self.left_panel, left_sizer, attr, label)
-
-                self.left_panel.SetSizer(left_sizer)
-                self.left_panel.Layout()
-                left_sizer.Fit(self.left_panel)
-                middle_panel_sizer.Add(self.left_panel, 1, wx.EXPAND | wx.ALL, 5)
-
-                # Right Panel
-                attrs_labels = (
-                    ('snc_qop', 'SNC QoP*'),
-                    ('snc_myname', 'SNC Name*'),
-                    ('snc_partnername', 'SNC Partner Name*'),
-                )
-                for attr, label in attrs_labels:
-                    self.add_user_input(self.right_panel, right_sizer, attr, label)
-
-                # SNC LIB
-                self.snc_lib_panel = wx.Panel(self.right_panel)
-                snc_lib_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-                snc_lib_label = wx.StaticText(self.snc_lib_panel,
-                                              label="SNC Lib*:",
-                                              size=wx.Size(100, -1))
-                snc_lib_label.Wrap(-1)
-                snc_lib_sizer.Add(snc_lib_label, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
-
-                self.controls['snc_lib'] = wx.FilePickerCtrl(self.snc_lib_panel,
-                                                             message="Select a file:",
-                                                             wildcard="*.*")
-                self.controls['snc_lib'].SetBackgroundColour(wx.Colour(255, 255, 255))
-                snc_lib_sizer.Add(self.controls['snc_lib'], 1, wx.ALL, 5)
-
-                self.snc_lib_panel.SetSizer(snc_lib_sizer)
-                self.snc_lib_panel.Layout()
-                snc_lib_sizer.Fit(self.snc_lib_panel)
-                right_sizer.Add(self.snc_lib_panel, 0, wx.EXPAND | wx.ALL, 5)
-
-                # Common
-                self.right_panel.SetSizer(right_sizer)
-                self.right_panel.Layout()
-                right_sizer.Fit(self.right_panel)
-                middle_panel_sizer.Add(self.right_panel, 1, wx.EXPAND | wx.ALL, 5)
-
-                self.middle_panel.SetSizer(middle_panel_sizer)
-                self.middle_panel.Layout()
-                middle_panel_sizer.Fit(self.middle_panel)
-
-                self.next_button.SetLabelText("Next")
-                self.next_button.Bind(wx.EVT_BUTTON, self.next_button_pressed)
-
-                # Enable connection saving and loading inputs for non-ABAP
-                self.load_previous_choice.Enable()
-                self.save_connection.SetValue(False)
-                self.save_connection.Enable()
-                self.connection_name.SetValue("")
-                self.connection_name.Enable()
-                self.save_password.Enable()
+        # Only the middle panel's contents changed; lay out just that panel
+        self.middle_panel.Layout()
+        if built:
+            self.reset_control_listeners()
+        else:
+            self.validate_required_controls()
+
+    def _enable_non_abap_connection_fields(self):
+        """Use 'Next' to test the connection and allow saving / loading it."""
+        self.next_button.SetLabelText("Next")
+
+        # Enable connection saving and loading inputs for non-ABAP
+        self.load_previous_choice.Enable()
+        self.save_connection.SetValue(False)
+        self.save_connection.Enable()
+        self.connection_name.SetValue("")
+        self.connection_name.Enable()
+        self.save_password.Enable()
+
+    def _enable_abap_fields(self):
+        """Use 'Finish' to end the workflow and disable saving / loading."""
+        self.next_button.SetLabelText("Finish")
+
+        # Disable connection saving and loading inputs for ABAP
+        self.load_previous_choice.Disable()
+        self.save_connection.SetValue(False)
+        self.save_connection.Disable()
+        self.connection_name.SetValue("")
+        self.connection_name.Disable()
+        self.save_password.Disable()
+
+    def _build_direct(self, panel: wx.Panel):
+        """Build the middle panel for a Direct Connection."""
+        self._build_sap_middle(panel, self.logon_inputs, self.direct_inputs)
+
+    def _build_load_balanced(self, panel: wx.Panel):
+        """Build the middle panel for a Load Balanced Connection."""
+        self._build_sap_middle(panel, self.logon_inputs,
+                               self.load_balanced_inputs)
+
+    def _build_direct_snc(self, panel: wx.Panel):
+        """Build the middle panel for a Direct Connection w/SNC."""
+        self._build_sap_middle(panel, self.snc_logon_inputs + self.direct_inputs,
+                               self.snc_inputs, include_snc_lib=True)
+
+    def _build_load_balanced_snc(self, panel: wx.Panel):
+        """Build the middle panel for a Load Balanced w/SNC connection."""
+        self._build_sap_middle(panel, self.logon_inputs + self.load_balanced_inputs,
+                               self.snc_inputs, include_snc_lib=True)
+
+    def _build_sap_middle(self, panel: wx.Panel, left_fields: tuple,
+                          right_fields: tuple, include_snc_lib=False):
+        """Build two columns of (attr, label) UserInputs into a panel."""
+        panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        left_panel = wx.Panel(panel)
+        right_panel = wx.Panel(panel)
+        left_sizer = wx.BoxSizer(wx.VERTICAL)
+        right_sizer = wx.BoxSizer(wx.VERTICAL)
 
+        self.add_user_inputs_batch(left_panel, left_sizer, left_fields)
+        left_panel.SetSizer(left_sizer)
+        panel_sizer.Add(left_panel, 1, wx.EXPAND | wx.ALL, 5)
 
-        self.Layout()
-        self.reset_control_listeners()
+        self.add_user_inputs_batch(right_panel, right_sizer, right_fields)
+        if include_snc_lib:
+            snc_lib_panel = self._build_snc_lib_panel(right_panel)
+            right_sizer.Add(snc_lib_panel, 0, wx.EXPAND | wx.ALL, 5)
+        right_panel.SetSizer(right_sizer)
+        panel_sizer.Add(right_panel, 1, wx.EXPAND | wx.ALL, 5)
 
+        panel.SetSizer(panel_sizer)
 
-class OracleConnectionDialog(BaseConnectionDialog):
-    """Connection dialog window for connecting to ORACLE."""
+    def _build_snc_lib_panel(self, parent: wx.Panel) -> wx.Panel:
+        """Return a panel with a file picker for the SNC Lib."""
+        snc_lib_panel = wx.Panel(parent)
+        snc_lib_sizer = wx.BoxSizer(wx.HORIZONTAL)
 
-    erp = 'ORACLE'
-    required_submodules = ['connect.oracle']
-    required_user_inputs = ['client', 'user', 'password', 'language']
+        snc_lib_label = wx.StaticText(snc_lib_panel,
+                                      label="SNC Lib*:",
+                                      size=wx.Size(100, -1))
+        snc_lib_label.Wrap(-1)
+        snc_lib_sizer.Add(snc_lib_label, 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
 
-    def __init__(self, *args, **kwargs):
-        """Return a new instance of the dialog window."""
-        super().__init__(*args, **kwargs)
+        self.controls['snc_lib'] = wx.FilePickerCtrl(snc_lib_panel,
+                                                     message="Select a file:",
+                                                     wildcard="*.*")
+        self.controls['snc_lib'].SetBackgroundColour(wx.Colour(255, 255, 255))
+        snc_lib_sizer.Add(self.controls['snc_lib'], 1, wx.ALL, 5)
 
-        title = wx.StaticText(self, label="Oracle Connection")
-        title.SetFont(FONT_TITLES)
-        self.sizer.Add(title, 0, wx.EXPAND|wx.ALL, 10)
+        snc_lib_panel.SetSizer(snc_lib_sizer)
+        return snc_lib_panel
 
-        line = wx.StaticLine(self)
-        self.sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
+    def _build_abap(self, panel: wx.Panel):
+        """Build the middle panel for a PWC-XTRACT (ABAP) extraction."""
+        panel_sizer = wx.BoxSizer(wx.VERTICAL)
 
-        content_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        main_panel_sizer = wx.BoxSizer(wx.VERTICAL)
+        abap_info = (
+            "The PwC-XTRACT program is an Advanced Business Application "
+            "Programming (\"ABAP\") report, which extracts "
+            "SAP-System-Resident (not archived) SAP tables in output "
+            "files on the SAP application server.\n\n"
+            "In order to specify which data should be extracted, "
+            "an input file specifying the list of tables and fields "
+            "and conditions must be provided.  Select a folder and file "
+            "name, then click the \"Save\" button to create this input "
+            "file based on the selected ECF.\n\n"
+            "The PwC-XTRACT program must be executed manually using the "
+            "input file generated.  After completion, the output files "
+            "will need to be transferred using FTP from the SAP application server onto "
+            "the local system where PwC Extract is installed.\n\n"
+            "Note: The PwC-XTRACT ABAP report does not support internal "
+            "SAP tables, raw strings, references, or structures.'"
+        )
+        infotext = wx.StaticText(panel, label=abap_info,
+                                 size=wx.Size(-1, 175))
+        infotext.Wrap(-1)
+        infotext.SetMinSize(wx.Size(-1, 175))
+        infotext.SetMaxSize(wx.Size(-1, 175))
+        panel_sizer.Add(infotext, 0, wx.ALL|wx.EXPAND, 5)
+
+        folder_panel = wx.Panel(panel)
+        folder_sizer = wx.BoxSizer(wx.HORIZONTAL)
 
-        self.top_panel = wx.Panel(self.main_panel)
-        top_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        folder_label = StaticLabel(folder_panel, text="Select Folder")
+        folder_sizer.Add(folder_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
 
-        # Connection Type
-        conntype_panel = wx.Panel(self.top_panel)
-        conntype_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        self.controls['abap_folder'] = wx.DirPickerCtrl(folder_panel, message="Select a folder")
+        self.controls['abap_folder'].SetBackgroundColour(wx.Colour(255, 255, 255))
+        folder_sizer.Add(self.controls['abap_folder'], 1, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
 
-        conntype_label = wx.StaticText(conntype_panel, label="Connection Type:")
-        conntype_label.Wrap(-1)
-        conntype_label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
+        folder_panel.SetSizer(folder_sizer)
+        panel_sizer.Add(folder_panel, 0, wx.EXPAND|wx.ALL, 5)
 
-        conntype_sizer.Add(conntype_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
+        filename_panel = wx.Panel(panel)
+        filename_sizer = wx.BoxSizer(wx.HORIZONTAL)
 
-        choices = ["Oracle Server Authentication"]
-        self.connection_type_choice = wx.Choice(conntype_panel,
-                                                choices=choices)
-        self.connection_type_choice.SetSelection(0)
-        conntype_sizer.Add(self.connection_type_choice, 0, wx.ALL, 5)
+        filename_label = StaticLabel(filename_panel, text="File Name")
+        filename_sizer.Add(filename_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
 
-        conntype_panel.SetSizer(conntype_sizer)
-        conntype_panel.Layout()
-        conntype_sizer.Fit(conntype_panel)
-        top_panel_sizer.Add(conntype_panel, 1, wx.EXPAND|wx.ALL, 5)
+        self.controls['abap_filename'] = wx.TextCtrl(filename_panel, size=wx.Size(275, -1))
+        self.controls['abap_filename'].SetMinSize(wx.Size(275, -1))
+        self.controls['abap_filename'].SetMaxSize(wx.Size(275, -1))
+        filename_sizer.Add(self.controls['abap_filename'], 0, wx.ALL, 5)
 
-        load_prev_panel = wx.Panel(self.top_panel)
-        load_prev_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        filetype_label = wx.StaticText(filename_panel, label=".csv")
+        filetype_label.Wrap(-1)
+        filename_sizer.Add(filetype_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
 
-        load_label = wx.StaticText(load_prev_panel,
-                                   label='Load Saved Connection:')
-        load_label.Wrap(-1)
-        load_label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
+        filename_panel.SetSizer(filename_sizer)
+        panel_sizer.Add(filename_panel, 0, wx.EXPAND|wx.ALL, 5)
 
-        load_prev_sizer.Add(load_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
+        save_panel = wx.Panel(panel)
+        save_sizer = wx.BoxSizer(wx.VERTICAL)
 
-        # Load Previous
-        saved_connections = [""]
-        saved_connections += self.config_db.saved_credential_names(self.erp)
-        self.load_previous_choice = wx.Choice(load_prev_panel,
-                                              choices=saved_connections)
-        self.load_previous_choice.SetSelection(0)
-        load_prev_sizer.Add(self.load_previous_choice, 1, wx.ALL, 5)
+        self.save_abap_button = wx.Button(save_panel, label="Save")
+        save_sizer.Add(self.save_abap_button, 0, wx.ALL, 5)
 
-        load_prev_panel.SetSizer(load_prev_sizer)
-        load_prev_panel.Layout()
-        load_prev_sizer.Fit(load_prev_panel)
-        top_panel_sizer.Add(load_prev_panel, 1, wx.EXPAND|wx.ALL, 5)
+        save_panel.SetSizer(save_sizer)
+        panel_sizer.Add(save_panel, 0, wx.ALL|wx.ALIGN_RIGHT, 5)
 
-        self.top_panel.SetSizer(top_panel_sizer)
-        self.top_panel.Layout()
-        top_panel_sizer.Fit(self.top_panel)
-        main_panel_sizer.Add(self.top_panel, 0, wx.EXPAND|wx.ALL, 5)
+        self.save_abap_button.Bind(wx.EVT_BUTTON, self.save_abap_input_file)
+        panel.SetSizer(panel_sizer)
 
-        line = wx.StaticLine(self.main_panel)
-        main_panel_sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
 
-        self.middle_panel = wx.Panel(self.main_panel)
-        main_panel_sizer.Add(self.middle_panel, 1, wx.EXPAND|wx.ALL, 5)
+class OracleConnectionDialog(BaseConnectionDialog):
+    """Connection dialog window for connecting to ORACLE."""
 
-        line = wx.StaticLine(self.main_panel)
-        main_panel_sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
+    erp = 'ORACLE'
+    required_submodules = ['connect.oracle']
+    required_user_inputs = ['client', 'user', 'password', 'language']
+    conntypes_to_controls = {
+        'Oracle Server Authentication': ('host', 'port', 'user', 'password'),
+    }
 
-        self.build_bottom_panel()
-        main_panel_sizer.Add(self.bottom_panel, 0, wx.EXPAND|wx.ALL, 5)
+    def __init__(self, *args, **kwargs):
+        """Return a new instance of the dialog window."""
+        super().__init__(*args, **kwargs)
 
-        self.main_panel.SetSizer(main_panel_sizer)
-        self.main_panel.Layout()
-        content_panel_sizer.Add(self.main_panel, 1, wx.EXPAND|wx.RIGHT, 5)
+        choices = ["Oracle Server Authentication"]
 
         content = (
             'Please select an existing connection or enter the '
             'connection details.'
         )
-        guidepanel = GuidePanel(parent=self.content_panel, content=content)
-        content_panel_sizer.Add(guidepanel, 1, wx.EXPAND|wx.LEFT, 5)
-
-        self.content_panel.SetSizer(content_panel_sizer)
-        self.content_panel.Layout()
-        content_panel_sizer.Fit(self.content_panel)
-        self.sizer.Add(self.content_panel, 1, wx.EXPAND|wx.ALL, 5)
-
-        nav_panel = wx.Panel(self)
-        nav_sizer = wx.BoxSizer(wx.VERTICAL)
-
-        button_panel = wx.Panel(nav_panel)
-        button_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-        self.cancel_button = wx.Button(button_panel, label="Cancel")
-        button_sizer.Add(self.cancel_button, 0, wx.ALL, 5)
-
-        self.previous_button = wx.Button(button_panel, label="Previous")
-        button_sizer.Add(self.previous_button, 0, wx.ALL, 5)
-
-        self.next_button = wx.Button(button_panel, label="Next")
-        button_sizer.Add(self.next_button, 0, wx.ALL, 5)
-
-        button_panel.SetSizer(button_sizer)
-        button_panel.Layout()
-        button_sizer.Fit(button_panel)
-        nav_sizer.Add(button_panel, 0, wx.ALL|wx.ALIGN_RIGHT, 5)
-
-        nav_panel.SetSizer(nav_sizer)
-        nav_panel.Layout()
-        nav_sizer.Fit(nav_panel)
-        self.sizer.Add(nav_panel, 0, wx.EXPAND|wx.ALL, 5)
-
-        self.SetSizer(self.sizer)
-        self.Layout()
-        self.Centre(wx.BOTH)
-
-        # Initialize the middle panel for the first time
-        self.init_middle_panel()
 
-        # Connect Events
-        self.connection_type_choice.Bind(wx.EVT_CHOICE, self.conn_type_changed)
-        self.load_previous_choice.Bind(wx.EVT_CHOICE, self.load_previous_selected)
-        self.cancel_button.Bind(wx.EVT_BUTTON, self.cancel_button_pressed)
-        self.previous_button.Bind(wx.EVT_BUTTON, self.previous_button_pressed)
-        self.next_button.Bind(wx.EVT_BUTTON, self.next_button_pressed)
-        self.save_connection.Bind(wx.EVT_CHECKBOX, self.save_connection_changed)
-        self.connection_name.Bind(wx.EVT_KEY_UP, self.validate_connection_name)
-        self.Bind(wx.EVT_CLOSE, self.parent.confirm_close_extraction)
+        self._build_connection_dialog("Oracle Connection", choices, content)
 
     def load_previous_selected(self, event: wx.Event):
         """Load saved connection data from user config DB into this panel."""
         connection_name = self.load_previous_choice.GetStringSelection()
         if connection_name == "":
             return  # No connection selected to reload
+        if connection_name == self._last_loaded_connection:
+            return  # Connection is already loaded into this panel
+        self._last_loaded_connection = connection_name
 
-        saved_creds = self.config_db.get_credentials(connection_name, self.erp)
-
-        self.init_middle_panel()
+        saved_creds = self.saved_credentials(connection_name)
 
-        if saved_creds["system_id"]:
-            self.controls['orcl_instance_type'].SetStringSelection("System ID")
-            self.controls['orcl_instance_value'].SetValue(saved_creds["system_id"])
-        else:
-            self.controls['orcl_instance_type'].SetStringSelection("Service Name")
-            self.controls['orcl_instance_value'].SetValue(saved_creds["service_name"])
+        with self.loading_saved_values():
+            self.init_middle_panel()
 
-        self.connection_type_choice.SetStringSelection(saved_creds["type"])
+            if saved_creds["system_id"]:
+                self.controls['orcl_instance_type'].SetStringSelection("System ID")
+                self.controls['orcl_instance_value'].ChangeValue(saved_creds["system_id"])
+            else:
+                self.controls['orcl_instance_type'].SetStringSelection("Service Name")
+                self.controls['orcl_instance_value'].ChangeValue(saved_creds["service_name"])
 
-        for key in ('host', 'port', 'user', 'password'):
-            value = saved_creds.get(key) or ''
-            _set_wx_control_value(self.controls[key], value)
+            self.connection_type_choice.SetStringSelection(saved_creds["type"])
 
-        self.Layout()
-        self.validate_required_controls()
+            for key in self.conntypes_to_controls[saved_creds["type"]]:
+                value = saved_creds.get(key) or ''
+                _set_wx_control_value(self.controls[key], value)
 
     def next_button_pressed(self, event: wx.Event):
         """Save credentials if requested, then test the connection."""
         # Generate connection kwargs for Threaded test
-        connection_args = {}
-        for key in ('host', 'port', 'user', 'password'):
-            connection_args[key] = _get_wx_control_value(self.controls[key])
+        connection_type = self.connection_type_choice.GetStringSelection()
+        connection_args = {
+            key: _get_wx_control_value(self.controls[key])
+            for key in self.conntypes_to_controls[connection_type]
+        }
 
         if self.controls['orcl_instance_type'].GetStringSelection() == "System ID":
             connection_args["system_id"] = self.controls['orcl_instance_value'].GetValue()
@@ -2461,22 +2561,31 @@ class OracleConnectionDialog(BaseConnectionDialog):
             connection_args["service_name"] = self.controls['orcl_instance_value'].GetValue()
 
         # Create messenger while busy message is shown to user
-        self.busy_info = wx.BusyInfo("Testing connection...")
-        self.Disable()
-
-        connection_type = self.connection_type_choice.GetStringSelection()
-        thread = GetConnectionThread(self, "Oracle RDBMS",
-                                     connection_type, connection_args)
-        thread.start()
+        self.start_connection_test("Oracle RDBMS", connection_type,
+                                   connection_args)
 
     def init_middle_panel(self):
-        """Instantiate components of the middle panel for this window."""
-        self.middle_panel.DestroyChildren()
+        """Show the middle panel, building it the first time it is needed."""
+        selection = self.connection_type_choice.GetCurrentSelection()
+        self.Freeze()
+        try:
+            built = self.show_branch_panel(selection, self._build_middle_panel)
+        finally:
+            self.Thaw()
+
+        self.middle_panel.Layout()
+
+        if built:
+            self.reset_control_listeners()
+        else:
+            self.validate_required_controls()
 
-        # Middle panel is made up of two columns of UserInputs
-        middle_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        self.left_panel = wx.Panel(self.middle_panel)
-        self.right_panel = wx.Panel(self.middle_panel)
+    def _build_middle_panel(self, panel: wx.Panel):
+        """Build the Oracle connection inputs into a panel."""
+        # Panel is made up of two columns of UserInputs
+        panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        left_panel = wx.Panel(panel)
+        right_panel = wx.Panel(panel)
         left_sizer = wx.BoxSizer(wx.VERTICAL)
         right_sizer = wx.BoxSizer(wx.VERTICAL)
 
@@ -2485,11 +2594,10 @@ class OracleConnectionDialog(BaseConnectionDialog):
             ('host', 'Host Name*'),
             ('port', 'Port Number*'),
         )
-        for attr, label in attrs_labels:
-            self.add_user_input(self.left_panel, left_sizer, attr, label)
+        self.add_user_inputs_batch(left_panel, left_sizer, attrs_labels)
 
         # Add Instance Type Choice Dropdown to left panel
-        instance_panel = wx.Panel(self.left_panel)
+        instance_panel = wx.Panel(left_panel)
         instance_sizer = wx.BoxSizer(wx.HORIZONTAL)
 
         instance_label = wx.StaticText(instance_panel, label="Instance*:",
@@ -2503,43 +2611,30 @@ class OracleConnectionDialog(BaseConnectionDialog):
         instance_sizer.Add(self.controls['orcl_instance_type'], 1, wx.ALL, 5)
 
         instance_panel.SetSizer(instance_sizer)
-        instance_panel.Layout()
-        instance_sizer.Fit(instance_panel)
         left_sizer.Add(instance_panel, 0, wx.EXPAND|wx.ALL, 5)
 
         # Add Instance Type Value to left panel
-        value_panel = UserInputPanel(self.left_panel, label_text='Value*',
+        value_panel = UserInputPanel(left_panel, label_text='Value*',
                                      tooltip_text=' or '.join(choices))
         self.controls['orcl_instance_value'] = value_panel.control
         left_sizer.Add(value_panel, 0, wx.EXPAND|wx.ALL, 5)
 
         # Finish left-side panel items
-        self.left_panel.SetSizer(left_sizer)
-        self.left_panel.Layout()
-        left_sizer.Fit(self.left_panel)
-        middle_panel_sizer.Add(self.left_panel, 1, wx.EXPAND|wx.ALL, 5)
+        left_panel.SetSizer(left_sizer)
+        panel_sizer.Add(left_panel, 1, wx.EXPAND|wx.ALL, 5)
 
         # Add Username / Password inputs to the right-side panel
         attrs_labels = (
             ('user', 'User*'),
             ('password', 'Password*'),
         )
-        for attr, label in attrs_labels:
-            self.add_user_input(self.right_panel, right_sizer, attr, label)
-
-        # Wrap-up right-side and entire middle panel layouts
-        self.right_panel.SetSizer(right_sizer)
-        self.right_panel.Layout()
-        right_sizer.Fit(self.right_panel)
-        middle_panel_sizer.Add(self.right_panel, 1, wx.EXPAND|wx.ALL, 5)
+        self.add_user_inputs_batch(right_panel, right_sizer, attrs_labels)
 
-        self.middle_panel.SetSizer(middle_panel_sizer)
-        self.middle_panel.Layout()
-        middle_panel_sizer.Fit(self.middle_panel)
-
-        self.Layout()
+        # Wrap-up right-side and entire panel layouts
+        right_panel.SetSizer(right_sizer)
+        panel_sizer.Add(right_panel, 1, wx.EXPAND|wx.ALL, 5)
 
-        self.reset_control_listeners()
+        panel.SetSizer(panel_sizer)
 
 
 class MSSQLConnectionDialog(BaseConnectionDialog):
@@ -2548,211 +2643,100 @@ class MSSQLConnectionDialog(BaseConnectionDialog):
     erp = 'MSSQL'
     required_submodules = ['connect.mssql']
     required_user_inputs = ['host', 'database', 'user', 'password']
+    conntypes_to_controls = {
+        'Windows Authentication': (
+            'host', 'port', 'schema', 'database', 'driver',
+        ),
+        'SQL Server Authentication': (
+            'host', 'port', 'schema', 'database', 'driver', 'user', 'password',
+        ),
+    }
 
     def __init__(self, *args, **kwargs):
         """Return a new dialog window."""
         super().__init__(*args, **kwargs)
 
-        title = wx.StaticText(self, label='SQL Server Connection')
-        title.SetFont(FONT_TITLES)
-        self.sizer.Add(title, 0, wx.EXPAND|wx.ALL, 10)
+        choices = ["Windows Authentication", "SQL Server Authentication"]
 
-        line = wx.StaticLine(self)
-        self.sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
+        content = (
+            'Please select an existing connection or enter the connection '
+            'details for the selected SQL Server instance.\n\n'
+            'Select "Windows Authentication" to use the credentials '
+            'of the user currently logged in.  Otherwise, enter user '
+            'name and password using "SQL Server Authentication."'
+        )
 
-        content_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        main_panel_sizer = wx.BoxSizer(wx.VERTICAL)
+        self._build_connection_dialog('SQL Server Connection', choices, content)
 
-        self.top_panel = wx.Panel(self.main_panel)
-        top_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
+    def load_previous_selected(self, event: wx.Event):
+        """Load saved connection data from user config DB into this panel."""
+        connection_name = self.load_previous_choice.GetStringSelection()
+        if connection_name == "":
+            return  # No connection selected to reload
+        if connection_name == self._last_loaded_connection:
+            return  # Connection is already loaded into this panel
+        self._last_loaded_connection = connection_name
 
-        # Connection Type
-        conntype_panel = wx.Panel(self.top_panel)
-        conntype_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        saved_creds = self.saved_credentials(connection_name)
 
-        conntype_label = wx.StaticText(conntype_panel, label="Connection Type:")
-        conntype_label.Wrap(-1)
-        conntype_label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
+        connection_type = saved_creds["type"]
 
-        conntype_sizer.Add(conntype_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
+        with self.loading_saved_values():
+            self.connection_type_choice.SetStringSelection(connection_type)
+            self.init_middle_panel()
 
-        choices = ["Windows Authentication", "SQL Server Authentication"]
-        self.connection_type_choice = wx.Choice(conntype_panel,
-                                                choices=choices)
-        self.connection_type_choice.SetSelection(0)
-        conntype_sizer.Add(self.connection_type_choice, 0, wx.ALL, 5)
+            for key in self.conntypes_to_controls[connection_type]:
+                value = saved_creds.get(key) or ''
+                _set_wx_control_value(self.controls[key], value)
 
-        conntype_panel.SetSizer(conntype_sizer)
-        conntype_panel.Layout()
-        conntype_sizer.Fit(conntype_panel)
-        top_panel_sizer.Add(conntype_panel, 1, wx.EXPAND|wx.ALL, 5)
+    def next_button_pressed(self, event: wx.Event):
+        """When user clicks 'Next' button on SQL server connection screen"""
+        # Determine which args to use for connection test
+        connection_type = self.connection_type_choice.GetStringSelection()
 
-        load_prev_panel = wx.Panel(self.top_panel)
-        load_prev_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        # Gather connection kwargs for Threaded test
+        connection_args = {
+            key: _get_wx_control_value(self.controls[key])
+            for key in self.conntypes_to_controls[connection_type]
+        }
 
-        load_label = wx.StaticText(load_prev_panel,
-                                   label='Load Saved Connection:')
-        load_label.Wrap(-1)
-        load_label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
+        # Raise an error if the port value is non-numeric
+        port = connection_args['port']
+        if port and not port.isnumeric():
+            message = 'Port must be a number (received "{}")'.format(port)
+            wx.MessageBox(message, 'Error', style=wx.ICON_ERROR)
+            return
 
-        load_prev_sizer.Add(load_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
+        # Get MSSQL Driver
+        if connection_args['driver'] == '':
+            connection_args['driver'] = 'SQL Server'
 
-        # Load Previous
-        saved_connections = [""]
-        saved_connections += self.config_db.saved_credential_names(self.erp)
-        self.load_previous_choice = wx.Choice(load_prev_panel,
-                                              choices=saved_connections)
-        self.load_previous_choice.SetSelection(0)
-        load_prev_sizer.Add(self.load_previous_choice, 1, wx.ALL, 5)
+        # Create messenger while busy message is shown to user
+        self.start_connection_test("MSSQL RDBMS", connection_type,
+                                   connection_args)
 
-        load_prev_panel.SetSizer(load_prev_sizer)
-        load_prev_panel.Layout()
-        load_prev_sizer.Fit(load_prev_panel)
-        top_panel_sizer.Add(load_prev_panel, 1, wx.EXPAND|wx.ALL, 5)
+    def init_middle_panel(self):
+        """Show the middle panel, building it the first time it is needed."""
+        selection = self.connection_type_choice.GetCurrentSelection()
+        self.Freeze()
+        try:
+            built = self.show_branch_panel(selection, self._build_middle_panel)
+        finally:
+            self.Thaw()
 
-        self.top_panel.SetSizer(top_panel_sizer)
-        self.top_panel.Layout()
-        top_panel_sizer.Fit(self.top_panel)
-        main_panel_sizer.Add(self.top_panel, 0, wx.EXPAND|wx.ALL, 5)
+        self.middle_panel.Layout()
 
-        line = wx.StaticLine(self.main_panel)
-        main_panel_sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
-
-        self.middle_panel = wx.Panel(self.main_panel)
-        main_panel_sizer.Add(self.middle_panel, 1, wx.EXPAND|wx.ALL, 5)
-
-        line = wx.StaticLine(self.main_panel)
-        main_panel_sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
-
-        self.build_bottom_panel()
-        main_panel_sizer.Add(self.bottom_panel, 0, wx.EXPAND|wx.ALL, 5)
-
-        self.main_panel.SetSizer(main_panel_sizer)
-        self.main_panel.Layout()
-        content_panel_sizer.Add(self.main_panel, 1, wx.EXPAND|wx.RIGHT, 5)
-
-        content = (
-            'Please select an existing connection or enter the connection '
-            'details for the selected SQL Server instance.\n\n'
-            'Select "Windows Authentication" to use the credentials '
-            'of the user currently logged in.  Otherwise, enter user '
-            'name and password using "SQL Server Authentication."'
-        )
-        guidepanel = GuidePanel(parent=self.content_panel, content=content)
-        content_panel_sizer.Add(guidepanel, 1, wx.EXPAND|wx.LEFT, 5)
-
-        self.content_panel.SetSizer(content_panel_sizer)
-        self.content_panel.Layout()
-        content_panel_sizer.Fit(self.content_panel)
-        self.sizer.Add(self.content_panel, 1, wx.EXPAND|wx.ALL, 5)
-
-        nav_panel = wx.Panel(self)
-        nav_sizer = wx.BoxSizer(wx.VERTICAL)
-
-        button_panel = wx.Panel(nav_panel)
-        button_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-        self.cancel_button = wx.Button(button_panel, label="Cancel")
-        button_sizer.Add(self.cancel_button, 0, wx.ALL, 5)
-
-        self.previous_button = wx.Button(button_panel, label="Previous")
-        button_sizer.Add(self.previous_button, 0, wx.ALL, 5)
-
-        self.next_button = wx.Button(button_panel, label="Next")
-        button_sizer.Add(self.next_button, 0, wx.ALL, 5)
-
-        button_panel.SetSizer(button_sizer)
-        button_panel.Layout()
-        button_sizer.Fit(button_panel)
-        nav_sizer.Add(button_panel, 0, wx.ALL|wx.ALIGN_RIGHT, 5)
-
-        nav_panel.SetSizer(nav_sizer)
-        nav_panel.Layout()
-        nav_sizer.Fit(nav_panel)
-        self.sizer.Add(nav_panel, 0, wx.EXPAND|wx.ALL, 5)
-
-        self.SetSizer(self.sizer)
-        self.Layout()
-        self.Centre(wx.BOTH)
-
-        # Initialize the middle panel for the first time
-        self.init_middle_panel()
-
-        # Connect Events
-        self.connection_type_choice.Bind(wx.EVT_CHOICE, self.conn_type_changed)
-        self.load_previous_choice.Bind(wx.EVT_CHOICE, self.load_previous_selected)
-        self.cancel_button.Bind(wx.EVT_BUTTON, self.cancel_button_pressed)
-        self.previous_button.Bind(wx.EVT_BUTTON, self.previous_button_pressed)
-        self.next_button.Bind(wx.EVT_BUTTON, self.next_button_pressed)
-        self.save_connection.Bind(wx.EVT_CHECKBOX, self.save_connection_changed)
-        self.connection_name.Bind(wx.EVT_KEY_UP, self.validate_connection_name)
-        self.Bind(wx.EVT_CLOSE, self.parent.confirm_close_extraction)
-
-    def load_previous_selected(self, event: wx.Event):
-        """Load saved connection data from user config DB into this panel."""
-        connection_name = self.load_previous_choice.GetStringSelection()
-        if connection_name == "":
-            return  # No connection selected to reload
-
-        saved_creds = self.config_db.get_credentials(connection_name, self.erp)
-
-        connection_type = saved_creds["type"]
-        self.connection_type_choice.SetStringSelection(connection_type)
-
-        self.init_middle_panel()
-
-        controls_to_load = ['host', 'port', 'schema', 'database', 'driver']
-
-        if connection_type == "SQL Server Authentication":
-            controls_to_load += ['user', 'password']
-
-        for key in controls_to_load:
-            value = saved_creds.get(key) or ''
-            _set_wx_control_value(self.controls[key], value)
-
-        self.Layout()
-        self.validate_required_controls()
-
-    def next_button_pressed(self, event: wx.Event):
-        """When user clicks 'Next' button on SQL server connection screen"""
-        # Determine which args to use for connection test
-        connection_type = self.connection_type_choice.GetStringSelection()
-        controls_to_load = ['host', 'port', 'schema', 'database', 'driver']
-
-        if connection_type == "SQL Server Authentication":
-            controls_to_load += ['user', 'password']
-
-        # Gather connection kwargs for Threaded test
-        connection_args = {}
-        for key in controls_to_load:
-            connection_args[key] = _get_wx_control_value(self.controls[key])
-
-        # Raise an error if the port value is non-numeric
-        port = connection_args['port']
-        if port and not port.isnumeric():
-            message = 'Port must be a number (received "{}")'.format(port)
-            wx.MessageBox(message, 'Error', style=wx.ICON_ERROR)
-            return
-
-        # Get MSSQL Driver
-        if connection_args['driver'] == '':
-            connection_args['driver'] = 'SQL Server'
-
-        # Create messenger while busy message is shown to user
-        self.busy_info = wx.BusyInfo("Testing connection...")
-        self.Disable()
-        thread = GetConnectionThread(self, "MSSQL RDBMS",
-                                     connection_type, connection_args)
-        thread.start()
-
-    def init_middle_panel(self):
-        """Destroy and rebuild the entire middle panel for this window."""
-        self.middle_panel.DestroyChildren()
+        if built:
+            self.reset_control_listeners()
+        else:
+            self.validate_required_controls()
 
-        # Middle panel is made up of two columns of UserInputs
-        middle_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        self.left_panel = wx.Panel(self.middle_panel)
-        self.right_panel = wx.Panel(self.middle_panel)
+    def _build_middle_panel(self, panel: wx.Panel):
+        """Build the inputs for the selected SQL Server authentication."""
+        # Panel is made up of two columns of UserInputs
+        panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        left_panel = wx.Panel(panel)
+        right_panel = wx.Panel(panel)
         left_sizer = wx.BoxSizer(wx.VERTICAL)
         right_sizer = wx.BoxSizer(wx.VERTICAL)
 
@@ -2764,14 +2748,11 @@ class MSSQLConnectionDialog(BaseConnectionDialog):
             ('database', 'Database*'),
             ('driver', 'Driver')
         )
-        for attr, label in attrs_labels:
-            self.add_user_input(self.left_panel, left_sizer, attr, label)
+        self.add_user_inputs_batch(left_panel, left_sizer, attrs_labels)
 
         # Finish building left side of the panel
-        self.left_panel.SetSizer(left_sizer)
-        self.left_panel.Layout()
-        left_sizer.Fit(self.left_panel)
-        middle_panel_sizer.Add(self.left_panel, 1, wx.EXPAND|wx.ALL, 5)
+        left_panel.SetSizer(left_sizer)
+        panel_sizer.Add(left_panel, 1, wx.EXPAND|wx.ALL, 5)
 
         # If using 'Windows Auth', do nothing. If using 'SQL Server Auth',
         # Add an input for username and password on the right-side panel
@@ -2780,21 +2761,12 @@ class MSSQLConnectionDialog(BaseConnectionDialog):
                 ('user', 'User*'),
                 ('password', 'Password*'),
             )
-            for attr, label in attrs_labels:
-                self.add_user_input(self.right_panel, right_sizer, attr, label)
-
-        self.right_panel.SetSizer(right_sizer)
-        self.right_panel.Layout()
-        right_sizer.Fit(self.right_panel)
-        middle_panel_sizer.Add(self.right_panel, 1, wx.EXPAND|wx.ALL, 5)
+            self.add_user_inputs_batch(right_panel, right_sizer, attrs_labels)
 
-        self.middle_panel.SetSizer(middle_panel_sizer)
-        self.middle_panel.Layout()
-        middle_panel_sizer.Fit(self.middle_panel)
-
-        self.Layout()
+        right_panel.SetSizer(right_sizer)
+        panel_sizer.Add(right_panel, 1, wx.EXPAND|wx.ALL, 5)
 
-        self.reset_control_listeners()
+        panel.SetSizer(panel_sizer)
 
 
 class DB2ConnectionDialog(BaseConnectionDialog):
@@ -2803,427 +2775,124 @@ class DB2ConnectionDialog(BaseConnectionDialog):
     erp = 'DB2'
     required_submodules = ['connect.db2']
     required_user_inputs = ['host', 'port', 'database', 'user', 'password']
-
-    def __init__(self, *args, **kwargs):
-        """Return a new instance of the dialog window."""
-        super().__init__(*args, **kwargs)
-
-        title = wx.StaticText(self, label="IBM DB2 Connection")
-        title.SetFont(FONT_TITLES)
-        self.sizer.Add(title, 0, wx.EXPAND|wx.ALL, 10)
-
-        line = wx.StaticLine(self)
-        self.sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
-
-        content_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        main_panel_sizer = wx.BoxSizer(wx.VERTICAL)
-
-        self.top_panel = wx.Panel(self.main_panel)
-        top_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-        # Connection Type
-        conntype_panel = wx.Panel(self.top_panel)
-        conntype_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-        conntype_label = wx.StaticText(conntype_panel, label="Connection Type:")
-        conntype_label.Wrap(-1)
-        conntype_label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
-
-        conntype_sizer.Add(conntype_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
-
-        choices = [u"DB2 Authentication"]
-        self.connection_type_choice = wx.Choice(conntype_panel, choices=choices)
-        self.connection_type_choice.SetSelection(0)
-        conntype_sizer.Add(self.connection_type_choice, 0, wx.ALL, 5)
-
-        conntype_panel.SetSizer(conntype_sizer)
-        conntype_panel.Layout()
-        conntype_sizer.Fit(conntype_panel)
-        top_panel_sizer.Add(conntype_panel, 1, wx.EXPAND|wx.ALL, 5)
-
-        load_prev_panel = wx.Panel(self.top_panel)
-        load_prev_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-        load_label = wx.StaticText(load_prev_panel,
-                                   label='Load Saved Connection:')
-        load_label.Wrap(-1)
-        load_label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
-
-        load_prev_sizer.Add(load_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
-
-        # Load Previous
-        saved_connections = [""]
-        saved_connections += self.config_db.saved_credential_names(self.erp)
-        self.load_previous_choice = wx.Choice(load_prev_panel,
-                                              choices=saved_connections)
-        self.load_previous_choice.SetSelection(0)
-        load_prev_sizer.Add(self.load_previous_choice, 1, wx.ALL, 5)
-
-        load_prev_panel.SetSizer(load_prev_sizer)
-        load_prev_panel.Layout()
-        load_prev_sizer.Fit(load_prev_panel)
-        top_panel_sizer.Add(load_prev_panel, 1, wx.EXPAND|wx.ALL, 5)
-
-        self.top_panel.SetSizer(top_panel_sizer)
-        self.top_panel.Layout()
-        top_panel_sizer.Fit(self.top_panel)
-        main_panel_sizer.Add(self.top_panel, 0, wx.EXPAND|wx.ALL, 5)
-
-        line = wx.StaticLine(self.main_panel)
-        main_panel_sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
-
-        self.middle_panel = wx.Panel(self.main_panel)
-        middle_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-        self.left_panel = wx.Panel(self.middle_panel)
-        left_sizer = wx.BoxSizer(wx.VERTICAL)
-
-        self.left_panel.SetSizer(left_sizer)
-        self.left_panel.Layout()
-        left_sizer.Fit(self.left_panel)
-        middle_panel_sizer.Add(self.left_panel, 1, wx.EXPAND|wx.ALL, 5)
-
-        self.right_panel = wx.Panel(self.middle_panel)
-        right_sizer = wx.BoxSizer(wx.VERTICAL)
-
-        self.right_panel.SetSizer(right_sizer)
-        self.right_panel.Layout()
-        right_sizer.Fit(self.right_panel)
-
-        main_panel_sizer.Add(self.middle_panel, 1, wx.EXPAND|wx.ALL, 5)
-
-        line = wx.StaticLine(self.main_panel)
-        main_panel_sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
-
-        self.build_bottom_panel()
-        main_panel_sizer.Add(self.bottom_panel, 0, wx.EXPAND|wx.ALL, 5)
-
-        self.main_panel.SetSizer(main_panel_sizer)
-        self.main_panel.Layout()
-        content_panel_sizer.Add(self.main_panel, 1, wx.EXPAND|wx.RIGHT, 5)
-
-        content = (
-            'Please select an existing connection or enter connection '
-            'details for the selected DB2 instance.\n\n'
-            'Host: Name of host/server\n\n'
-            'Port: Numeric value\n\n'
-            'Database: Database name on server\n\n'
-            'User: User name (optionally with domain prefix)\n\n'
-            'Password: Valid password for user\n\n'
-        )
-
-        guidepanel = GuidePanel(parent=self.content_panel, content=content)
-        content_panel_sizer.Add(guidepanel, 1, wx.EXPAND|wx.LEFT, 5)
-
-        self.content_panel.SetSizer(content_panel_sizer)
-        self.content_panel.Layout()
-        content_panel_sizer.Fit(self.content_panel)
-        self.sizer.Add(self.content_panel, 1, wx.EXPAND|wx.ALL, 5)
-
-        nav_panel = wx.Panel(self)
-        nav_sizer = wx.BoxSizer(wx.VERTICAL)
-
-        button_panel = wx.Panel(nav_panel)
-        button_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-        self.cancel_button = wx.Button(button_panel, label="Cancel")
-        button_sizer.Add(self.cancel_button, 0, wx.ALL, 5)
-
-        self.previous_button = wx.Button(button_panel, label="Previous")
-        button_sizer.Add(self.previous_button, 0, wx.ALL, 5)
-
-        self.next_button = wx.Button(button_panel, label="Next")
-        button_sizer.Add(self.next_button, 0, wx.ALL, 5)
-
-        button_panel.SetSizer(button_sizer)
-        button_panel.Layout()
-        button_sizer.Fit(button_panel)
-        nav_sizer.Add(button_panel, 0, wx.ALL|wx.ALIGN_RIGHT, 5)
-
-        nav_panel.SetSizer(nav_sizer)
-        nav_panel.Layout()
-        nav_sizer.Fit(nav_panel)
-        self.sizer.Add(nav_panel, 0, wx.EXPAND|wx.ALL, 5)
-
-        self.SetSizer(self.sizer)
-        self.Layout()
-        self.Centre(wx.BOTH)
-
-        # Initialize the middle panel for the first time
-        self.init_middle_panel()
-
-        # Connect Events
-        self.connection_type_choice.Bind(wx.EVT_CHOICE, self.conn_type_changed)
-        self.load_previous_choice.Bind(wx.EVT_CHOICE, self.load_previous_selected)
-        self.cancel_button.Bind(wx.EVT_BUTTON, self.cancel_button_pressed)
-        self.previous_button.Bind(wx.EVT_BUTTON, self.previous_button_pressed)
-        self.next_button.Bind(wx.EVT_BUTTON, self.next_button_pressed)
-        self.save_connection.Bind(wx.EVT_CHECKBOX, self.save_connection_changed)
-        self.connection_name.Bind(wx.EVT_KEY_UP, self.validate_connection_name)
-        self.Bind(wx.EVT_CLOSE, self.parent.confirm_close_extraction)
-
-    def load_previous_selected(self, event: wx.Event):
-        """Load saved connection data from user config DB into this panel."""
-        connection_name = self.load_previous_choice.GetStringSelection()
-        if connection_name == "":
-            return  # No connection selected to reload
-
-        saved_creds = self.config_db.get_credentials(connection_name, self.erp)
-        self.connection_type_choice.SetStringSelection(saved_creds["type"])
-
-        self.init_middle_panel()
-
-        for key in ('host', 'port', 'database', 'user', 'password'):
-            value = saved_creds.get(key) or ''
-            _set_wx_control_value(self.controls[key], value)
-
-        self.Layout()
-        self.validate_required_controls()
-
-    def next_button_pressed(self, event: wx.Event):
-        """Test the DB2 connection, then proceed to Content Preview screen."""
-        # Determine which args to use for connection test
-        connection_type = self.connection_type_choice.GetStringSelection()
-        controls_to_load = ['host', 'port', 'database']
-
-        if connection_type == "DB2 Authentication":
-            controls_to_load += ['user', 'password']
-
-        # Gather connection kwargs for Threaded test
-        connection_args = {}
-        for key in controls_to_load:
-            connection_args[key] = _get_wx_control_value(self.controls[key])
-
-        # Create messenger while busy message is shown to user
-        self.busy_info = wx.BusyInfo("Testing connection...")
-        self.Disable()
-        thread = GetConnectionThread(self, "DB2 RDBMS",
-                                     connection_type, connection_args)
-        thread.start()
-
-    def init_middle_panel(self):
-        """Instantiate components of the middle panel for this window."""
-        self.middle_panel.DestroyChildren()
-
-        # Middle panel is made up of two columns of UserInputs
-        middle_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        self.left_panel = wx.Panel(self.middle_panel)
-        self.right_panel = wx.Panel(self.middle_panel)
-        left_sizer = wx.BoxSizer(wx.VERTICAL)
-        right_sizer = wx.BoxSizer(wx.VERTICAL)
-
-        # Add Host / Port / Database inputs to left panel
-        attrs_labels = (
-            ('host', 'Host*'),
-            ('port', 'Port*'),
-            ('database', 'Database*'),
-        )
-        for attr, label in attrs_labels:
-            self.add_user_input(self.left_panel, left_sizer, attr, label)
-
-        self.left_panel.SetSizer(left_sizer)
-        self.left_panel.Layout()
-        left_sizer.Fit(self.left_panel)
-        middle_panel_sizer.Add(self.left_panel, 1, wx.EXPAND|wx.ALL, 5)
-
-        # If using "DB2 Auth", add Username / Password inputs to right panel
-        if self.connection_type_choice.GetCurrentSelection() == 0:
-            attrs_labels = (
-                ('user', 'User*'),
-                ('password', 'Password*'),
-            )
-            for attr, label in attrs_labels:
-                self.add_user_input(self.right_panel, right_sizer, attr, label)
-
-        self.right_panel.SetSizer(right_sizer)
-        self.right_panel.Layout()
-        right_sizer.Fit(self.right_panel)
-        middle_panel_sizer.Add(self.right_panel, 1, wx.EXPAND|wx.ALL, 5)
-
-        self.middle_panel.SetSizer(middle_panel_sizer)
-        self.middle_panel.Layout()
-        middle_panel_sizer.Fit(self.middle_panel)
-
-        self.Layout()
-
-        self.reset_control_listeners()
-
-
-class MySQLConnectionDialog(BaseConnectionDialog):
-    """Connection dialog window for connecting to MySQL."""
-
-    erp = 'MYSQL'
-    required_submodules = ['connect.mysql']
-    required_user_inputs = {
-        "MySQL Authentication": ['host', 'port', 'database', 'user', 'password'],
-        "Data Source Name (DSN)": ['dsn']
-    }
     conntypes_to_controls = {
-        'MySQL Authentication': (
-            'host', 'port', 'database', 'driver', 'user', 'password'
-        ),
-        'Data Source Name (DSN)': (
-            'dsn', 'database',
-        ),
+        'DB2 Authentication': ('host', 'port', 'database', 'user', 'password'),
     }
 
-    def __init__(self, *args, **kwargs):
-        """Return a new instance of the dialog window."""
-        super().__init__(*args, **kwargs)
-
-        title = wx.StaticText(self, label="MySQL Connection")
-        title.SetFont(FONT_TITLES)
-        self.sizer.Add(title, 0, wx.EXPAND|wx.ALL, 10)
-
-        line = wx.StaticLine(self)
-        self.sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
-
-        content_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        main_panel_sizer = wx.BoxSizer(wx.VERTICAL)
-
-        self.top_panel = wx.Panel(self.main_panel)
-        top_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-        # Connection Type
-        conntype_panel = wx.Panel(self.top_panel)
-        conntype_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-        conntype_label = wx.StaticText(conntype_panel, label="Connection Type:")
-        conntype_label.Wrap(-1)
-        conntype_label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
-
-        conntype_sizer.Add(conntype_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
-
-        choices = [u"MySQL Authentication", "Data Source Name (DSN)"]
-        self.connection_type_choice = wx.Choice(conntype_panel, choices=choices)
-        self.connection_type_choice.SetSelection(0)
-        conntype_sizer.Add(self.connection_type_choice, 0, wx.ALL, 5)
-
-        conntype_panel.SetSizer(conntype_sizer)
-        conntype_panel.Layout()
-        conntype_sizer.Fit(conntype_panel)
-        top_panel_sizer.Add(conntype_panel, 1, wx.EXPAND|wx.ALL, 5)
-
-        load_prev_panel = wx.Panel(self.top_panel)
-        load_prev_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-        load_label = wx.StaticText(load_prev_panel,
-                                   label='Load Saved Connection:')
-        load_label.Wrap(-1)
-        load_label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
-
-        load_prev_sizer.Add(load_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
-
-        # Load Previous
-        saved_connections = [""]
-        saved_connections += self.config_db.saved_credential_names(self.erp)
-        self.load_previous_choice = wx.Choice(load_prev_panel,
-                                              choices=saved_connections)
-        self.load_previous_choice.SetSelection(0)
-        load_prev_sizer.Add(self.load_previous_choice, 1, wx.ALL, 5)
-
-        load_prev_panel.SetSizer(load_prev_sizer)
-        load_prev_panel.Layout()
-        load_prev_sizer.Fit(load_prev_panel)
-        top_panel_sizer.Add(load_prev_panel, 1, wx.EXPAND|wx.ALL, 5)
+    def _build_ui(self):
+        """Build the widgets of this dialog before it is first shown."""
+        choices = [u"DB2 Authentication"]
 
-        self.top_panel.SetSizer(top_panel_sizer)
-        self.top_panel.Layout()
-        top_panel_sizer.Fit(self.top_panel)
-        main_panel_sizer.Add(self.top_panel, 0, wx.EXPAND|wx.ALL, 5)
+        content = _GUIDE_TEMPLATE.format(erp='DB2')
 
-        line = wx.StaticLine(self.main_panel)
-        main_panel_sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
+        self._build_connection_dialog("IBM DB2 Connection", choices, content)
 
-        self.middle_panel = wx.Panel(self.main_panel)
-        middle_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
+    def load_previous_selected(self, event: wx.Event):
+        """Load saved connection data from user config DB into this panel."""
+        connection_name = self.load_previous_choice.GetStringSelection()
+        if connection_name == "":
+            return  # No connection selected to reload
 
-        self.left_panel = wx.Panel(self.middle_panel)
-        left_sizer = wx.BoxSizer(wx.VERTICAL)
+        saved_creds = self.saved_credentials(connection_name)
 
-        self.left_panel.SetSizer(left_sizer)
-        self.left_panel.Layout()
-        left_sizer.Fit(self.left_panel)
-        middle_panel_sizer.Add(self.left_panel, 1, wx.EXPAND|wx.ALL, 5)
+        with self.loading_saved_values():
+            self.connection_type_choice.SetStringSelection(saved_creds["type"])
+            self.init_middle_panel()
 
-        self.right_panel = wx.Panel(self.middle_panel)
-        right_sizer = wx.BoxSizer(wx.VERTICAL)
+            for key in self.conntypes_to_controls[saved_creds["type"]]:
+                value = saved_creds.get(key) or ''
+                _set_wx_control_value(self.controls[key], value)
 
-        self.right_panel.SetSizer(right_sizer)
-        self.right_panel.Layout()
-        right_sizer.Fit(self.right_panel)
+    def next_button_pressed(self, event: wx.Event):
+        """Test the DB2 connection, then proceed to Content Preview screen."""
+        # Determine which args to use for connection test
+        connection_type = self.connection_type_choice.GetStringSelection()
 
-        main_panel_sizer.Add(self.middle_panel, 1, wx.EXPAND|wx.ALL, 5)
+        # Gather connection kwargs for Threaded test
+        connection_args = {
+            key: _get_wx_control_value(self.controls[key])
+            for key in self.conntypes_to_controls[connection_type]
+        }
 
-        line = wx.StaticLine(self.main_panel)
-        main_panel_sizer.Add(line, 0, wx.EXPAND|wx.ALL, 5)
+        # Create messenger while busy message is shown to user
+        self.start_connection_test("DB2 RDBMS", connection_type,
+                                   connection_args)
 
-        self.build_bottom_panel()
-        main_panel_sizer.Add(self.bottom_panel, 0, wx.EXPAND|wx.ALL, 5)
+    def init_middle_panel(self):
+        """Show the middle panel, building it the first time it is needed."""
+        selection = self.connection_type_choice.GetCurrentSelection()
+        self.Freeze()
+        try:
+            built = self.show_branch_panel(selection, self._build_middle_panel)
+        finally:
+            self.Thaw()
 
-        self.main_panel.SetSizer(main_panel_sizer)
-        self.main_panel.Layout()
-        content_panel_sizer.Add(self.main_panel, 1, wx.EXPAND|wx.RIGHT, 5)
+        self.middle_panel.Layout()
 
-        content = (
-            'Please select an existing connection or enter connection '
-            'details for the selected MySQL instance.\n\n'
-            'Host: Name of host/server\n\n'
-            'Port: Numeric value\n\n'
-            'Database: Database name on server\n\n'
-            'User: User name (optionally with domain prefix)\n\n'
-            'Password: Valid password for user\n\n'
-        )
+        if built:
+            self.reset_control_listeners()
+        else:
+            self.validate_required_controls()
 
-        guidepanel = GuidePanel(parent=self.content_panel, content=content)
-        content_panel_sizer.Add(guidepanel, 1, wx.EXPAND|wx.LEFT, 5)
+    def _build_middle_panel(self, panel: wx.Panel):
+        """Build the DB2 connection inputs into a panel."""
+        # Panel is made up of two columns of UserInputs
+        panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        left_panel = wx.Panel(panel)
+        right_panel = wx.Panel(panel)
+        left_sizer = wx.BoxSizer(wx.VERTICAL)
+        right_sizer = wx.BoxSizer(wx.VERTICAL)
 
-        self.content_panel.SetSizer(content_panel_sizer)
-        self.content_panel.Layout()
-        content_panel_sizer.Fit(self.content_panel)
-        self.sizer.Add(self.content_panel, 1, wx.EXPAND|wx.ALL, 5)
+        # Add Host / Port / Database inputs to left panel
+        attrs_labels = (
+            ('host', 'Host*'),
+            ('port', 'Port*'),
+            ('database', 'Database*'),
+        )
+        self.add_user_inputs_batch(left_panel, left_sizer, attrs_labels)
 
-        nav_panel = wx.Panel(self)
-        nav_sizer = wx.BoxSizer(wx.VERTICAL)
+        left_panel.SetSizer(left_sizer)
+        panel_sizer.Add(left_panel, 1, wx.EXPAND|wx.ALL, 5)
 
-        button_panel = wx.Panel(nav_panel)
-        button_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        # If using "DB2 Auth", add Username / Password inputs to right panel
+        if self.connection_type_choice.GetCurrentSelection() == 0:
+            attrs_labels = (
+                ('user', 'User*'),
+                ('password', 'Password*'),
+            )
+            self.add_user_inputs_batch(right_panel, right_sizer, attrs_labels)
 
-        self.cancel_button = wx.Button(button_panel, label="Cancel")
-        button_sizer.Add(self.cancel_button, 0, wx.ALL, 5)
+        right_panel.SetSizer(right_sizer)
+        panel_sizer.Add(right_panel, 1, wx.EXPAND|wx.ALL, 5)
 
-        self.previous_button = wx.Button(button_panel, label="Previous")
-        button_sizer.Add(self.previous_button, 0, wx.ALL, 5)
+        panel.SetSizer(panel_sizer)
 
-        self.next_button = wx.Button(button_panel, label="Next")
-        button_sizer.Add(self.next_button, 0, wx.ALL, 5)
 
-        button_panel.SetSizer(button_sizer)
-        button_panel.Layout()
-        button_sizer.Fit(button_panel)
-        nav_sizer.Add(button_panel, 0, wx.ALL|wx.ALIGN_RIGHT, 5)
+class MySQLConnectionDialog(BaseConnectionDialog):
+    """Connection dialog window for connecting to MySQL."""
 
-        nav_panel.SetSizer(nav_sizer)
-        nav_panel.Layout()
-        nav_sizer.Fit(nav_panel)
-        self.sizer.Add(nav_panel, 0, wx.EXPAND|wx.ALL, 5)
+    erp = 'MYSQL'
+    required_submodules = ['connect.mysql']
+    required_user_inputs = {
+        "MySQL Authentication": ['host', 'port', 'database', 'user', 'password'],
+        "Data Source Name (DSN)": ['dsn']
+    }
+    conntypes_to_controls = {
+        'MySQL Authentication': (
+            'host', 'port', 'database', 'driver', 'user', 'password'
+        ),
+        'Data Source Name (DSN)': (
+            'dsn', 'database',
+        ),
+    }
 
-        self.SetSizer(self.sizer)
-        self.Layout()
-        self.Centre(wx.BOTH)
+    def _build_ui(self):
+        """Build the widgets of this dialog before it is first shown."""
+        choices = [u"MySQL Authentication", "Data Source Name (DSN)"]
 
-        # Initialize the middle panel for the first time
-        self.init_middle_panel()
+        content = _GUIDE_TEMPLATE.format(erp='MySQL')
 
-        # Connect Events
-        self.connection_type_choice.Bind(wx.EVT_CHOICE, self.conn_type_changed)
-        self.load_previous_choice.Bind(wx.EVT_CHOICE, self.load_previous_selected)
-        self.cancel_button.Bind(wx.EVT_BUTTON, self.cancel_button_pressed)
-        self.previous_button.Bind(wx.EVT_BUTTON, self.previous_button_pressed)
-        self.next_button.Bind(wx.EVT_BUTTON, self.next_button_pressed)
-        self.save_connection.Bind(wx.EVT_CHECKBOX, self.save_connection_changed)
-        self.connection_name.Bind(wx.EVT_KEY_UP, self.validate_connection_name)
-        self.Bind(wx.EVT_CLOSE, self.parent.confirm_close_extraction)
+        self._build_connection_dialog("MySQL Connection", choices, content)
 
     def load_previous_selected(self, event: wx.Event):
         """Load saved connection data from user config DB into this panel."""
@@ -3231,52 +2900,57 @@ class MySQLConnectionDialog(BaseConnectionDialog):
         if connection_name == "":
             return  # No connection selected to reload
 
-        saved_creds = self.config_db.get_credentials(connection_name, self.erp)
-        self.connection_type_choice.SetStringSelection(saved_creds["type"])
+        saved_creds = self.saved_credentials(connection_name)
 
-        self.init_middle_panel()
-        for key in self.conntypes_to_controls[saved_creds["type"]]:
-            value = saved_creds.get(key) or ''
-            _set_wx_control_value(self.controls[key], value)
+        with self.loading_saved_values():
+            self.connection_type_choice.SetStringSelection(saved_creds["type"])
+            self.init_middle_panel()
 
-        self.Layout()
-        self.validate_required_controls()
+            for key in self.conntypes_to_controls[saved_creds["type"]]:
+                value = saved_creds.get(key) or ''
+                _set_wx_control_value(self.controls[key], value)
 
     def next_button_pressed(self, event: wx.Event):
         """Test the DB2 connection, then proceed to Content Preview screen."""
         # Determine which args to use for connection test
         connection_type = self.connection_type_choice.GetStringSelection()
-        controls_to_load = []
-
-        if connection_type == "MySQL Authentication":
-            controls_to_load += ['host', 'port', 'database', 'user', 'password', 'driver']
-        elif connection_type == "Data Source Name (DSN)":
-            controls_to_load += ['dsn', 'database']
 
         # Gather connection kwargs for Threaded test
-        connection_args = {}
-        for key in controls_to_load:
-            connection_args[key] = _get_wx_control_value(self.controls[key])
+        connection_args = {
+            key: _get_wx_control_value(self.controls[key])
+            for key in self.conntypes_to_controls[connection_type]
+        }
 
-        # Get MYSQL Driver
-        if connection_args['driver'] == '':
+        # Get MYSQL Driver (DSN connections do not take one)
+        if connection_args.get('driver') == '':
             connection_args['driver'] = 'MySQL ODBC 5.3 Unicode Driver'
 
         # Create messenger while busy message is shown to user
-        self.busy_info = wx.BusyInfo("Testing connection...")
-        self.Disable()
-        thread = GetConnectionThread(self, "MYSQL RDBMS",
-                                     connection_type, connection_args)
-        thread.start()
+        self.start_connection_test("MYSQL RDBMS", connection_type,
+                                   connection_args)
 
     def init_middle_panel(self):
-        """Instantiate components of the middle panel for this window."""
-        self.middle_panel.DestroyChildren()
+        """Show the middle panel, building it the first time it is needed."""
+        selection = self.connection_type_choice.GetCurrentSelection()
+        self.Freeze()
+        try:
+            built = self.show_branch_panel(selection, self._build_middle_panel)
+        finally:
+            self.Thaw()
+
+        self.middle_panel.Layout()
+
+        if built:
+            self.reset_control_listeners()
+        else:
+            self.validate_required_controls()
 
-        # Middle panel is made up of two columns of UserInputs
-        middle_panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
-        self.left_panel = wx.Panel(self.middle_panel)
-        self.right_panel = wx.Panel(self.middle_panel)
+    def _build_middle_panel(self, panel: wx.Panel):
+        """Build the inputs for the selected MySQL connection type."""
+        # Panel is made up of two columns of UserInputs
+        panel_sizer = wx.BoxSizer(wx.HORIZONTAL)
+        left_panel = wx.Panel(panel)
+        right_panel = wx.Panel(panel)
         left_sizer = wx.BoxSizer(wx.VERTICAL)
         right_sizer = wx.BoxSizer(wx.VERTICAL)
 
@@ -3289,56 +2963,31 @@ class MySQLConnectionDialog(BaseConnectionDialog):
                 ('database', 'Database*'),
                 ('driver', 'Driver')
             )
-            for attr, label in attrs_labels:
-                self.add_user_input(self.left_panel, left_sizer, attr, label)
-
-            self.left_panel.SetSizer(left_sizer)
-            self.left_panel.Layout()
-            left_sizer.Fit(self.left_panel)
-            middle_panel_sizer.Add(self.left_panel, 1, wx.EXPAND|wx.ALL, 5)
+            self.add_user_inputs_batch(left_panel, left_sizer, attrs_labels)
 
             # Add User / Password inputs to right panel
             attrs_labels = (
                 ('user', 'User*'),
                 ('password', 'Password*'),
             )
-            for attr, label in attrs_labels:
-                self.add_user_input(self.right_panel, right_sizer, attr, label)
+            self.add_user_inputs_batch(right_panel, right_sizer, attrs_labels)
 
-        elif self.connection_type_choice.GetCurrentSelection() == 1:
+        else:
 
-            # Add Host / Port / Database inputs to left panel
+            # Add DSN / Database inputs to left panel
             attrs_labels = (
                 ('dsn', 'DSN*'),
                 ('database', 'Database*'),
             )
-            for attr, label in attrs_labels:
-                self.add_user_input(self.left_panel, left_sizer, attr, label)
-
-            self.left_panel.SetSizer(left_sizer)
-            self.left_panel.Layout()
-            left_sizer.Fit(self.left_panel)
-            middle_panel_sizer.Add(self.left_panel, 1, wx.EXPAND|wx.ALL, 5)
-
-            # # Add User / Password inputs to right panel
-            # attrs_labels = (
-            #     ('user', 'User*'),
-            #     ('password', 'Password*'),
-            # )
-            # for attr, label in attrs_labels:
-            #     self.add_user_input(self.right_panel, right_sizer, attr, label)
-        self.right_panel.SetSizer(right_sizer)
-        self.right_panel.Layout()
-        right_sizer.Fit(self.right_panel)
-        middle_panel_sizer.Add(self.right_panel, 1, wx.EXPAND|wx.ALL, 5)
+            self.add_user_inputs_batch(left_panel, left_sizer, attrs_labels)
 
-        self.middle_panel.SetSizer(middle_panel_sizer)
-        self.middle_panel.Layout()
-        middle_panel_sizer.Fit(self.middle_panel)
+        left_panel.SetSizer(left_sizer)
+        panel_sizer.Add(left_panel, 1, wx.EXPAND|wx.ALL, 5)
 
-        self.Layout()
+        right_panel.SetSizer(right_sizer)
+        panel_sizer.Add(right_panel, 1, wx.EXPAND|wx.ALL, 5)
 
-        self.reset_control_listeners()
+        panel.SetSizer(panel_sizer)
 
 
 class ContentPreviewDialog(DefaultDialog):
@@ -3348,6 +2997,8 @@ class ContentPreviewDialog(DefaultDialog):
         """Instantiate and return a new content dialog window."""
         super().__init__(parent)
         self.busy_info = None  # type: wx.BusyInfo
+        # Query details text by (id of ECF row data, table alias)
+        self._preview_texts = {}  # type: Dict[tuple, str]
 
         self.sizer = wx.BoxSizer(wx.VERTICAL)
 
@@ -3455,6 +3106,16 @@ class ContentPreviewDialog(DefaultDialog):
             return
 
         # Otherwise, alert the user with the SQL query if available
+        key = (id(ecf_data), table_alias)
+        text = self._preview_texts.get(key)
+        if text is None:
+            text = self._query_details_text(ecf_data, table_alias)
+            self._preview_texts[key] = text
+
+        CopyableMessageBox(self, 'Info', text)
+
+    def _query_details_text(self, ecf_data, table_alias: str) -> str:
+        """Return the text shown when a query row is double-clicked."""
         if isinstance(ecf_data.query_text, dict):
             # If SAP or not using SQL queries, show metadata from ECF
             columns = pformat(sorted(ecf_data.query_text['Columns']), compact=True)
@@ -3475,20 +3136,19 @@ class ContentPreviewDialog(DefaultDialog):
                 'SQL Query for "{table}"\n\n{query}'
                 ).format(table=table_alias, query=ecf_data.query_text)
 
-        CopyableMessageBox(self, 'Info', text)
+        return text
 
     def cell_right_clicked(self, event: wx.grid.GridEvent):
         """Copy content to clipboard when a grid cell is right-clicked."""
-        # Do not attempt to copy data if another process has a lock on it
-        if wx.TheClipboard.IsOpened():
+        # Open() fails if another process has a lock on the clipboard
+        if not wx.TheClipboard.Open():
             return
 
         # Copy data into the TheClipboard
-        if wx.TheClipboard.Open():
-            value = self.grid.GetCellValue(event.Row, event.Col)
-            textdata = wx.TextDataObject(text=value)
-            wx.TheClipboard.SetData(textdata)
-            wx.TheClipboard.Close()
+        value = self.grid.GetCellValue(event.Row, event.Col)
+        textdata = wx.TextDataObject(text=value)
+        wx.TheClipboard.SetData(textdata)
+        wx.TheClipboard.Close()
 
     def first_hundred_gathered(self, event: wx.Event):
         """Pop open a dialog window to preview data from a query."""
@@ -3550,6 +3210,9 @@ class ContentPreviewDialog(DefaultDialog):
             erp: The 'DataServer' value in the ECF that determines the
                 label for last column of grid table (Query or Fields).
         """
+        # Rows of a previous ECF may share ids with the new ones
+        self._preview_texts.clear()
+
         if erp == 'SAP Application Server':
             grid_columns = ('Table Name', 'Table Alias', 'Fields')
         else:
@@ -3560,13 +3223,22 @@ class ContentPreviewDialog(DefaultDialog):
         # Grid
         self.grid = wx.grid.Grid(self.main_panel)
 
+        # Fill a string table before attaching it, so no cell is drawn twice
         if queries:
             # Convert all queries to fit on a single line
-            queries = [(name, alias, ' '.join(query.split()))
+            queries = [(name, alias, _WS_RE.sub(' ', query).strip())
                        for name, alias, query in queries]
-            self.grid.CreateGrid(len(queries), 3)
+            table = wx.grid.GridStringTable(len(queries), len(grid_columns))
+            for row, each_query in enumerate(queries):
+                for col, each in enumerate(each_query):
+                    table.SetValue(row, col, each)
+            for index, label in enumerate(grid_columns):
+                table.SetColLabelValue(index, label)
         else:
-            self.grid.CreateGrid(1, 1)
+            table = wx.grid.GridStringTable(1, 1)
+            table.SetValue(0, 0, "No queries")
+        self.grid.SetTable(table, True)
+
         self.grid.EnableEditing(False)
         self.grid.EnableGridLines(True)
         self.grid.EnableDragGridSize(False)
@@ -3577,29 +3249,24 @@ class ContentPreviewDialog(DefaultDialog):
         self.grid.EnableDragColMove(False)
         self.grid.EnableDragColSize(True)
         self.grid.SetColLabelSize(30)
-        for index, label in enumerate(grid_columns):
-            self.grid.SetColLabelValue(index, label)
-
         self.grid.SetColLabelAlignment(wx.ALIGN_LEFT, wx.ALIGN_BOTTOM)
 
         # Rows
         self.grid.EnableDragRowSize(True)
-        self.grid.SetRowLabelSize(80)
-        self.grid.SetRowLabelAlignment(wx.ALIGN_CENTRE, wx.ALIGN_CENTRE)
-
-        # Label Appearance
         self.grid.SetRowLabelSize(50)
+        self.grid.SetRowLabelAlignment(wx.ALIGN_CENTRE, wx.ALIGN_CENTRE)
 
         # Cell Defaults
         self.grid.SetDefaultCellAlignment(wx.ALIGN_LEFT, wx.ALIGN_TOP)
 
-        if queries:
-            for row, each_query in enumerate(queries):
-                for col, each in enumerate(each_query):
-                    self.grid.SetCellValue(row, col, each)
-        else:
-            self.grid.SetCellValue(0, 0, "No queries")
-        self.grid.AutoSizeColumns()
+        # Batch sizing so the grid is measured and painted once
+        self.main_panel.Freeze()
+        self.grid.BeginBatch()
+        try:
+            self.grid.AutoSizeColumns()
+        finally:
+            self.grid.EndBatch()
+            self.main_panel.Thaw()
 
         main_panel_sizer = wx.BoxSizer(wx.VERTICAL)
         main_panel_sizer.Add(self.grid, 1, wx.EXPAND|wx.ALL, 5)
@@ -3614,6 +3281,36 @@ class ContentPreviewDialog(DefaultDialog):
                        self.cell_right_clicked)
 
 
+class _PreviewTable(wx.grid.GridTableBase):
+    """Read-only grid table that serves preview rows on demand."""
+
+    def __init__(self, data: List[List[str]], col_labels: List[str]):
+        """Return a new table over `data`, which is held by reference."""
+        super().__init__()
+        self.data = data
+        self.col_labels = col_labels
+
+    def GetNumberRows(self) -> int:
+        return len(self.data)
+
+    def GetNumberCols(self) -> int:
+        return len(self.data[0]) if self.data else 0
+
+    def GetValue(self, row: int, col: int) -> str:
+        return self.data[row][col]
+
+    def SetValue(self, row: int, col: int, value: str):
+        pass  # Preview data is read-only
+
+    def IsEmptyCell(self, row: int, col: int) -> bool:
+        return False
+
+    def GetColLabelValue(self, col: int) -> str:
+        if col < len(self.col_labels):
+            return self.col_labels[col]
+        return super().GetColLabelValue(col)
+
+
 class FirstHundredRowsDialog(wx.Dialog):
     """Pop-up window of data from a query that the user has previewed."""
 
@@ -3630,13 +3327,34 @@ class FirstHundredRowsDialog(wx.Dialog):
         scroll_panel.SetScrollRate(5, 5)
         scroll_window_sizer = wx.BoxSizer(wx.VERTICAL)
 
-        self.grid = wx.grid.Grid(scroll_panel)
-
-        # Grid
+        self.grid = None  # type: wx.grid.Grid
+        self.table = None  # type: _PreviewTable
         if data:
-            self.grid.CreateGrid(len(data), len(data[0]))
+            self._build_grid(scroll_panel, data, col_labels)
+            scroll_window_sizer.Add(self.grid, 0, wx.ALL, 5)
         else:
-            self.grid.CreateGrid(1, 1)
+            # Nothing to preview, so show a message instead of a grid
+            placeholder = wx.StaticText(scroll_panel,
+                                        label="No results to preview")
+            scroll_window_sizer.Add(placeholder, 0, wx.ALL, 10)
+
+        scroll_panel.SetSizer(scroll_window_sizer)
+        scroll_panel.Layout()
+        scroll_window_sizer.Fit(scroll_panel)
+        self.sizer.Add(scroll_panel, 1, wx.EXPAND|wx.ALL, 5)
+
+        self.SetSizer(self.sizer)
+        self.Layout()
+        self.Centre(wx.BOTH)
+
+    def _build_grid(self, scroll_panel: wx.ScrolledWindow,
+                    data: List[List[str]], col_labels: List[str]):
+        """Create the grid that shows the preview data."""
+        self.grid = wx.grid.Grid(scroll_panel)
+
+        # Grid, reading cells from the preview data as they are drawn
+        self.table = _PreviewTable(data, col_labels)
+        self.grid.SetTable(self.table, True)
 
         self.grid.EnableEditing(False)
         self.grid.EnableGridLines(True)
@@ -3644,8 +3362,6 @@ class FirstHundredRowsDialog(wx.Dialog):
         self.grid.SetMargins(0, 0)
 
         # Columns
-        for col, label in enumerate(col_labels):
-            self.grid.SetColLabelValue(col, label)
         self.grid.EnableDragColMove(False)
         self.grid.EnableDragColSize(True)
         # self.grid.SetColLabelSize(30)
@@ -3658,29 +3374,36 @@ class FirstHundredRowsDialog(wx.Dialog):
 
         # Label Appearance
 
-        # Data
-        if data:
-            for row, row_data in enumerate(data):
-                for col, each in enumerate(row_data):
-                    self.grid.SetCellValue(row, col, each)
-        else:
-            self.grid.SetCellValue(0, 0, "No queries")
-
-        # Auto Size
-        self.grid.AutoSizeColumns()
+        # Size columns from a sample of rows, batched into a single paint
+        scroll_panel.Freeze()
+        self.grid.BeginBatch()
+        try:
+            self.size_columns()
+        finally:
+            self.grid.EndBatch()
+            scroll_panel.Thaw()
 
         # Cell Defaults
         self.grid.SetDefaultCellAlignment(wx.ALIGN_LEFT, wx.ALIGN_TOP)
-        scroll_window_sizer.Add(self.grid, 0, wx.ALL, 5)
 
-        scroll_panel.SetSizer(scroll_window_sizer)
-        scroll_panel.Layout()
-        scroll_window_sizer.Fit(scroll_panel)
-        self.sizer.Add(scroll_panel, 1, wx.EXPAND|wx.ALL, 5)
+    def size_columns(self, sample_rows: int = 25):
+        """Fit each column to its label and the first `sample_rows` rows.
 
-        self.SetSizer(self.sizer)
-        self.Layout()
-        self.Centre(wx.BOTH)
+        Unlike AutoSizeColumns, this does not measure every cell, which
+        would read the whole virtual table on open.
+        """
+        padding = 10
+        dc = wx.ClientDC(self.grid)
+        dc.SetFont(self.grid.GetLabelFont())
+        label_widths = [dc.GetTextExtent(self.table.GetColLabelValue(col))[0]
+                        for col in range(self.table.GetNumberCols())]
+
+        dc.SetFont(self.grid.GetDefaultCellFont())
+        sample = self.table.data[:sample_rows]
+        for col, label_width in enumerate(label_widths):
+            width = max([label_width] +
+                        [dc.GetTextExtent(row[col])[0] for row in sample])
+            self.grid.SetColSize(col, width + padding)
 
 
 class ExtractionDialog(DefaultDialog):
@@ -3697,6 +3420,29 @@ class ExtractionDialog(DefaultDialog):
         self.upload_thread = None  # type: threading.Thread
         self.busy_info = None  # type: wx.BusyInfo
 
+        # Build the whole tree frozen, then lay it out once from the top
+        self.Freeze()
+        try:
+            self._build_layout()
+        finally:
+            self.Thaw()
+        self.Layout()
+        self.Centre(wx.BOTH)
+
+        # Connect Events
+        self.Bind(wx.EVT_SHOW, self.on_show)
+        self.pause_button.Bind(wx.EVT_BUTTON, self.pause_button_pressed)
+        self.start_button.Bind(wx.EVT_BUTTON, self.start_extraction)
+        self.upload_button.Bind(wx.EVT_BUTTON, self.upload_button_pressed)
+        self.cancel_button.Bind(wx.EVT_BUTTON, self.cancel_button_pressed)
+        self.previous_button.Bind(wx.EVT_BUTTON, self.previous_button_pressed)
+        self.finish_button.Bind(wx.EVT_BUTTON, self.finish_button_pressed)
+        self.Bind(EVT_EXTRACTION_DONE, self.extraction_complete)
+        self.Bind(EVT_UPLOAD_DONE, self.upload_feedback)
+        self.Bind(wx.EVT_CLOSE, self.on_close)
+
+    def _build_layout(self):
+        """Create every panel and widget of this dialog."""
         self.sizer = wx.BoxSizer(wx.VERTICAL)
 
         title = wx.StaticText(self, label="Extract")
@@ -3714,7 +3460,7 @@ class ExtractionDialog(DefaultDialog):
 
         progress_label = wx.StaticText(self.main_panel, label="Status:")
         progress_label.Wrap(-1)
-        progress_label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
+        progress_label.SetFont(FONT_BOLD_LABEL)
 
         main_panel_sizer.Add(progress_label, 0, wx.ALL, 5)
 
@@ -3734,7 +3480,6 @@ class ExtractionDialog(DefaultDialog):
         gauge_sizer.Add(self.start_button, 0, wx.ALL, 5)
 
         gauge_panel.SetSizer(gauge_sizer)
-        gauge_panel.Layout()
         gauge_sizer.Fit(gauge_panel)
         main_panel_sizer.Add(gauge_panel, 0, wx.ALL|wx.ALIGN_RIGHT, 5)
 
@@ -3743,7 +3488,7 @@ class ExtractionDialog(DefaultDialog):
 
         log_label = wx.StaticText(self.main_panel, label="Extraction Log:")
         log_label.Wrap(-1)
-        log_label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
+        log_label.SetFont(FONT_BOLD_LABEL)
 
         main_panel_sizer.Add(log_label, 0, wx.ALL, 5)
 
@@ -3752,11 +3497,10 @@ class ExtractionDialog(DefaultDialog):
         logbox_window.SetScrollRate(5, 5)
         logbox_sizer = wx.BoxSizer(wx.VERTICAL)
 
-        self.logbox = LogBox(logbox_window, parent)
+        self.logbox = LogBox(logbox_window, self.parent)
         logbox_sizer.Add(self.logbox, 1, wx.ALL|wx.EXPAND, 0)
 
         logbox_window.SetSizer(logbox_sizer)
-        logbox_window.Layout()
         logbox_sizer.Fit(logbox_window)
         main_panel_sizer.Add(logbox_window, 1, wx.EXPAND|wx.ALL, 5)
 
@@ -3773,31 +3517,18 @@ class ExtractionDialog(DefaultDialog):
         upload_sizer.Add(self.upload_button, 0, wx.ALL, 5)
 
         upload_panel.SetSizer(upload_sizer)
-        upload_panel.Layout()
         upload_sizer.Fit(upload_panel)
         main_panel_sizer.Add(upload_panel, 0, wx.ALL|wx.ALIGN_RIGHT, 5)
 
         # Instructions panel on right-side side
         self.main_panel.SetSizer(main_panel_sizer)
-        self.main_panel.Layout()
         content_panel_sizer.Add(self.main_panel, 1, wx.EXPAND|wx.RIGHT, 5)
 
-        content = (
-            "To pause the extraction and resume it at a later time, "
-            "click \"Pause\".\n\n"
-            "To resume the paused extraction now, click \"Resume\"  \n\n"
-            "To resume the paused extraction later, click \"Finish\"  \n\n"
-            "When the extraction is complete, you will have the "
-            "ability to transmit the data back to PwC by clicking on "
-            "the \"Upload\" button.  \n\n"
-            "If you wish to defer upload or need to manually transfer "
-            "data back to PwC, simply click on the \"Finish\" button."
-        )
-        guidepanel = GuidePanel(parent=self.content_panel, content=content)
+        guidepanel = GuidePanel(parent=self.content_panel,
+                                content=_EXTRACT_GUIDE_TEXT)
         content_panel_sizer.Add(guidepanel, 1, wx.EXPAND|wx.LEFT, 5)
 
         self.content_panel.SetSizer(content_panel_sizer)
-        self.content_panel.Layout()
         content_panel_sizer.Fit(self.content_panel)
         self.sizer.Add(self.content_panel, 1, wx.EXPAND|wx.ALL, 5)
 
@@ -3819,30 +3550,14 @@ class ExtractionDialog(DefaultDialog):
         button_sizer.Add(self.finish_button, 0, wx.ALL, 5)
 
         button_panel.SetSizer(button_sizer)
-        button_panel.Layout()
         button_sizer.Fit(button_panel)
         nav_sizer.Add(button_panel, 0, wx.ALL|wx.ALIGN_RIGHT, 5)
 
         nav_panel.SetSizer(nav_sizer)
-        nav_panel.Layout()
         nav_sizer.Fit(nav_panel)
         self.sizer.Add(nav_panel, 0, wx.EXPAND|wx.ALL, 5)
 
         self.SetSizer(self.sizer)
-        self.Layout()
-        self.Centre(wx.BOTH)
-
-        # Connect Events
-        self.Bind(wx.EVT_SHOW, self.on_show)
-        self.pause_button.Bind(wx.EVT_BUTTON, self.pause_button_pressed)
-        self.start_button.Bind(wx.EVT_BUTTON, self.start_extraction)
-        self.upload_button.Bind(wx.EVT_BUTTON, self.upload_button_pressed)
-        self.cancel_button.Bind(wx.EVT_BUTTON, self.cancel_button_pressed)
-        self.previous_button.Bind(wx.EVT_BUTTON, self.previous_button_pressed)
-        self.finish_button.Bind(wx.EVT_BUTTON, self.finish_button_pressed)
-        self.Bind(EVT_EXTRACTION_DONE, self.extraction_complete)
-        self.Bind(EVT_UPLOAD_DONE, self.upload_feedback)
-        self.Bind(wx.EVT_CLOSE, self.on_close)
 
     def pause_button_pressed(self, event: wx.Event):
         """Occurs when 'Pause' button is pressed mid-extraction."""
@@ -3877,65 +3592,34 @@ class ExtractionDialog(DefaultDialog):
         if 'ecf_file' in self.extract_kwargs:
             filename = os.path.basename(self.extract_kwargs['ecf_file'])
             self.SetTitle('Extract ({})'.format(filename))
-        else:
-            self.SetTitle('Extract')
-
-        self.start_extraction(event)
-
-    def upload_button_pressed(self, event: wx.Event=None):
-        """Occurs when the user uploads data to the LFU."""
-        upload_method = self.parent.ecf_data["FileUploadMethod"]
-
-        if upload_method == "DIF":
-            message = ('Upload failed\n\n'
-                       'DIF upload method is not supported at this time.')
-            wx.MessageBox(message, 'Error', style=wx.ICON_ERROR)
-            return
-
-        if upload_method not in ['MFT_LFU', 'LFU']:
-            message = (
-                'Upload failed\n\n'
-                'Unknown upload method in ECF:  {method}. Please '
-                'contact the PyExtract support team for help.'
-                ).format(method=upload_method)
-            wx.MessageBox(message, 'Error', style=wx.ICON_ERROR)
-            return
+        else:
+            self.SetTitle('Extract')
 
-        # Collect kwargs needed to run the upload in another thread
-        kwargs = {
-            'parent': self,
-            'upload_method': upload_method,
-            'sftp_port': self.parent.configs['sftp_port'],
-            'rename_wait': self.parent.configs['rename_wait']
-        }
+        self.start_extraction(event)
 
-        # Determine location for upload. Use the Production server
-        # based on 'Territory' value from the ECF if a production
-        # build, or use user-selected Config value if QA build.
-        if config.ALLOW_USER_UPLOAD_LOCATION:
-            kwargs['sftp_location'] = self.parent.configs['sftp_location']
-            kwargs['lfu_location'] = self.parent.configs['lfu_location']
-        else:
-            territory = self.parent.ecf_data["Territory"]
-            if territory.upper() not in ('WEST', 'CENTRAL'):
-                message = (
-                    'Upload failed\n\n'
-                    'Invalid Territory value in ECF ("{territory}"). '
-                    'Only the "West" and "Central" territories are '
-                    'supported for production use.'
-                    ).format(territory=territory)
-                wx.MessageBox(message, 'Error', style=wx.ICON_ERROR)
-                return
-            kwargs['sftp_location'] = 'PROD-' + territory.upper()
-            kwargs['lfu_location'] = 'PROD-' + territory.upper()
+    def upload_button_pressed(self, event: wx.Event=None):
+        """Occurs when the user uploads data to the LFU."""
+        upload_method = self.parent.ecf_data["FileUploadMethod"]
+        try:
+            kwargs = _build_upload_kwargs(self.parent.configs,
+                                          self.parent.ecf_data, upload_method)
+        except UploadConfigError as error:
+            wx.MessageBox(error.text, 'Error', style=wx.ICON_ERROR)
+            return
+        kwargs['parent'] = self
 
         LOGGER.info('Beginning to upload package using %s method...',
                     upload_method)
-        self.busy_info = wx.BusyInfo("Uploading Package...")
         self.upload_button.Disable()
         self.upload_thread = UploadPackageThread(**kwargs)
+        # Queued before the thread starts, so it runs before the done event
+        wx.CallAfter(self._show_upload_busy)
         self.upload_thread.start()
 
+    def _show_upload_busy(self):
+        """Show the busy box while the package is being uploaded."""
+        self.busy_info = wx.BusyInfo("Uploading Package...")
+
     def upload_feedback(self, event: wx.Event):
         """Will call the appropriate message if upload was a success/failure
             and will prompt user if they would like to delete the package
@@ -3945,7 +3629,8 @@ class ExtractionDialog(DefaultDialog):
             alert_upload_success(filename=os.path.basename(self.package_path),
                                  host=event.response['host'],
                                  method=event.response['method'])
-            self.prompt_to_delete_package()
+            # Let the success alert close and the window repaint first
+            wx.CallAfter(self.prompt_to_delete_package)
         else:
             self.upload_button.Enable()
             alert_upload_failed(host=event.response['host'],
@@ -4016,8 +3701,9 @@ class ExtractionDialog(DefaultDialog):
                               'or "Cancel" to return home.', 'Paused')
             return
 
-        # If extract completed, and auto-uploading, begin upload process
-        auto_upload = self.parent.config_db.get_config_value('auto_upload')
+        # If extract completed, and auto-uploading, begin upload process.
+        # Read from the in-memory configs, reloaded whenever configs are saved
+        auto_upload = self.parent.configs.get('auto_upload') or ''
         if auto_upload.upper() == "YES":
             self.upload_button_pressed()
             self.cancel_button.Disable()
@@ -4031,19 +3717,18 @@ class ExtractionDialog(DefaultDialog):
         self.finish_button.Enable()
 
         if event.errors:
-            wx.MessageBox('Extraction complete with Errors\n\n'
-                          'Review the log for warnings / errors, then "Upload" '
-                          'data or "Finish" this extraction.', 'Complete',
-                          wx.ICON_WARNING)
-        if event.warnings:
-            wx.MessageBox('Extraction complete with Warnings\n\n'
-                          'Review the log for warnings / errors, then "Upload" '
-                          'data or "Finish" this extraction.', 'Complete',
-                          wx.ICON_WARNING)
+            status, icon = 'Extraction complete with Errors', wx.ICON_WARNING
+        elif event.warnings:
+            status, icon = 'Extraction complete with Warnings', wx.ICON_WARNING
         else:
-            wx.MessageBox('Extraction complete\n\n'
-                          'Review the log for warnings / errors, then "Upload" '
-                          'data or "Finish" this extraction.', 'Complete')
+            status, icon = 'Extraction complete', wx.ICON_INFORMATION
+        message = (
+            '{}\n\n'
+            'Review the log for warnings / errors, then "Upload" '
+            'data or "Finish" this extraction.'
+            ).format(status)
+        # Show the alert once this handler returns and the buttons repaint
+        wx.CallAfter(wx.MessageBox, message, 'Complete', icon)
 
     def clear_logbox(self):
         """Reset the log window on this panel before a new extraction."""
@@ -4075,6 +3760,71 @@ class ExtractionDialog(DefaultDialog):
         event.Skip()
 
 
+class SavedExtractsTable(wx.grid.GridTableBase):
+    """Read-only grid table of saved extractions, formatted on demand."""
+
+    col_labels = ('Extraction ID', 'Request ID', 'Started On',
+                  'Data Server', 'Data Connector', 'ECF File Path')
+
+    def __init__(self, rows: List[List[str]]):
+        """Return a new table over `rows`, which is held by reference."""
+        super().__init__()
+        self.rows = rows
+        self._started_on = {}  # type: Dict[str, str]
+
+    def GetNumberRows(self) -> int:
+        return len(self.rows)
+
+    def GetNumberCols(self) -> int:
+        return len(self.col_labels)
+
+    def GetValue(self, row: int, col: int) -> str:
+        value = self.rows[row][col]
+        if col == 2 and value:
+            # Format each saved ISO datetime the first time it is drawn
+            if value not in self._started_on:
+                self._started_on[value] = _format_started_on(value)
+            value = self._started_on[value]
+        return value
+
+    def SetValue(self, row: int, col: int, value: str):
+        pass  # Saved extractions are read-only
+
+    def IsEmptyCell(self, row: int, col: int) -> bool:
+        return False
+
+    def GetColLabelValue(self, col: int) -> str:
+        return self.col_labels[col]
+
+    def row(self, row: int) -> List[str]:
+        """Return the raw saved values of a row, without a wx round trip."""
+        return self.rows[row]
+
+    def DeleteRows(self, pos: int = 0, numRows: int = 1) -> bool:
+        """Remove rows from the table and tell the grid they are gone."""
+        del self.rows[pos:pos + numRows]
+        message = wx.grid.GridTableMessage(
+            self, wx.grid.GRIDTABLE_NOTIFY_ROWS_DELETED, pos, numRows)
+        self.GetView().ProcessTableMessage(message)
+        return True
+
+    def set_rows(self, rows: List[List[str]]):
+        """Replace all rows, resizing and repainting the attached grid."""
+        old_count, new_count = len(self.rows), len(rows)
+        self.rows = rows
+        view = self.GetView()
+        if new_count < old_count:
+            view.ProcessTableMessage(wx.grid.GridTableMessage(
+                self, wx.grid.GRIDTABLE_NOTIFY_ROWS_DELETED,
+                new_count, old_count - new_count))
+        elif new_count > old_count:
+            view.ProcessTableMessage(wx.grid.GridTableMessage(
+                self, wx.grid.GRIDTABLE_NOTIFY_ROWS_APPENDED,
+                new_count - old_count))
+        view.ProcessTableMessage(wx.grid.GridTableMessage(
+            self, wx.grid.GRIDTABLE_REQUEST_VIEW_GET_VALUES))
+
+
 class ContinueExtractionDialog(DefaultDialog):
     """A dialog window to view and continue partially completed extractions."""
 
@@ -4089,6 +3839,7 @@ class ContinueExtractionDialog(DefaultDialog):
         # Dialog window objects
         self.sizer = wx.BoxSizer(wx.VERTICAL)
         self.grid = None  # type: wx.grid.Grid
+        self.table = None  # type: SavedExtractsTable
 
         # Begin building components of this window
         title = wx.StaticText(self, label="Continue Extraction")
@@ -4191,7 +3942,7 @@ class ContinueExtractionDialog(DefaultDialog):
             wx.MessageBox('No row(s) selected for deletion.',
                           'Error', style=wx.ICON_ERROR)
             return
-        elif self.grid.GetCellValue(0, 0) == 'No saved extractions':
+        elif self.table.row(0)[0] == 'No saved extractions':
             wx.MessageBox('No saved extractions available to delete.',
                           'Info', style=wx.ICON_EXCLAMATION)
             return
@@ -4208,93 +3959,78 @@ class ContinueExtractionDialog(DefaultDialog):
         if answer == wx.ID_YES:
             # Remove each row from local database, filepath, and this grid
             # Delete rows in reverse order to avoid IndexErrors.
-            for row in reversed(selected_rows):
-                extract_id = self.grid.GetCellValue(row, 0)
-                request_id = self.grid.GetCellValue(row, 1)
-                working_dir = self.parent.configs["working_directory"]
-                package = os.path.join(working_dir, request_id,
+            rows_desc = sorted(selected_rows, reverse=True)
+            working_dir = self.parent.configs["working_directory"]
+            targets = [tuple(self.table.row(row)[:2]) for row in rows_desc]
+            for extract_id, request_id in targets:
+                package_folder = os.path.join(working_dir, request_id)
+                package = os.path.join(package_folder,
                                        _package_name(extract_id))
 
                 # Delete saved extraction from database and local machine
                 self.config_db.delete_saved_extract(extract_id)
-                if os.path.exists(package):
+                try:
                     os.remove(package)
+                except FileNotFoundError:
+                    pass
 
                 # Delete RequestID folder for extraction if its now empty
-                package_folder = os.path.join(working_dir, request_id)
-                if os.path.exists(package_folder):
-                    if not os.listdir(package_folder):
+                if _is_empty_dir(package_folder):
+                    try:
                         os.rmdir(package_folder)
+                    except OSError:
+                        pass  # Folder was removed or refilled meanwhile
+
+            # Remove only the deleted rows, bottom-up so indices stay valid
+            self.grid.BeginBatch()
+            try:
+                for row in rows_desc:
+                    self.grid.DeleteRows(pos=row, numRows=1)
+            finally:
+                self.grid.EndBatch()
 
-        # De-select rows and rebuild the grid panel
+        # De-select rows; reload only to show the empty-grid message
         self.selected_row = None
-        self.init_grid_panel()
+        self.grid.ClearSelection()
+        if not self.grid.GetNumberRows():
+            self.init_grid_panel()
 
     def reupload_button_pressed(self, event: wx.Event):
 
+        configs = self.parent.configs
         upload_method = 'MFT_LFU'
-
-        if upload_method == "DIF":
-            message = ('Upload failed\n\n'
-                       'DIF upload method is not supported at this time.')
-            wx.MessageBox(message, 'Error', style=wx.ICON_ERROR)
-            return
-
-        if upload_method not in ['MFT_LFU', 'LFU']:
-            message = (
-                'Upload failed\n\n'
-                'Unknown upload method in ECF:  {method}. Please '
-                'contact the PyExtract support team for help.'
-            ).format(method=upload_method)
-            wx.MessageBox(message, 'Error', style=wx.ICON_ERROR)
+        try:
+            kwargs = _build_upload_kwargs(configs, self.parent.ecf_data,
+                                          upload_method)
+        except UploadConfigError as error:
+            wx.MessageBox(error.text, 'Error', style=wx.ICON_ERROR)
             return
-
-        # Collect kwargs needed to run the upload in another thread
-        kwargs = {
-            'parent': self,
-            'upload_method': upload_method,
-            'sftp_port': self.parent.configs['sftp_port'],
-            'rename_wait': self.parent.configs['rename_wait']
-        }
-
-        # Determine location for upload. Use the Production server
-        # based on 'Territory' value from the ECF if a production
-        # build, or use user-selected Config value if QA build.
-        if config.ALLOW_USER_UPLOAD_LOCATION:
-            kwargs['sftp_location'] = self.parent.configs['sftp_location']
-            kwargs['lfu_location'] = self.parent.configs['lfu_location']
-        else:
-            territory = self.parent.ecf_data["Territory"]
-            if territory.upper() not in ('WEST', 'CENTRAL'):
-                message = (
-                    'Upload failed\n\n'
-                    'Invalid Territory value in ECF ("{territory}"). '
-                    'Only the "West" and "Central" territories are '
-                    'supported for production use.'
-                ).format(territory=territory)
-                wx.MessageBox(message, 'Error', style=wx.ICON_ERROR)
-                return
-            kwargs['sftp_location'] = 'PROD-' + territory.upper()
-            kwargs['lfu_location'] = 'PROD-' + territory.upper()
+        kwargs['parent'] = self
 
         selected_rows = self.grid.GetSelectedRows()
         if len(selected_rows) > 1:
             self.msg = wx.MessageBox("Please select a single row.")
             return
+        if not selected_rows:
+            return  # Nothing selected to upload
+
+        row = selected_rows[0]
+        extract_id, request_id = self.table.row(row)[:2]
+        package = os.path.join(configs["working_directory"], request_id,
+                               _package_name(extract_id))
+
         LOGGER.info('Beginning to upload package using %s method...',
                     upload_method)
-        for row in reversed(selected_rows):
-            extract_id = self.grid.GetCellValue(row, 0)
-            request_id = self.grid.GetCellValue(row, 1)
-            working_dir = self.parent.configs["working_directory"]
-            package = os.path.join(working_dir, request_id,
-                                   _package_name(extract_id))
+        kwargs["package_path"] = package
+        self.package_path = package
+        self.upload_thread = UploadPackageThread(**kwargs)
+        # Queued before the thread starts, so it runs before the done event
+        wx.CallAfter(self._show_upload_busy)
+        self.upload_thread.start()
 
-            kwargs["package_path"] = package
-            self.package_path = package
-            self.busy_info = wx.BusyInfo("Uploading Package...")
-            self.upload_thread = UploadPackageThread(**kwargs)
-            self.upload_thread.start()
+    def _show_upload_busy(self):
+        """Show the busy box while the package is being uploaded."""
+        self.busy_info = wx.BusyInfo("Uploading Package...")
 
     def upload_feedback(self, event: wx.Event):
         """Will call the appropriate message if upload was a success/failure
@@ -4312,7 +4048,7 @@ class ContinueExtractionDialog(DefaultDialog):
 
     def cell_clicked(self, event: wx.grid.GridEvent):
         """Save selected row so the Next button can continue workflow."""
-        extract_id = self.grid.GetCellValue(event.Row, 0)
+        extract_id = self.table.row(event.Row)[0]
         if extract_id != 'No saved extractions':
             self.next_button.Enable(True)
         self.selected_row = event.Row
@@ -4320,12 +4056,10 @@ class ContinueExtractionDialog(DefaultDialog):
 
     def cell_double_clicked(self, event: wx.grid.GridEvent):
         """Continue extract workflow for the row that was double-clicked."""
-        extract_id = self.grid.GetCellValue(event.Row, 0)
+        extract_id, request_id, _, _, connector, ecf_path = \
+            self.table.row(event.Row)
         if extract_id != 'No saved extractions':
             self.next_button.Enable(True)
-        request_id = self.grid.GetCellValue(event.Row, 1)
-        connector = self.grid.GetCellValue(event.Row, 4)
-        ecf_path = self.grid.GetCellValue(event.Row, 5)
         self._parse_grid_row_data(extract_id, request_id, connector, ecf_path)
 
     def _parse_grid_row_data(self, extract_id: str, request_id: str,
@@ -4334,7 +4068,7 @@ class ContinueExtractionDialog(DefaultDialog):
         if extract_id == 'No saved extractions':
             return  # No action needed
 
-        if not os.path.exists(ecf_path):
+        if not _stat_exists(ecf_path):
             # Original ECF deleted, prompt user to unzip ECF from package
             if not self.prompt_to_restore_ecf(ecf_path):
                 return  # User elects not to restore from package
@@ -4344,8 +4078,13 @@ class ContinueExtractionDialog(DefaultDialog):
             request_dir = os.path.join(working_dir, request_id)
             package_path = os.path.join(request_dir, _package_name(extract_id))
 
-            if not os.path.exists(package_path):
-                # Package does not exist, user must restart
+            # Unzip ECF from the data package and move it to old location
+            saved_ecf = os.path.join(request_dir, os.path.basename(ecf_path))
+            try:
+                common.unzip_package(package_path, request_dir, filetype='.ecf')
+                os.replace(saved_ecf, ecf_path)
+            except FileNotFoundError:
+                # Package (or the ECF inside it) does not exist, must restart
                 message = (
                     'Could not find data package to continue at "{}". '
                     'Please restart this extraction.'
@@ -4353,32 +4092,24 @@ class ContinueExtractionDialog(DefaultDialog):
                 wx.MessageBox(message, 'Error', style=wx.ICON_ERROR)
                 return
 
-            # Unzip ECF from the data package and move it to old location
-            common.unzip_package(package_path, request_dir, filetype='.ecf')
-            saved_ecf = os.path.join(request_dir, os.path.basename(ecf_path))
-            os.rename(saved_ecf, ecf_path)
-
         # If continuing an ABAP extraction, begin second part of that
         # workflow in a different dialog window.
         if "ABAP" in connector:
             self.parent.configs["ecf_file_path"] = ecf_path
             self.EndModal(0)
             self.parent.dialogs['ecf'].filepicker.SetPath(ecf_path)
-            self.parent.dialogs['abap'].extract_id = extract_id
-            self.parent.dialogs['abap'].ecf_request_id = request_id
-            self.parent.dialogs['abap'].ecf_path = ecf_path
+            abap = self.parent.dialogs['abap']
+            abap.extract_id = extract_id
+            abap.ecf_request_id = request_id
+            abap.ecf_path = ecf_path
             self.parent.begin_extract_workflow(extract_id=extract_id,
                                                return_code=9)  # ABAP
             return
 
-        # Begin parsing the ECF file
-        self.parent.busy_info = wx.BusyInfo("Processing ECF...")
-        thread = ParseECFThread(self.parent, ecf_path)
-        thread.start()
-
-        # Leave this modal and go to pre-filled 'ECF Selection' dialogs
+        # Begin parsing the ECF file, then leave this modal and go to
+        # pre-filled 'ECF Selection' dialogs
+        self.parent.validate_ecf(ecf_path)
         self.parent.continuing_extraction = True
-        self.parent.configs["ecf_file_path"] = ecf_path
         self.EndModal(0)
         self.parent.dialogs['extraction'].is_paused = True
         self.parent.dialogs['ecf'].filepicker.SetPath(ecf_path)
@@ -4399,10 +4130,8 @@ class ContinueExtractionDialog(DefaultDialog):
         """When the 'Next' button is pressed, start extracting from current row."""
         if self.selected_row is None:
             return
-        extract_id = self.grid.GetCellValue(self.selected_row, 0)
-        request_id = self.grid.GetCellValue(self.selected_row, 1)
-        connector = self.grid.GetCellValue(self.selected_row, 4)
-        ecf_path = self.grid.GetCellValue(self.selected_row, 5)
+        extract_id, request_id, _, _, connector, ecf_path = \
+            self.table.row(self.selected_row)
         self._parse_grid_row_data(extract_id, request_id, connector, ecf_path)
 
     def cancel_button_pressed(self, event: wx.Event):
@@ -4411,18 +4140,64 @@ class ContinueExtractionDialog(DefaultDialog):
 
     def init_grid_panel(self):
         """Create the grid of ECFs/Extracts available to Continue from."""
-        self.grid_panel.DestroyChildren()
-        self.grid = wx.grid.Grid(self.grid_panel)
+        if self.grid is not None:
+            self.refresh_saved_data()
+            return
+        # Freeze so the new grid and its settings paint once
+        self.grid_panel.Freeze()
+        try:
+            self._build_grid()
+        finally:
+            self.grid_panel.Thaw()
+
+    def refresh_saved_data(self):
+        """Reload saved extractions into the existing grid in place."""
+        self.grid.ClearSelection()
+        self.grid.BeginBatch()
+        try:
+            self.table.set_rows(self._load_saved_rows())
+        finally:
+            self.grid.EndBatch()
 
-        # Create the grid to display saved extraction data
+    def _load_saved_rows(self) -> List[List[str]]:
+        """Return grid rows of saved extractions and update button states."""
         saved_data = self.config_db.all_saved_extract_data()
         if saved_data:
-            num_rows = len(saved_data)
-        else:
-            num_rows = 1
+            self.delete_button.Enable()
+            return [list(each_query) for each_query in saved_data]
+        self.delete_button.Disable()
+        self.next_button.Disable()
         num_columns = len(ConfigDatabase.ecf_cols) - 1
-        self.grid.CreateGrid(num_rows, num_columns)
+        return [['No saved extractions'] + [''] * (num_columns - 1)]
+
+    def _build_grid(self):
+        """Build the grid of saved extractions and its virtual table."""
+        self.grid = wx.grid.Grid(self.grid_panel)
+
+        # Serve saved extraction data to the grid as rows are drawn, and
+        # batch the settings so the grid lays out and paints only once
+        self.grid.BeginBatch()
+        try:
+            self.table = SavedExtractsTable(self._load_saved_rows())
+            self.grid.SetTable(self.table, True)
+            self._configure_grid()
+        finally:
+            self.grid.EndBatch()
+
+        # Sizer to fit grid
+        grid_sizer = wx.BoxSizer(wx.VERTICAL)
+        grid_sizer.Add(self.grid, 1, wx.ALL|wx.EXPAND, 5)
+
+        self.grid_panel.SetSizer(grid_sizer)
+        self.grid_panel.Layout()
+        grid_sizer.Fit(self.grid_panel)
+
+        self.grid.Bind(wx.grid.EVT_GRID_CELL_LEFT_CLICK, self.cell_clicked)
+        self.grid.Bind(wx.grid.EVT_GRID_CELL_LEFT_DCLICK,
+                       self.cell_double_clicked)
 
+    def _configure_grid(self):
+        """Apply the fixed layout and behaviour settings of the grid."""
         self.grid.EnableEditing(False)
         self.grid.EnableGridLines(True)
         self.grid.SetGridLineColour(wx.SystemSettings.GetColour(wx.SYS_COLOUR_3DDKSHADOW))
@@ -4440,12 +4215,6 @@ class ContinueExtractionDialog(DefaultDialog):
         self.grid.EnableDragColMove(False)
         self.grid.EnableDragColSize(True)
         self.grid.SetColLabelSize(25)
-        self.grid.SetColLabelValue(0, 'Extraction ID')
-        self.grid.SetColLabelValue(1, 'Request ID')
-        self.grid.SetColLabelValue(2, 'Started On')
-        self.grid.SetColLabelValue(3, 'Data Server')
-        self.grid.SetColLabelValue(4, 'Data Connector')
-        self.grid.SetColLabelValue(5, 'ECF File Path')
         self.grid.SetColLabelAlignment(wx.ALIGN_LEFT, wx.ALIGN_BOTTOM)
 
         # Rows
@@ -4453,37 +4222,8 @@ class ContinueExtractionDialog(DefaultDialog):
         self.grid.SetRowLabelSize(50)
         self.grid.SetRowLabelAlignment(wx.ALIGN_CENTRE, wx.ALIGN_CENTRE)
 
-        # Sizer to fit grid
-        grid_sizer = wx.BoxSizer(wx.VERTICAL)
-
         # Cell Defaults
         self.grid.SetDefaultCellAlignment(wx.ALIGN_LEFT, wx.ALIGN_TOP)
-        grid_sizer.Add(self.grid, 1, wx.ALL|wx.EXPAND, 5)
-
-        # Cell Data
-        if saved_data:
-            self.delete_button.Enable()
-            for row, each_query in enumerate(saved_data):
-                for col, value in enumerate(each_query):
-                    if col == 2:  # Started On Date
-                        # Convert saved ISO datetime into human readable
-                        dtval = datetime.strptime(value.split('.')[0], "%Y-%m-%dT%H:%M:%S")
-                        value = datetime.strftime(dtval, '%Y-%m-%d @ %I:%M%p').lower()
-                    self.grid.SetCellValue(row, col, value)
-        else:
-            self.delete_button.Disable()
-            self.grid.SetCellValue(0, 0, 'No saved extractions')
-
-        self.grid_panel.SetSizer(grid_sizer)
-        self.grid_panel.Layout()
-        grid_sizer.Fit(self.grid_panel)
-
-        self.grid.Bind(wx.grid.EVT_GRID_CELL_LEFT_CLICK, self.cell_clicked)
-        self.grid.Bind(wx.grid.EVT_GRID_CELL_LEFT_DCLICK,
-                       self.cell_double_clicked)
-
-        if self.grid.GetCellValue(0, 0) == 'No saved extractions':
-            self.next_button.Disable()
 
 
 class ABAPOutputSelectionDialog(DefaultDialog):
@@ -4545,6 +4285,7 @@ class ABAPOutputSelectionDialog(DefaultDialog):
         self.abap_output_dirpicker = wx.DirPickerCtrl(folder_panel,
                                                       message="Select a folder")
         self.abap_output_dirpicker.SetBackgroundColour(wx.Colour(255, 255, 255))
+        self._abap_output_path = ''
 
         folder_sizer.Add(self.abap_output_dirpicker, 1, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
 
@@ -4566,7 +4307,7 @@ class ABAPOutputSelectionDialog(DefaultDialog):
 
         guide_label = wx.StaticText(guide_panel, label="Guide")
         guide_label.Wrap(-1)
-        guide_label.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 90, 92))
+        guide_label.SetFont(FONT_BOLD_LABEL)
 
         guide_sizer.Add(guide_label, 0, wx.ALL|wx.ALIGN_CENTER_HORIZONTAL, 5)
 
@@ -4638,10 +4379,8 @@ class ABAPOutputSelectionDialog(DefaultDialog):
 
     def abap_output_changed(self, event):
         """Enable the Next button when text is entered for ABAP output."""
-        if self.abap_output_dirpicker.GetPath != "":
-            self.next_button.Enable()
-        else:
-            self.next_button.Disable()
+        self._abap_output_path = self.abap_output_dirpicker.GetPath()
+        self.next_button.Enable(bool(self._abap_output_path))
 
     def cancel_button_pressed(self, event):
         """Return to the Extract home page."""
@@ -4655,10 +4394,10 @@ class ABAPOutputSelectionDialog(DefaultDialog):
         """Validate the ABAP folder selected in a new thread."""
         self.busy_info = wx.BusyInfo("Validating folder selection...")
 
-        if self.abap_output_dirpicker.GetPath() != "":
+        if self._abap_output_path:
             thread = ValidateABAPFolderThread(
                 self,
-                self.abap_output_dirpicker.GetPath(),
+                self._abap_output_path,
                 self.extract_id,
                 self.ecf_request_id,
                 self.ecf_path
@@ -4675,7 +4414,7 @@ class ABAPOutputSelectionDialog(DefaultDialog):
             self.extract_id = results["extract_id"]
             self.ecf_request_id = results["ecf_request_id"]
             self.ecf_path = results["ecf_path"]
-            self.parent.ecf_data = pyextract.read_encrypted_json(results["ecf_path"])
+            self.parent.ecf_data = results["ecf_data"]
             self.parent.dialogs['connection'] = self
             wx.MessageBox('Please note that ABAP extractions cannot be paused. '
                           'Any paused or canceled extraction will be restarted '
@@ -4709,6 +4448,15 @@ class ValidateABAPFolderThread(threading.Thread):
 
     def run(self):
         """Validate an ABAP folder by instantiating a messenger."""
+        if not has_fil_files(self.folder_path):
+            # Bail out before the messenger globs and stats the whole folder
+            response = {
+                "messenger": None,
+                "status": NO_FIL_FILES_MESSAGE,
+            }
+            _post_result(self.parent, ABAPValidEvent, response=response)
+            return
+
         messenger = ABAPMessenger(
             folder=self.folder_path,
             ecf_requestid=self.ecf_request_id
@@ -4722,6 +4470,7 @@ class ValidateABAPFolderThread(threading.Thread):
                 "extract_id": self.extract_id,
                 "ecf_request_id": self.ecf_request_id,
                 "ecf_path": self.ecf_path,
+                "ecf_data": pyextract.read_encrypted_json(self.ecf_path),
             }
         except Exception as error:
             response = {
@@ -4729,9 +4478,7 @@ class ValidateABAPFolderThread(threading.Thread):
                 "status": str(error),
             }
 
-        event = ABAPValidEvent()
-        event.response = response
-        wx.PostEvent(self.parent, event)
+        _post_result(self.parent, ABAPValidEvent, response=response)
 
 
 GetConnectionDoneEvent, EVT_GETCONNECTION_DONE = NewEvent()
@@ -4749,18 +4496,14 @@ class GetConnectionThread(threading.Thread):
     def run(self):
         """Try to instantiate a Messenger object, posting status afterward."""
 
-        # Does ECF use Data Services?
-        uses_ds = False
+        # Does ECF use Data Services and/or BBP?
+        uses_ds = uses_bbp = False
         for query in self.parent.parent.ecf_data["Queries"]:
             if "FunctionModule" not in query:
                 uses_ds = True
-                break
-
-        # Does ECF use BBP?
-        uses_bbp = False
-        for query in self.parent.parent.ecf_data["Queries"]:
-            if "FunctionModule" in query and query["FunctionModule"] == "BBP_RFC_READ_TABLE":
+            elif query["FunctionModule"] == "BBP_RFC_READ_TABLE":
                 uses_bbp = True
+            if uses_ds and uses_bbp:
                 break
 
         try:
@@ -4808,44 +4551,9 @@ class GetConnectionThread(threading.Thread):
                     "messenger": messenger,
                     "connection_args": self.connection_args
                 }
-            elif self.data_server == "Oracle RDBMS":
-                messenger = pyextract.connect.oracle.OracleMessenger(
-                    **self.connection_args
-                )
-                response = {
-                    "status": "success",
-                    "message": None,
-                    "connection_type": self.connection_type,
-                    "messenger": messenger,
-                    "connection_args": self.connection_args
-                }
-            elif self.data_server == "MSSQL RDBMS":
-                messenger = pyextract.connect.mssql.MSSQLMessenger(
-                    **self.connection_args
-                )
-                messenger.validate_schema()
-                response = {
-                    "status": "success",
-                    "message": None,
-                    "connection_type": self.connection_type,
-                    "messenger": messenger,
-                    "connection_args": self.connection_args
-                }
-            elif self.data_server == "DB2 RDBMS":
-                messenger = pyextract.connect.db2.DB2Messenger(
-                    **self.connection_args
-                )
-                response = {
-                    "status": "success",
-                    "message": None,
-                    "connection_type": self.connection_type,
-                    "messenger": messenger,
-                    "connection_args": self.connection_args
-                }
-            elif self.data_server == "MYSQL RDBMS":
-                messenger = pyextract.connect.mysql.MySQLMessenger(
-                    **self.connection_args
-                )
+            elif self.data_server in _RDBMS_CONNECTORS:
+                connect = _RDBMS_CONNECTORS[self.data_server]
+                messenger = connect(self.connection_args)
                 response = {
                     "status": "success",
                     "message": None,
@@ -4859,9 +4567,7 @@ class GetConnectionThread(threading.Thread):
                 "message": clean_connection_error(traceback.format_exc()),
             }
 
-        event = GetConnectionDoneEvent()
-        event.response = response
-        wx.PostEvent(self.parent, event)
+        _post_result(self.parent, GetConnectionDoneEvent, response=response)
 
 
 FirstHundredDoneEvent, EVT_FIRSTHUNDRED_DONE = NewEvent()
@@ -4890,7 +4596,7 @@ class FirstHundredThread(threading.Thread):
                 ecf_data=self.ecf_data
             )
 
-            if self.server in ("Oracle RDBMS", "SQL RDBMS", "DB2 RDBMS", "MYSQL RDBMS"):
+            if self.server in _RDBMS_SERVERS:
                 self.messenger.begin_extraction(metadata, chunk_size=50)
                 orig_data = self.messenger.continue_extraction(50)
                 self.messenger.finish_extraction()
@@ -4919,14 +4625,8 @@ class FirstHundredThread(threading.Thread):
             }
         else:
             # Convert Everything to str and combine into response JSON
-            data = []
-            for row in orig_data:
-                row_data = []
-                for col in row:
-                    if col is None:
-                        col = 'Null'
-                    row_data.append(str(col))
-                data.append(row_data)
+            data = [['Null' if col is None else str(col) for col in row]
+                    for row in orig_data]
 
             response = {
                 "status": "success",
@@ -4936,20 +4636,40 @@ class FirstHundredThread(threading.Thread):
             }
 
         # Post event with success or error data back to the main thread
-        event = FirstHundredDoneEvent()
-        event.response = response
-        wx.PostEvent(self.parent, event)
+        _post_result(self.parent, FirstHundredDoneEvent, response=response)
+
+
+class _PooledThread(abc.ABC):
+    """Thread-like background job that runs on the shared GUI worker pool."""
+
+    def __init__(self):
+        """Return a job that has not been submitted yet."""
+        self._future = None  # type: Future
+
+    def start(self):
+        """Submit `run` to the worker pool, like Thread.start()."""
+        self._future = _GUI_EXECUTOR.submit(self.run)
+        self._future.add_done_callback(_log_job_error)
+
+    def is_alive(self) -> bool:
+        """Return True while the job is queued or running."""
+        return self._future is not None and not self._future.done()
+
+    @abc.abstractmethod
+    def run(self):
+        """Work to do on the pool; implemented by each job."""
 
 
 ExtractionDoneEvent, EVT_EXTRACTION_DONE = NewEvent()
-class ExtractThread(threading.Thread):
+class ExtractThread(_PooledThread):
     """A thread that runs the primary data extraction routine."""
 
     def __init__(self, parent: wx.Dialog, progress_bar: wx.Gauge,
                  resume_extract: bool, source, callback_error,
                  chunk_results, chunk_size, ecf_file, output_folder,
                  package_name, queue_size, row_limit, sqlite_password,
-                 stopevent, worker_timeout, sap_batch_size, max_readers):
+                 stopevent, worker_timeout, sap_batch_size, max_readers,
+                 ecf_meta: list = None):
         """Return a new thread ready to run an extraction."""
         super().__init__()
         self.parent = parent
@@ -4960,6 +4680,7 @@ class ExtractThread(threading.Thread):
         self.chunk_results = chunk_results
         self.chunk_size = chunk_size
         self.ecf_file = ecf_file
+        self.ecf_meta = ecf_meta
         self.output_folder = output_folder
         self.package_name = package_name
         self.queue_size = queue_size
@@ -4970,6 +4691,10 @@ class ExtractThread(threading.Thread):
         self.worker_timeout = worker_timeout
         self.sap_batch_size = sap_batch_size
 
+        # Classify the source once, while the button click is handled
+        self._build_stream = _STREAM_FACTORY.get(type(source).__name__,
+                                                 _build_default_stream)
+
     def run(self):
         """Run the main extraction function, then post a 'Done' event."""
         delete_old_extract_databases(self.output_folder)
@@ -4982,53 +4707,15 @@ class ExtractThread(threading.Thread):
                 LOGGER.warning('Extraction will be restarted completely.')
             else:
                 LOGGER.info('Restoring data and logs from saved extraction.')
-                common.unzip_package(package_path, self.output_folder, filetype='.dat')
-                common.unzip_package(package_path, self.output_folder, filetype='.log')
+                common.unzip_package(package_path, self.output_folder,
+                                     filetype=('.dat', '.log'))
 
         # Translate the unique GUI password into a SQLite messenger
         output = common._messenger_from_password(self.sqlite_password,
                                           self.output_folder)
 
         # Create a stream object to manage data flow from the source Messenger
-
-        if 'SAPMessenger' in str(type(self.source)):
-            stream = pyextract.streams.sapstream.SAPStream(
-                messenger=self.source,
-                batch_size=self.sap_batch_size,
-                chunk_size=self.chunk_size,
-                queue_size=self.queue_size,
-                max_readers=self.max_readers,
-                row_limit=self.row_limit,
-                stopevent=self.stopevent,
-                chunk_results=self.chunk_results,
-                output=output,
-            )
-        else:
-            ecf_ed = pyextract.ecfreader.get_ecf_meta_data(self.ecf_file)
-            if len(ecf_ed) > 0:
-                if isinstance(ecf_ed[0].query_text, dict):
-
-                    stream = pyextract.ODBCStream(
-                        messenger=self.source,
-                        batch_size=self.sap_batch_size,
-                        chunk_size=self.chunk_size,
-                        queue_size=self.queue_size,
-                        max_readers=self.max_readers,
-                        row_limit=self.row_limit,
-                        stopevent=self.stopevent,
-                        chunk_results=self.chunk_results,
-                        output=output,
-                    )
-                else:
-                    stream = pyextract.DataStream(
-                        messenger=self.source,
-                        chunk_size=self.chunk_size,
-                        queue_size=self.queue_size,
-                        row_limit=self.row_limit,
-                        stopevent=self.stopevent,
-                    )
-            else:
-                stream = None
+        stream = self._build_stream(self, output)
 
         LOGGER.info("PX Version: v{}".format(version.EXTRACT_VERSION))
         LOGGER.info("Active Configuration: {}".format(self.parent.parent.configs))
@@ -5047,15 +4734,13 @@ class ExtractThread(threading.Thread):
                         sqlite_password=self.sqlite_password)
 
         # Post an event after extraction is complete
-        event = ExtractionDoneEvent()
-        event.package_path = package_path
-        event.errors = errors
-        event.warnings = warnings
-        wx.PostEvent(self.parent, event)
+        _post_result(self.parent, ExtractionDoneEvent,
+                     package_path=package_path, errors=errors,
+                     warnings=warnings)
 
 
 ECFParseDoneEvent, EVT_ECFPARSE_DONE = NewEvent()
-class ParseECFThread(threading.Thread):
+class ParseECFThread(_PooledThread):
     """A separate thread in which to parse an encrypted ECF file."""
 
     def __init__(self, parent: wx.Frame, filepath: str):
@@ -5067,8 +4752,12 @@ class ParseECFThread(threading.Thread):
     def run(self):
         """To to parse an ECF, raising an error if a failure occurs."""
         try:
-            orig_ecf = pyextract.read_encrypted_json(self.filepath)
-            ecf_meta_data = pyextract.get_ecf_meta_data(self.filepath)
+            # Decrypt once; metadata parsing normalizes its own copy
+            status = {}
+            orig_ecf = pyextract.read_encrypted_json(self.filepath,
+                                                     status=status)
+            ecf_meta_data = pyextract.get_ecf_meta_data(
+                self.filepath, ecfjson=copy.deepcopy(orig_ecf), status=status)
         except Exception as error:
             response = {
                 "status": (str(error) + ' Please select a valid ECF file '
@@ -5078,16 +4767,15 @@ class ParseECFThread(threading.Thread):
             response = {
                 "status": "success",
                 "orig_ecf": orig_ecf,
-                "ecf_meta_data": ecf_meta_data
+                "ecf_meta_data": ecf_meta_data,
+                "ecf_path": self.filepath,
             }
 
-        event = ECFParseDoneEvent()
-        event.response = response
-        wx.PostEvent(self.parent, event)
+        _post_result(self.parent, ECFParseDoneEvent, response=response)
 
 
 QueryValidateDoneEvent, EVT_QUERY_VALIDATE = NewEvent()
-class ValidateQueriesThread(threading.Thread):
+class ValidateQueriesThread(_PooledThread):
     """A separate thread to validate queries from an ECF file."""
 
     def __init__(self, parent: wx.Frame, ecf_meta_data: list,
@@ -5122,17 +4810,16 @@ class ValidateQueriesThread(threading.Thread):
                 "data_server": self.data_server,
             }
 
-        event = QueryValidateDoneEvent()
-        event.response = response
-        wx.PostEvent(self.parent, event)
+        _post_result(self.parent, QueryValidateDoneEvent, response=response)
 
 
 UploadDoneEvent, EVT_UPLOAD_DONE = NewEvent()
-class UploadPackageThread(threading.Thread):
+class UploadPackageThread(_PooledThread):
     """A separate thread to upload a completed extraction package"""
 
     def __init__(self, parent: wx.Frame, upload_method: str,
-                 sftp_location: str, lfu_location: str, sftp_port: str, rename_wait: str, package_path=None):
+                 sftp_location: str, lfu_location: str, sftp_port: str, rename_wait: str,
+                 lfu_chunk_size: str, package_path=None):
         super().__init__()
         self.parent = parent
         self.upload_method = upload_method
@@ -5140,6 +4827,7 @@ class UploadPackageThread(threading.Thread):
         self.lfu_location = lfu_location
         self.sftp_port = int(sftp_port)
         self.rename_wait = int(rename_wait)
+        self.lfu_chunk_size = int(lfu_chunk_size) * 1024 * 1024
         if package_path:
             self.package_path = package_path
         else:
@@ -5171,9 +4859,7 @@ class UploadPackageThread(threading.Thread):
 
         response['method'] = ultimate_method
 
-        event = UploadDoneEvent()
-        event.response = response
-        wx.PostEvent(self.parent, event)
+        _post_result(self.parent, UploadDoneEvent, response=response)
 
     def try_upload_sftp(self) -> dict:
         """Upload to PwC using the SFTP method"""
@@ -5202,7 +4888,7 @@ class UploadPackageThread(threading.Thread):
         LOGGER.info('Attempting LFU upload to host "%s"', kwargs['host'])
         try:
             client = pyextract.LFUClient(**kwargs)
-            client.send(self.package_path, chunk_size=1000000)
+            client.send(self.package_path, chunk_size=self.lfu_chunk_size)
         except Exception as error:
             response = {
                 "status": error,
@@ -5216,6 +4902,21 @@ class UploadPackageThread(threading.Thread):
         return response
 
 
+class _LazyDialogs(dict):
+    """Dict of dialog windows that builds each dialog on first lookup."""
+
+    def __init__(self, dialog_classes: Dict[str, type], parent: wx.Frame):
+        """Return an empty mapping that can build the given dialogs."""
+        super().__init__()
+        self._dialog_classes = dialog_classes
+        self._parent = parent
+
+    def __missing__(self, key: str) -> wx.Dialog:
+        dialog = self._dialog_classes[key](self._parent)
+        self[key] = dialog
+        return dialog
+
+
 class PyExtract(wx.Frame):
     """Top-level parent object that controls the entire GUI."""
 
@@ -5240,6 +4941,7 @@ class PyExtract(wx.Frame):
         self.data_server = None  # type: str
         self.ecf_data = None
         self.ecf_meta_data = None
+        self.ecf_meta_path = None  # type: str
 
         # GUI objects
         self.sizer = wx.BoxSizer(wx.VERTICAL)
@@ -5247,8 +4949,8 @@ class PyExtract(wx.Frame):
         main_panel_sizer = wx.BoxSizer(wx.VERTICAL)
 
         # Logo
-        bitmap = wx.Image(_resource_path('assets/pwc-logo.png')).ConvertToBitmap()
-        logo = wx.StaticBitmap(self.main_panel, label=bitmap,
+        logo = wx.StaticBitmap(self.main_panel,
+                               label=_resource_bitmap('assets/pwc-logo.png'),
                                size=wx.Size(-1, 225))
         main_panel_sizer.Add(logo, 1, wx.ALL|wx.ALIGN_CENTER_HORIZONTAL, 15)
 
@@ -5282,73 +4984,22 @@ class PyExtract(wx.Frame):
         main_panel_sizer.Fit(self.main_panel)
         self.sizer.Add(self.main_panel, 1, wx.EXPAND|wx.ALL, 5)
 
-        # Panel at bottom with [Configs] button and Version #
+        # Panel at bottom with [Configs] button and Version #, laid out
+        # by a single sizer instead of nested alignment panels
         bottom_panel = wx.Panel(self)
         bottom_sizer = wx.BoxSizer(wx.HORIZONTAL)
 
-        # Container to align [Config] button on bottom-left of screen
-        config_btn_aligner = wx.Panel(bottom_panel)
-        config_btn_align_sizer = wx.BoxSizer(wx.VERTICAL)
-
-        # Container for the [Config] button
-        configs_panel = wx.Panel(config_btn_aligner)
-        configs_sizer = wx.BoxSizer(wx.HORIZONTAL)
-
-        self.configs_button = wx.Button(configs_panel, label="Configs")
-        configs_sizer.Add(self.configs_button, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
-
-        configs_panel.SetSizer(configs_sizer)
-        configs_panel.Layout()
-        configs_sizer.Fit(configs_panel)
-        config_btn_align_sizer.Add(configs_panel, 1, wx.EXPAND|wx.ALL, 5)
-
-        config_btn_aligner.SetSizer(config_btn_align_sizer)
-        config_btn_aligner.Layout()
-        config_btn_align_sizer.Fit(config_btn_aligner)
-        bottom_sizer.Add(config_btn_aligner, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
-
-        # Panel to align Version # in bottom-right of screen
-        version_align_panel = wx.Panel(bottom_panel)
-        version_align_sizer = wx.BoxSizer(wx.VERTICAL)
+        self.configs_button = wx.Button(bottom_panel, label="Configs")
+        bottom_sizer.Add(self.configs_button, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 15)
 
-        # Version box to vertically align text within (invisible)
-        version_box = wx.Panel(version_align_panel)
-        version_box_sizer = wx.BoxSizer(wx.VERTICAL)
+        bottom_sizer.AddStretchSpacer()
 
-        # Version Text
-        version_panel = wx.Panel(version_box)
-        version_sizer = wx.BoxSizer(wx.VERTICAL)
-
-        version_text = "Extract v{}".format(version.EXTRACT_VERSION)
-
-        version_label = wx.StaticText(version_panel, label=version_text)
-        version_label.Wrap(-1)
+        version_label = wx.StaticText(bottom_panel, label=_VERSION_TEXT)
         version_label.SetFont(FONT_BOLD)
-
-        version_sizer.Add(version_label, 0, wx.ALL|wx.ALIGN_RIGHT, 5)
-
-        version_panel.SetSizer(version_sizer)
-        version_panel.Layout()
-        version_sizer.Fit(version_panel)
-        version_box_sizer.Add(version_panel, 1,
-                              wx.EXPAND|wx.ALL|wx.ALIGN_RIGHT, 5)
-
-        version_box.SetSizer(version_box_sizer)
-        version_box.Layout()
-        version_box_sizer.Fit(version_box)
-        version_align_sizer.Add(version_box, 0,
-                                wx.ALL|wx.ALIGN_RIGHT|wx.ALIGN_CENTER_VERTICAL, 5)
-
-        version_align_panel.SetSizer(version_align_sizer)
-        version_align_panel.Layout()
-        version_align_sizer.Fit(version_align_panel)
-        bottom_sizer.Add(version_align_panel, 1,
-                         wx.EXPAND|wx.ALL|wx.ALIGN_CENTER_VERTICAL, 5)
+        bottom_sizer.Add(version_label, 0, wx.ALL|wx.ALIGN_CENTER_VERTICAL, 20)
 
         bottom_panel.SetSizer(bottom_sizer)
-        bottom_panel.Layout()
-        bottom_sizer.Fit(bottom_panel)
-        self.sizer.Add(bottom_panel, 0, wx.ALL|wx.ALIGN_RIGHT|wx.EXPAND, 5)
+        self.sizer.Add(bottom_panel, 0, wx.ALL|wx.EXPAND, 5)
 
         # End of bottom panel, Beginning of legal text
         line = wx.StaticLine(self)
@@ -5357,22 +5008,13 @@ class PyExtract(wx.Frame):
         legal_panel = wx.Panel(self)
         legal_sizer = wx.BoxSizer(wx.VERTICAL)
 
-        header_text = '- Property of PricewaterhouseCoopers LLP -'
-        header = wx.StaticText(legal_panel, wx.ID_ANY, header_text,
+        header = wx.StaticText(legal_panel, wx.ID_ANY, _HEADER_TEXT,
                                wx.DefaultPosition, wx.DefaultSize, wx.ALIGN_CENTRE)
         header.Wrap(-1)
         header.SetFont(wx.Font(wx.NORMAL_FONT.GetPointSize(), 70, 94, 92))
         legal_sizer.Add(header, 0, wx.ALL|wx.EXPAND, 5)
 
-        disclaimer_text = (''.join([
-                "Copyright {0} 2017 PricewaterhouseCoopers LLP. All rights reserved. ".format(chr(194)+chr(169)),
-                "PricewaterhouseCoopers LLP refers to the US member firm or ",
-                "one of its subsidiaries or affiliates, and may sometimes refer ",
-                "to the PwC network. Each member firm is a separate legal ",
-                "entity. Please see http://www.pwc.com/structure for details."
-            ])
-        )
-        disclaimer = wx.StaticText(legal_panel, label=disclaimer_text,
+        disclaimer = wx.StaticText(legal_panel, label=_DISCLAIMER_TEXT,
                                    style=wx.ALIGN_CENTRE)
         disclaimer.SetMinSize(wx.Size(820, 50))
         disclaimer.SetMaxSize(wx.Size(820, 50))
@@ -5429,22 +5071,32 @@ class PyExtract(wx.Frame):
             pyextract.utils.update_path(os.path.join(ibm_folder, 'clidriver', 'bin'))
 
     def init_dialogs(self):
-        """Instantiate dialog boxes that will be shown during the app."""
-        self.dialogs = {
-            'abap': ABAPOutputSelectionDialog(self),
-            'config': ConfigsDialog(self),
-            'connection': None,  # type: BaseConnectionDialog
-            'content_preview': ContentPreviewDialog(self),
-            'continue_extract': ContinueExtractionDialog(self),
-            'db2': DB2ConnectionDialog(self),
-            'mysql': MySQLConnectionDialog(self),
-            'ecf': ECFSelectionDialog(self),
-            'extraction': ExtractionDialog(self),
-            'manage_conn': ManageSavedConnDialog(self),
-            'mssql': MSSQLConnectionDialog(self),
-            'oracle': OracleConnectionDialog(self),
-            'sap': SAPConnectionDialog(self),
-        }
+        """Prepare dialog boxes that will be shown during the app.
+
+        Each dialog is only built the first time it is looked up, so a
+        workflow that uses one ERP does not construct the others. Dialogs
+        built for a previous workflow are destroyed.
+        """
+        # 'connection' aliases one of the ERP dialogs; destroy each only once
+        for dialog in {id(dlg): dlg for dlg in self.dialogs.values()}.values():
+            if dialog:
+                dialog.Destroy()
+
+        self.dialogs = _LazyDialogs({
+            'abap': ABAPOutputSelectionDialog,
+            'config': ConfigsDialog,
+            'content_preview': ContentPreviewDialog,
+            'continue_extract': ContinueExtractionDialog,
+            'db2': DB2ConnectionDialog,
+            'mysql': MySQLConnectionDialog,
+            'ecf': ECFSelectionDialog,
+            'extraction': ExtractionDialog,
+            'manage_conn': ManageSavedConnDialog,
+            'mssql': MSSQLConnectionDialog,
+            'oracle': OracleConnectionDialog,
+            'sap': SAPConnectionDialog,
+        }, parent=self)
+        self.dialogs['connection'] = None  # type: BaseConnectionDialog
 
     def validate_ecf(self, filepath: str):
         """Begin parsing an ECF when selected from the ECFSelectionDialog."""
@@ -5455,6 +5107,14 @@ class PyExtract(wx.Frame):
 
     def ecf_parse_done(self, event: wx.Event):
         """Event that fires after a thread has parsed an ECF file."""
+        try:
+            self._handle_ecf_parse(event)
+        finally:
+            # Always release the busy cursor started by validate_ecf
+            self.busy_info = None
+
+    def _handle_ecf_parse(self, event: wx.Event):
+        """Load a parsed ECF and prepare the connection dialogs for it."""
         # If ECF parse failed, alert the user and take no further action
         if event.response["status"] != "success":
             self.busy_info = None
@@ -5466,6 +5126,7 @@ class PyExtract(wx.Frame):
         # Get ECF Data from the event sent by ECF Parsing thread
         self.ecf_data = event.response["orig_ecf"]
         self.ecf_meta_data = event.response["ecf_meta_data"]
+        self.ecf_meta_path = event.response["ecf_path"]
 
         if not self.continuing_extraction:
             # If the RequestID for this ECF has already been started during
@@ -5510,61 +5171,9 @@ class PyExtract(wx.Frame):
         self.data_server = data_server
         self.data_connector = data_connector
 
-        if data_server == "SAP Application Server":
-            erp = 'sap'
-            # Set default dialog information for SAP connections
-            self.dialogs['sap'].controls['client'].SetValue("")
-            self.dialogs['sap'].controls['user'].SetValue("")
-            self.dialogs['sap'].controls['password'].SetValue("")
-            self.dialogs['sap'].controls['language'].SetValue("EN")
-            self.dialogs['sap'].controls['ashost'].SetValue("")
-            self.dialogs['sap'].controls['sysnr'].SetValue("")
-            self.dialogs['sap'].connection_type_choice.SetStringSelection(data_connector)
-            self.dialogs['sap'].Layout()
-            self.dialogs['connection'] = self.dialogs['sap']
-        elif data_server == "Oracle RDBMS":
-            erp = 'oracle'
-            # Set default dialog information for Oracle connections
-            self.dialogs['oracle'].controls['host'].SetValue("")
-            self.dialogs['oracle'].controls['port'].SetValue("")
-            self.dialogs['oracle'].controls['orcl_instance_type'].SetSelection(0)
-            self.dialogs['oracle'].controls['orcl_instance_value'].SetValue("")
-            self.dialogs['oracle'].controls['user'].SetValue("")
-            self.dialogs['oracle'].controls['password'].SetValue("")
-            self.dialogs['oracle'].connection_type_choice.SetStringSelection(data_connector)
-            self.dialogs['oracle'].Layout()
-            self.dialogs['connection'] = self.dialogs['oracle']
-        elif data_server == "SQL RDBMS":
-            erp = 'mssql'
-            # Set default dialog information connections
-            self.dialogs['mssql'].controls['host'].SetValue("")
-            self.dialogs['mssql'].controls['database'].SetValue("")
-            self.dialogs['mssql'].connection_type_choice.SetStringSelection(data_connector)
-            self.dialogs['mssql'].Layout()
-            self.dialogs['connection'] = self.dialogs['mssql']
-        elif data_server == "DB2 RDBMS":
-            erp = 'db2'
-            # Set default dialog information for DB2 connections
-            self.dialogs['db2'].controls['host'].SetValue("")
-            self.dialogs['db2'].controls['port'].SetValue("")
-            self.dialogs['db2'].controls['database'].SetValue("")
-            self.dialogs['db2'].controls['user'].SetValue("")
-            self.dialogs['db2'].controls['password'].SetValue("")
-            self.dialogs['db2'].connection_type_choice.SetStringSelection(data_connector)
-            self.dialogs['db2'].Layout()
-            self.dialogs['connection'] = self.dialogs['db2']
-        elif data_server == "MYSQL RDBMS":
-            erp = 'mysql'
-            # Set default dialog information for DB2 connections
-            self.dialogs['mysql'].controls['host'].SetValue("")
-            self.dialogs['mysql'].controls['port'].SetValue("")
-            self.dialogs['mysql'].controls['database'].SetValue("")
-            self.dialogs['mysql'].controls['user'].SetValue("")
-            self.dialogs['mysql'].controls['password'].SetValue("")
-            self.dialogs['mysql'].connection_type_choice.SetStringSelection(data_connector)
-            self.dialogs['mysql'].Layout()
-            self.dialogs['connection'] = self.dialogs['mysql']
-        else:
+        try:
+            erp, defaults = _ERP_DEFAULTS[data_server]
+        except KeyError:
             self.busy_info = None
             msg = (
                 'DataServer value must be one of: "SAP Application Server", '
@@ -5573,6 +5182,23 @@ class PyExtract(wx.Frame):
             wx.MessageBox(msg, 'Error', style=wx.ICON_ERROR)
             return
 
+        # Reset the connection dialog to defaults, laying it out only once
+        dialog = self.dialogs[erp]
+        dialog.Freeze()
+        try:
+            dialog.initialize_panels()
+            dialog.forget_loaded_connection()
+            for field, value in defaults:
+                if isinstance(value, int):
+                    dialog.controls[field].SetSelection(value)
+                else:
+                    dialog.controls[field].SetValue(value)
+            dialog.connection_type_choice.SetStringSelection(data_connector)
+        finally:
+            dialog.Thaw()
+        dialog.Layout()
+        self.dialogs['connection'] = dialog
+
         # Try to load submodules for this connection, return if failure
         try:
             self.load_submodules(erp)
@@ -5645,14 +5271,16 @@ class PyExtract(wx.Frame):
         """Return dict of keyword arguments used to run an extraction."""
         # Use the ECF RequestId as a subfolder for output
         ecf_path = self.configs["ecf_file_path"]
-        parsed_ecf_data = pyextract.get_ecf_meta_data(ecf_path)
+        if self.ecf_meta_data and self.ecf_meta_path == ecf_path:
+            parsed_ecf_data = self.ecf_meta_data  # Parsed by ParseECFThread
+        else:
+            parsed_ecf_data = pyextract.get_ecf_meta_data(ecf_path)
         ecfjson = parsed_ecf_data[0].ecfjson
         request_id = parsed_ecf_data[0].request_id
         package_name = _package_name(extract_id)
         output_folder = os.path.join(self.configs["working_directory"],
                                      request_id)
-        if not os.path.exists(output_folder):
-            os.makedirs(output_folder)
+        os.makedirs(output_folder, exist_ok=True)
         log_fp = os.path.join(output_folder, package_name.lower().replace('package', 'extract').replace(".zip", ".log"))
         pyextract.utils.setup_file_logger(log_fp)
         # output_folder = os.path.join(self.configs["working_directory"],
@@ -5692,6 +5320,7 @@ class PyExtract(wx.Frame):
             "max_readers": int(self.configs["max_readers"]),
             "row_limit": 0,
             "ecf_file": self.configs["ecf_file_path"],
+            "ecf_meta": parsed_ecf_data,
             "callback_error": alert_error,
             "stopevent": self.stopevent,
             "chunk_results": "db_per_table",
@@ -5772,12 +5401,20 @@ class PyExtract(wx.Frame):
 
 def _extract_icon() -> wx.Icon:
     """Return an Icon object of the PyExtract logo."""
-    logo = wx.Image(_resource_path('assets/extract-logo.png'))
     icon = wx.Icon()
-    icon.CopyFromBitmap(logo.ConvertToBitmap())
+    icon.CopyFromBitmap(_resource_bitmap('assets/extract-logo.png'))
     return icon
 
 
+def _resource_bitmap(relative_path: str) -> wx.Bitmap:
+    """Return a bitmap of a bundled image, decoding each file only once."""
+    bitmap = _BITMAP_CACHE.get(relative_path)
+    if bitmap is None:
+        bitmap = wx.Image(_resource_path(relative_path)).ConvertToBitmap()
+        _BITMAP_CACHE[relative_path] = bitmap
+    return bitmap
+
+
 def _resource_path(relative_path: str) -> str:
     """Get absolute path to resource, works for dev and for PyInstaller.
     (from http://stackoverflow.com/a/31966932).
@@ -5860,6 +5497,131 @@ def _package_name(extract_id: str) -> str:
 
 
 
+def _connect_oracle(connection_args: dict) -> ABCMessenger:
+    """Return a Messenger connected to an Oracle database."""
+    return pyextract.connect.oracle.OracleMessenger(**connection_args)
+
+
+def _connect_mssql(connection_args: dict) -> ABCMessenger:
+    """Return a Messenger connected to a validated SQL Server schema."""
+    messenger = pyextract.connect.mssql.MSSQLMessenger(**connection_args)
+    messenger.validate_schema()
+    return messenger
+
+
+def _connect_db2(connection_args: dict) -> ABCMessenger:
+    """Return a Messenger connected to a DB2 database."""
+    return pyextract.connect.db2.DB2Messenger(**connection_args)
+
+
+def _connect_mysql(connection_args: dict) -> ABCMessenger:
+    """Return a Messenger connected to a MySQL database."""
+    return pyextract.connect.mysql.MySQLMessenger(**connection_args)
+
+
+# Keyed on the data server names used by GetConnectionThread
+_RDBMS_CONNECTORS = {
+    "Oracle RDBMS": _connect_oracle,
+    "MSSQL RDBMS": _connect_mssql,
+    "DB2 RDBMS": _connect_db2,
+    "MYSQL RDBMS": _connect_mysql,
+}
+
+
+def _build_sap_stream(thread: 'ExtractThread', output: ABCMessenger):
+    """Return a SAPStream reading from an extraction thread's source."""
+    return pyextract.streams.sapstream.SAPStream(
+        messenger=thread.source,
+        batch_size=thread.sap_batch_size,
+        chunk_size=thread.chunk_size,
+        queue_size=thread.queue_size,
+        max_readers=thread.max_readers,
+        row_limit=thread.row_limit,
+        stopevent=thread.stopevent,
+        chunk_results=thread.chunk_results,
+        output=output,
+    )
+
+
+def _build_default_stream(thread: 'ExtractThread', output: ABCMessenger):
+    """Return an ODBC or plain data stream based on the thread's ECF."""
+    ecf_ed = thread.ecf_meta
+    if ecf_ed is None:
+        ecf_ed = pyextract.ecfreader.get_ecf_meta_data(thread.ecf_file)
+    if not ecf_ed:
+        return None
+    if isinstance(ecf_ed[0].query_text, dict):
+        return pyextract.ODBCStream(
+            messenger=thread.source,
+            batch_size=thread.sap_batch_size,
+            chunk_size=thread.chunk_size,
+            queue_size=thread.queue_size,
+            max_readers=thread.max_readers,
+            row_limit=thread.row_limit,
+            stopevent=thread.stopevent,
+            chunk_results=thread.chunk_results,
+            output=output,
+        )
+    return pyextract.DataStream(
+        messenger=thread.source,
+        chunk_size=thread.chunk_size,
+        queue_size=thread.queue_size,
+        row_limit=thread.row_limit,
+        stopevent=thread.stopevent,
+    )
+
+
+# Keyed on Messenger class name; the SAP submodule is imported lazily
+_STREAM_FACTORY = {
+    'SAPMessenger': _build_sap_stream,
+}
+
+
+def _format_started_on(value: str) -> str:
+    """Return a saved ISO datetime as a human readable 'Started On' value."""
+    # Fixed-width 'YYYY-MM-DDTHH:MM:SS[.ffffff]' value; slicing avoids strptime
+    dtval = datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                     int(value[11:13]), int(value[14:16]), int(value[17:19]))
+    return dtval.strftime('%Y-%m-%d @ %I:%M%p').lower()
+
+
+def _stat_exists(path: str) -> bool:
+    """Return True if a path exists, using a single stat call."""
+    try:
+        os.stat(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _post_result(parent: wx.Window, event_cls: type, **payload):
+    """Post a worker thread's result to a window as a new event."""
+    if not parent:
+        return  # Window was destroyed while the job was still running
+    wx.PostEvent(parent, event_cls(**payload))
+
+
+def _log_job_error(future: Future):
+    """Log an exception that escaped a job on the GUI worker pool."""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        LOGGER.error('Background job failed: %s', ''.join(
+            traceback.format_exception(type(error), error,
+                                       error.__traceback__)))
+
+
+def _is_empty_dir(path: str) -> bool:
+    """Return True if `path` is an existing directory with no entries."""
+    try:
+        entries = os.scandir(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    # scandir iterators only became context managers in Python 3.6
+    return next(entries, None) is None
+
+
 def _run_extraction(stream: pyextract.DataStream,
                     output: ABCMessenger,
                     output_folder: str,
@@ -6046,7 +5808,8 @@ def valid_user_config_value(field: str, value: str) -> bool:
         'queue_size': (5, 50),
         'max_readers': (1, 32),
         'sap_batch_size': (1, 1000),
-        'rename_wait': (1, 10)
+        'rename_wait': (1, 10),
+        'lfu_chunk_size': (1, 64)
     }
 
     # Only validate the three numeric fields
@@ -6076,7 +5839,8 @@ def _set_wx_control_value(ctrl: wx.Control, value: str):
             or isinstance(ctrl, wx.FilePickerCtrl)):
         ctrl.SetPath(value)
     elif isinstance(ctrl, wx.TextCtrl):
-        ctrl.SetValue(value)
+        # ChangeValue does not emit EVT_TEXT the way SetValue does
+        ctrl.ChangeValue(value)
     else:
         raise TypeError('Unknown wx.Control type "%s"', type(ctrl))
 
@@ -6231,6 +5995,56 @@ def update_logging(log_level: str):
         LOGGER.setLevel(logging.INFO)
 
 
+def _build_upload_kwargs(configs: Dict[str, str], ecf_data: dict,
+                         upload_method: str) -> dict:
+    """Return kwargs for an UploadPackageThread, less 'parent' and package.
+
+    Raise an UploadConfigError if the upload method or the ECF territory
+    is not supported.
+    """
+    if upload_method == "DIF":
+        raise UploadConfigError(
+            'Upload failed\n\n'
+            'DIF upload method is not supported at this time.'
+        )
+
+    if upload_method not in ['MFT_LFU', 'LFU']:
+        raise UploadConfigError((
+            'Upload failed\n\n'
+            'Unknown upload method in ECF:  {method}. Please '
+            'contact the PyExtract support team for help.'
+            ).format(method=upload_method))
+
+    # Collect kwargs needed to run the upload in another thread
+    kwargs = {
+        'upload_method': upload_method,
+        'sftp_port': configs['sftp_port'],
+        'rename_wait': configs['rename_wait'],
+        'lfu_chunk_size': configs['lfu_chunk_size']
+    }
+
+    # Determine location for upload. Use the Production server
+    # based on 'Territory' value from the ECF if a production
+    # build, or use user-selected Config value if QA build.
+    if config.ALLOW_USER_UPLOAD_LOCATION:
+        kwargs['sftp_location'] = configs['sftp_location']
+        kwargs['lfu_location'] = configs['lfu_location']
+    else:
+        territory = ecf_data["Territory"]
+        if territory.upper() not in ('WEST', 'CENTRAL'):
+            raise UploadConfigError((
+                'Upload failed\n\n'
+                'Invalid Territory value in ECF ("{territory}"). '
+                'Only the "West" and "Central" territories are '
+                'supported for production use.'
+                ).format(territory=territory))
+        location = 'PROD-' + territory.upper()
+        kwargs['sftp_location'] = location
+        kwargs['lfu_location'] = location
+
+    return kwargs
+
+
 def alert_upload_success(filename: str, host: str, method: str):
     """Display alert to user that upload of the data package succeeded."""
     message = (
@@ -6275,45 +6089,12 @@ def next_extract_workflow_dialog(return_code: int, current_page: str) -> str:
     """
     assert return_code in (None, -1, 0, 1, 2, 3, 9, 99, 5101)
 
-    # 'Cancel' or 'Finish' return codes
-    # (None and 5101 are the top-right 'X' button codes)
-    if return_code in (None, 0, 2, 5101):
-        return None
-    # 'Home' return code
-    elif return_code == 99:
-        return 'ecf'
-    # 'Continue ABAP Workflow' return code
-    elif return_code == 9:
-        return 'abap'
-    # 'Continue Extraction' return code
-    elif return_code == 3:
-        return 'continue_extract'
-    # 'Next' return code
-    elif return_code == 1:
-        next_page_mapping = {
-            'ecf': 'connection',
-            'connection': 'content_preview',
-            'abap': 'extraction',
-            'content_preview': 'extraction',
-        }
-        try:
-            return next_page_mapping[current_page]
-        except KeyError:
-            raise ValueError('return_code not paired with valid page')
-
-    # 'Previous' return code
-    elif return_code == -1:
-        previous_page_mapping = {
-            'connection': 'ecf',
-            'content_preview': 'connection',
-            'extraction': 'content_preview',
-            'abap': 'continue_extract'
-        }
-        try:
-            return previous_page_mapping[current_page]
-        except KeyError:
-            if current_page != 'continue_extract':
-                raise ValueError('return_code not paired with valid page')
+    if return_code in _WORKFLOW_JUMPS:
+        return _WORKFLOW_JUMPS[return_code]
+    try:
+        return _WORKFLOW_STEPS[(return_code, current_page)]
+    except KeyError:
+        raise ValueError('return_code not paired with valid page')
 
 
 def alert_error(message: str):
@@ -6337,3 +6118,4 @@ if __name__ == '__main__':
     check_disk_space()
     PyExtract()
     APP.MainLoop()
+    _GUI_EXECUTOR.shutdown(wait=False)
@@ -11,6 +11,12 @@ from .base import ABCMessenger
 
 from ..ecfreader import read_encrypted_json
 
+NO_FIL_FILES_MESSAGE = (
+    'No .FIL files found in the specified folder. '
+    'Either the ECF returned 0 records or the .FIL '
+    'files are missing in the specified folder'
+)
+
 
 class ABAPMessenger(ABCMessenger):
     """Messenger to handle a folder of *.fil files as input."""
@@ -283,13 +289,7 @@ class ABAPMessenger(ABCMessenger):
         )
 
         # Validations related to .fil files
-        fileformat = self.folder + '\\' + '*' + '.fil'
-        fil_files = glob.glob(fileformat)
-        assert fil_files, (
-            'No .FIL files found in the specified folder. '
-            'Either the ECF returned 0 records or the .FIL '
-            'files are missing in the specified folder'
-        )
+        assert has_fil_files(self.folder), NO_FIL_FILES_MESSAGE
 
         # Get the list of tables from the ACL project file
         for table in self.list_all_tables():
@@ -355,6 +355,12 @@ class ABAPMessenger(ABCMessenger):
         del self.arg_queue
 
 
+def has_fil_files(folder: str) -> bool:
+    """Return True if a folder contains at least one *.fil file."""
+    fileformat = folder + '\\' + '*' + '.fil'
+    return next(glob.iglob(fileformat), None) is not None
+
+
 class ABAPInputGenerate(object):
     """Reads ECF file provided by the user and generates
        a parameter file which is later used by ABAP"""
@@ -77,6 +77,14 @@ CEODBC_TO_MSSQL_DTYPES = {
 # 'UploadMethod' and 'Territory' values in the ECF
 ALLOW_USER_UPLOAD_LOCATION = False
 
+# Default size (in bytes) of each chunk POSTed to the LFU service; each chunk
+# costs a round trip, so small chunks cap throughput on high-latency links
+LFU_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Most chunk data (in bytes) an LFU upload may hold in memory at once; limits
+# how many chunks are uploaded in parallel when the chunk size is large
+LFU_UPLOAD_MEMORY_BUDGET = 64 * 1024 * 1024
+
 # User-facing names for LFU upload locations to their connection details
 LFU_UPLOAD_LOCATIONS = {
     "DEV-EAST": {
@@ -272,10 +272,21 @@ def convert_16_to_20(unencrypted_v16_ecf: JSONDict) -> JSONDict:
     return unencrypted_v16_ecf
 
 
-def get_ecf_meta_data(filepath: str, encrypted=True) -> List[ExtractData]:
-    """Function to read and collect meta data from an ECF"""
-    status = {}
-    ecfjson = read_encrypted_json(filepath, encrypted=encrypted, status=status)
+def get_ecf_meta_data(filepath: str, encrypted=True, ecfjson: JSONDict = None,
+                      status: dict = None) -> List[ExtractData]:
+    """Function to read and collect meta data from an ECF
+
+    If `ecfjson` is given it is used instead of reading and decrypting the
+    file again, and the `status` filled by read_encrypted_json for it must
+    be given too. It may be modified, so pass a copy if the original is
+    still needed.
+    """
+    if ecfjson is None:
+        status = {}
+        ecfjson = read_encrypted_json(filepath, encrypted=encrypted, status=status)
+    elif not status or 'is_plaintext' not in status:
+        raise ValueError('The status filled by read_encrypted_json must be '
+                         'given with ecfjson.')
     if (status.get('is_encrypted', False)):
         validate_ecfjson(ecfjson)
         validate_license(ecfjson)
@@ -1,21 +1,24 @@
 """Module to support packaging of final deliverables before sending to PwC."""
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import hashlib
 import json
 import math
 import os
 import queue
+import threading
 import time
 import sys
 from tempfile import NamedTemporaryFile
-from threading import Thread
 from typing import Dict
 from zipfile import ZipFile
 
 import multiprocessing
 import chilkat
 import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
 from requests_toolbelt import MultipartEncoder
 
 from . import config
@@ -26,6 +29,11 @@ from pyextract.version import EXTRACT_VERSION
 LOGGER = multiprocessing.get_logger()
 LOGGER.setLevel(logging.INFO)
 
+# Connection pool shared by every LFU upload in this process
+_LFU_POOL_SIZE = 16
+_LFU_SESSION = None  # type: requests.Session
+_LFU_SESSION_LOCK = threading.Lock()
+
 
 class DataPackage(object):
     """A zipped folder with all data / metadata from a completed extract."""
@@ -300,19 +308,24 @@ class LFUClient(object):
     UPLOAD_PATH_TEST = "/api/upload/test"
     UPLOAD_PATH_CANCEL = "/api/upload/cancel"
 
-    def __init__(self, host: str, token: str):
+    def __init__(self, host: str, token: str,
+                 session: requests.Session = None):
         """Create a new client to interact with the LFU REST API.
 
         ARGS:
             host: Fully-qualified domain of the REST API.
             token: API token to authorize use of the API.
+            session: Session to send chunks with. Defaults to the pooled
+                session shared by all LFU uploads in this process.
         """
         self._host = host
         self._token = token
         self._file = None
+        self._session = session or lfu_session()
         self.errors = queue.Queue()
 
-    def send(self, filepath: str, chunk_size: int, test=False):
+    def send(self, filepath: str, chunk_size: int, test=False,
+             parallel_chunks: int = 8):
         """Function transmits the given file to the LFU host using HTTPS in
         chunk sizes also provided. The read/upload process is performed
         concurrently using different threads. The LFU service at the other
@@ -320,6 +333,9 @@ class LFUClient(object):
 
         ARGS:
             test: If True, upload files to test dir instead of production.
+            parallel_chunks: Maximum number of chunks uploaded at once. It
+                is lowered so the chunks held in memory at once stay within
+                config.LFU_UPLOAD_MEMORY_BUDGET.
         """
         assert os.path.exists(filepath), \
             "Local filepath does not exist:  {}".format(filepath)
@@ -331,29 +347,20 @@ class LFUClient(object):
         LOGGER.info("Total Chunks: %i", self._file.totalchunks)
         LOGGER.info("Starting extraction...")
 
-        # Start final chunk first. The final chunk includes the hash code
-        # for the file within the 'filechecksum' header in the HTTP Request
-        # and generating the hash code for the entire file will take longer
-        # than any individual chunk.
-        kwargs = {
-            'errors': self.errors,
-            'index': self._file.totalchunks,
-            'test': test,
-        }
-        thread = Thread(target=self._read_task, kwargs=kwargs)
-        thread.start()
-        thread.join()
-
-        # Use threads to perform read/upload for all other chunks (all but the last).
-        for index in range(1, self._file.totalchunks):
-            kwargs = {
-                'errors': self.errors,
-                'index': index,
-                'test': test,
-            }
-            thread = Thread(target=self._read_task, kwargs=kwargs)
-            thread.start()
-            thread.join()
+        # Send final chunk first. The final chunk includes the hash code
+        # for the file within the 'filechecksum' header in the HTTP
+        # Request and generating the hash code for the entire file will
+        # take longer than any individual chunk.
+        self._read_task(self.errors, self._file.totalchunks, test)
+
+        # Read/upload all other chunks concurrently so the connection
+        # stays busy instead of waiting one round trip per chunk. Each
+        # worker holds a whole chunk in memory, so cap them by the budget.
+        workers = max(1, min(parallel_chunks,
+                             config.LFU_UPLOAD_MEMORY_BUDGET // chunk_size))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for index in range(1, self._file.totalchunks):
+                executor.submit(self._read_task, self.errors, index, test)
 
         # Check if there were any errors during upload
         try:
@@ -398,7 +405,7 @@ class LFUClient(object):
 
         # Create and send upload HTTP Request
         LOGGER.info('writing chunk %d', index)
-        response = requests.post(
+        response = self._session.post(
             url=url,
             data=encoder,
             verify=False,
@@ -414,6 +421,23 @@ class LFUClient(object):
             ).format(index, response.status_code)
 
 
+def lfu_session() -> requests.Session:
+    """Return the pooled HTTPS session shared by all LFU uploads."""
+    global _LFU_SESSION  # pylint: disable=global-statement
+    with _LFU_SESSION_LOCK:
+        if _LFU_SESSION is None:
+            # Chunk bodies are streamed, so only retry failed connects
+            retries = Retry(total=3, connect=3, read=0, backoff_factor=0.5)
+            adapter = HTTPAdapter(pool_connections=_LFU_POOL_SIZE,
+                                  pool_maxsize=_LFU_POOL_SIZE,
+                                  max_retries=retries)
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _LFU_SESSION = session
+        return _LFU_SESSION
+
+
 def sqlite_checksum(filepath: str) -> str:
     """Return a checksum for a SQLite file at a given filepath."""
 
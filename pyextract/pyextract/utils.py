@@ -146,6 +146,13 @@ class NetworkDisconnectError(Exception):
         self.text = text
 
 
+class UploadConfigError(Exception):
+    """Error raised when an upload cannot be configured from ECF / configs."""
+    def __init__(self, text: str, *args, **kwargs):
+        super().__init__(text, *args, **kwargs)
+        self.text = text
+
+
 def parse_query_from_filepath(filepath: str) -> str:
     """Return a query string with standardized whitespace from a filepath."""
     with open(filepath, 'r') as script:
@@ -0,0 +1,44 @@
+"""Tests for the common module."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from zipfile import ZipFile
+
+import common
+
+
+class TestUnzipPackage(unittest.TestCase):
+    """Can restore files from a zipped data package."""
+
+    def setUp(self):
+        """Create a temporary directory with a small data package."""
+        self.test_dir = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.test_dir, 'output')
+        self.package = os.path.join(self.test_dir, 'package.zip')
+        with ZipFile(self.package, 'w') as package:
+            for name in ('data.dat', 'extract.log', 'request.ecf'):
+                package.writestr(name, name)
+
+    def tearDown(self):
+        """Remove the directory after the test"""
+        shutil.rmtree(self.test_dir)
+
+    def test_unzip_all(self):
+        """Every file is unzipped when no filetype is given."""
+        common.unzip_package(self.package, self.output_dir)
+        self.assertEqual(sorted(os.listdir(self.output_dir)),
+                         ['data.dat', 'extract.log', 'request.ecf'])
+
+    def test_unzip_one_filetype(self):
+        """Only files of a single filetype are unzipped."""
+        common.unzip_package(self.package, self.output_dir, filetype='.ecf')
+        self.assertEqual(os.listdir(self.output_dir), ['request.ecf'])
+
+    def test_unzip_many_filetypes(self):
+        """Files matching any of several filetypes are unzipped."""
+        common.unzip_package(self.package, self.output_dir,
+                             filetype=('.dat', '.log'))
+        self.assertEqual(sorted(os.listdir(self.output_dir)),
+                         ['data.dat', 'extract.log'])
@@ -114,3 +114,24 @@ class TestParseInvalidECFs(unittest.TestCase):
         filepath = 'tests/assets/Oracle-v1.6-R12-duplicate-table-aliases.ecf'
         with self.assertRaises(AssertionError):
             ecfreader.get_ecf_meta_data(filepath=filepath, encrypted=True)
+
+
+class TestParsePreviouslyReadECF(unittest.TestCase):
+    """Can parse ECF data that was already read with read_encrypted_json."""
+
+    filepath = 'tests/assets/Oracle-v1.6-R12-gl-headers.ecf'
+
+    def test_status_required(self):
+        """Error raised when ECF data is given without its read status."""
+        with self.assertRaises(ValueError):
+            ecfreader.get_ecf_meta_data(filepath=self.filepath, ecfjson={})
+        with self.assertRaises(ValueError):
+            ecfreader.get_ecf_meta_data(filepath=self.filepath, ecfjson={},
+                                        status={})
+
+    def test_encrypted_ecf_validated(self):
+        """ECF data read from an encrypted file is still validated."""
+        status = {'is_plaintext': False, 'is_encrypted': True}
+        with self.assertRaises(AssertionError):
+            ecfreader.get_ecf_meta_data(filepath=self.filepath, ecfjson={},
+                                        status=status)
@@ -4,6 +4,8 @@ import json
 import os
 import shutil
 import tempfile
+import threading
+import types
 import unittest
 import uuid
 from zipfile import ZipFile
@@ -184,6 +186,58 @@ class TestLFUClient(unittest.TestCase):
             self.client.send(filepath=TEST_ZIP_ARCHIVE, chunk_size=1000)
 
 
+class StubSession(object):
+    """Stand-in for requests.Session that records the chunks POSTed to it."""
+
+    def __init__(self, failed_chunk: int = None):
+        """Fail the upload of `failed_chunk`, if given."""
+        self.failed_chunk = failed_chunk
+        self.chunks = []
+        self._lock = threading.Lock()
+
+    def post(self, url, data, **kwargs):
+        """Record the chunk number and return a fake response."""
+        index = int(data.fields['chunknumber'])
+        with self._lock:
+            self.chunks.append(index)
+        status_code = 500 if index == self.failed_chunk else 200
+        return types.SimpleNamespace(status_code=status_code)
+
+
+class TestLFUClientConcurrentUpload(unittest.TestCase):
+    """Chunks are uploaded concurrently, without a network connection."""
+
+    def setUp(self):
+        """Create a small file to upload in 4 chunks."""
+        self.test_dir = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.test_dir, 'package.zip')
+        with open(self.filepath, 'wb') as stream:
+            stream.write(b'0123456789')
+
+    def tearDown(self):
+        """Remove the directory after the test"""
+        shutil.rmtree(self.test_dir)
+
+    def test_upload_all_chunks(self):
+        """Every chunk is uploaded once, starting with the last chunk."""
+        session = StubSession()
+        client = LFUClient(host='https://lfu.invalid', token='token',
+                           session=session)
+        client.send(filepath=self.filepath, chunk_size=3, parallel_chunks=2)
+        self.assertEqual(session.chunks[0], 4)
+        self.assertEqual(sorted(session.chunks), [1, 2, 3, 4])
+
+    def test_failed_chunk_raises(self):
+        """An error from a concurrent chunk upload is raised by send()."""
+        session = StubSession(failed_chunk=2)
+        client = LFUClient(host='https://lfu.invalid', token='token',
+                           session=session)
+        with self.assertRaises(AssertionError):
+            client.send(filepath=self.filepath, chunk_size=3,
+                        parallel_chunks=2)
+        self.assertEqual(sorted(session.chunks), [1, 2, 3, 4])
+
+
 def disable_local_network():
     """Monkey patch socket to block network connections"""
     import socket